@@ -0,0 +1,91 @@
+# src/browser/manager.py
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+from playwright.async_api import BrowserContext, Page, Error as PlaywrightError
+
+from src.core.config import Config
+from src.core.log_manager import LogManager
+
+
+class PagePool:
+    """
+    Pages of one browser context, reused across fetches.
+
+    At most size pages exist at once; acquire() waits for a free page when all are
+    taken. Pages are created lazily and kept open when released, so concurrent
+    fetches pay for new_page() once instead of on every navigation.
+    """
+
+    def __init__(self, context: BrowserContext, size: Optional[int] = None, config: Optional[Config] = None):
+        """
+        Args:
+            context: Browser context the pages belong to
+            size: Maximum number of pages, defaults to fetcher.page_pool_size
+            config: Optional Config instance
+        """
+        self.context = context
+        self.size: int = size or (config or Config()).get("fetcher.page_pool_size", 4)
+        self.logger = LogManager().get_logger(self.__class__.__name__)
+
+        self._pages: List[Page] = []
+        self._idle: List[Page] = []
+        self._slots = asyncio.Semaphore(self.size)
+
+    @property
+    def in_use(self) -> int:
+        return len(self._pages) - len(self._idle)
+
+    async def acquire(self) -> Page:
+        """Take a page from the pool, opening one if none is idle."""
+        await self._slots.acquire()
+        while self._idle:
+            page = self._idle.pop()
+            if not page.is_closed():
+                return page
+            self._pages.remove(page)
+        try:
+            page = await self.context.new_page()
+        except BaseException:
+            self._slots.release()
+            raise
+        self._pages.append(page)
+        return page
+
+    def release(self, page: Page) -> None:
+        """Return a page to the pool; closed pages are dropped."""
+        if page.is_closed():
+            if page in self._pages:
+                self._pages.remove(page)
+        else:
+            self._idle.append(page)
+        self._slots.release()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Borrow a page for the duration of a block."""
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            self.release(page)
+
+    async def close(self) -> None:
+        """Close every page the pool opened."""
+        for page in self._pages:
+            try:
+                await page.close()
+            except PlaywrightError as e:
+                self.logger.warning(f"Error while closing pooled page: {e}")
+        self._pages.clear()
+        self._idle.clear()
+
+    async def __aenter__(self) -> PagePool:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        await self.close()
+        return False
@@ -0,0 +1,495 @@
+# src/browser/session_store.py
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.core.config import Config
+from src.core.constants import SESSIONS_DIR, STORAGE_STATE_FILENAME, DAY_MS, HOUR_MS, MS_PER_SECOND
+from src.core.exceptions import SessionException
+from src.core.log_manager import LogManager
+from src.utils.storage import write_json_atomic, read_json
+
+DEFAULT_ACCOUNT = "default"
+INDEX_FILENAME = "index.json"
+LOGIN_LOCK_FILENAME = ".login.lock"
+DELTA_SUFFIX = ".delta"
+
+SessionKey = Tuple[str, str]
+
+
+def _cookie_key(cookie: Dict[str, Any]) -> Tuple[str, str, str]:
+    return cookie.get("name"), cookie.get("domain"), cookie.get("path")
+
+
+def _origin_storage(state: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    return {
+        origin["origin"]: {item["name"]: item["value"] for item in origin.get("localStorage", [])}
+        for origin in state.get("origins", [])
+    }
+
+
+def diff_storage_state(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, List]:
+    """
+    Compute the changes turning one storage state into another
+    Args:
+        old: Last persisted storage state
+        new: Current storage state
+    Returns:
+        Delta with changed/removed cookies and localStorage items, empty if nothing changed
+    """
+    delta: Dict[str, List] = {}
+
+    old_cookies = {_cookie_key(c): c for c in old.get("cookies", [])}
+    new_cookies = {_cookie_key(c): c for c in new.get("cookies", [])}
+    changed = [c for key, c in new_cookies.items() if old_cookies.get(key) != c]
+    removed = [list(key) for key in old_cookies if key not in new_cookies]
+    if changed:
+        delta["set_cookies"] = changed
+    if removed:
+        delta["del_cookies"] = removed
+
+    old_storage = _origin_storage(old)
+    new_storage = _origin_storage(new)
+    set_items = [
+        [origin, name, value]
+        for origin, items in new_storage.items()
+        for name, value in items.items()
+        if old_storage.get(origin, {}).get(name) != value
+    ]
+    del_items = [
+        [origin, name]
+        for origin, items in old_storage.items()
+        for name in items
+        if name not in new_storage.get(origin, {})
+    ]
+    if set_items:
+        delta["set_storage"] = set_items
+    if del_items:
+        delta["del_storage"] = del_items
+    return delta
+
+
+def apply_storage_delta(state: Dict[str, Any], delta: Dict[str, List]) -> Dict[str, Any]:
+    """Return a new storage state with a delta from diff_storage_state applied"""
+    cookies = {_cookie_key(c): c for c in state.get("cookies", [])}
+    for key in delta.get("del_cookies", []):
+        cookies.pop(tuple(key), None)
+    for cookie in delta.get("set_cookies", []):
+        cookies[_cookie_key(cookie)] = cookie
+
+    storage = _origin_storage(state)
+    for origin, name in delta.get("del_storage", []):
+        storage.get(origin, {}).pop(name, None)
+    for origin, name, value in delta.get("set_storage", []):
+        storage.setdefault(origin, {})[name] = value
+
+    return {
+        **state,
+        "cookies": list(cookies.values()),
+        "origins": [
+            {"origin": origin, "localStorage": [{"name": n, "value": v} for n, v in items.items()]}
+            for origin, items in storage.items()
+        ]
+    }
+
+
+class SessionStore:
+    """
+    Persistent store for Playwright storage states under SESSIONS_DIR.
+
+    Parsed states are kept in an in-memory LRU so repeated loads never touch disk,
+    and a small expiry index records when every session was saved and when it
+    expires, so callers can tell whether a refresh is due without loading the state
+    or navigating anywhere.
+
+    Each session is a base file written through a temp file and rename, plus an
+    append-only delta log of changed cookies and localStorage items. Saving an
+    unchanged state writes nothing; the log is folded back into the base every
+    authentication.session_compact_after saves.
+    """
+
+    def __init__(
+            self,
+            base_dir: Optional[Path] = None,
+            capacity: Optional[int] = None,
+            config: Optional[Config] = None
+    ):
+        self.config = config or Config()
+        self.base_dir: Path = Path(base_dir or SESSIONS_DIR)
+        self.capacity: int = capacity or self.config.get("authentication.session_cache_size", 32)
+        self.compact_after: int = self.config.get("authentication.session_compact_after", 50)
+        self.logger = LogManager().get_logger(self.__class__.__name__)
+
+        self._cache: OrderedDict[SessionKey, Dict[str, Any]] = OrderedDict()
+        self._delta_counts: Dict[SessionKey, int] = {}
+        self._lock = threading.RLock()
+        self._index: Dict[str, Dict[str, float]] = read_json(self.index_path, {})
+
+    @property
+    def index_path(self) -> Path:
+        return self.base_dir / INDEX_FILENAME
+
+    @staticmethod
+    def _index_key(platform: str, account: str) -> str:
+        return f"{platform}/{account}"
+
+    def path_for(self, platform: str, account: str = DEFAULT_ACCOUNT) -> Path:
+        """Return the storage state file of a platform account"""
+        storage_path = self.config.get(f"platforms.{platform}.session.storage_path", platform)
+        return self.base_dir / storage_path / account / STORAGE_STATE_FILENAME
+
+    @staticmethod
+    def _delta_path(path: Path) -> Path:
+        return path.with_name(path.name + DELTA_SUFFIX)
+
+    def max_age_seconds(self, platform: str) -> float:
+        """
+        Session lifetime for a platform, the stricter of the global
+        session validity and the platform's own max age
+        """
+        days = self.config.get("authentication.session_validity_days", 7)
+        platform_days = self.config.get(f"platforms.{platform}.session.max_age_days")
+        if platform_days:
+            days = min(days, platform_days)
+        return days * DAY_MS / MS_PER_SECOND
+
+    def _cache_put(self, key: SessionKey, state: Dict[str, Any]) -> None:
+        self._cache[key] = state
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+
+    def _read_persisted(self, key: SessionKey) -> Optional[Dict[str, Any]]:
+        """Rebuild a state from its base file and delta log"""
+        path = self.path_for(*key)
+        try:
+            state = read_json(path)
+        except ValueError as e:
+            raise SessionException(f"Corrupt session file for {key[0]}/{key[1]}") from e
+        if state is None:
+            return None
+
+        count = 0
+        torn = False
+        try:
+            with open(self._delta_path(path), "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        delta = json.loads(line)
+                    except ValueError:
+                        # A torn final append from a crashed writer
+                        torn = True
+                        break
+                    state = apply_storage_delta(state, delta)
+                    count += 1
+        except FileNotFoundError:
+            pass
+        self._delta_counts[key] = count
+        if torn:
+            # Later appends would land after the torn bytes and never be replayed
+            self.logger.warning(f"Torn delta log for {key[0]}/{key[1]}, compacting")
+            self._write_base(key, state)
+        return state
+
+    def _write_base(self, key: SessionKey, state: Dict[str, Any]) -> None:
+        path = self.path_for(*key)
+        write_json_atomic(path, state)
+        self._delta_path(path).unlink(missing_ok=True)
+        self._delta_counts[key] = 0
+
+    def _append_delta(self, key: SessionKey, delta: Dict[str, List]) -> None:
+        with open(self._delta_path(self.path_for(*key)), "a", encoding="utf-8") as f:
+            f.write(json.dumps(delta, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+        self._delta_counts[key] = self._delta_counts.get(key, 0) + 1
+
+    def save(self, platform: str, state: Dict[str, Any], account: str = DEFAULT_ACCOUNT) -> float:
+        """
+        Persist a storage state, writing only what changed since the last save
+        Args:
+            platform: Platform name
+            state: Playwright storage state
+            account: Account the session belongs to
+        Returns:
+            Expiry time as a Unix timestamp
+        Raises:
+            SessionException: If the state could not be written
+        """
+        key = (platform, account)
+        with self._lock:
+            try:
+                previous = self._cache.get(key)
+                if previous is None:
+                    previous = self._read_persisted(key)
+
+                if previous is None:
+                    self._write_base(key, state)
+                else:
+                    delta = diff_storage_state(previous, state)
+                    expires_at = self.expires_at(platform, account)
+                    if not delta and expires_at is not None and expires_at > time.time():
+                        self._cache_put(key, state)
+                        return expires_at
+                    if self._delta_counts.get(key, 0) + 1 >= self.compact_after:
+                        self._write_base(key, state)
+                    elif delta:
+                        self._append_delta(key, delta)
+
+                now = time.time()
+                expires_at = now + self.max_age_seconds(platform)
+                # Only this session's entry changes; entries other processes renewed survive
+                self._index = read_json(self.index_path, {})
+                self._index[self._index_key(platform, account)] = {"saved_at": now, "expires_at": expires_at}
+                write_json_atomic(self.index_path, self._index)
+            except OSError as e:
+                raise SessionException(
+                    f"Failed saving session for {platform}/{account}",
+                    {"path": str(self.path_for(platform, account))}
+                ) from e
+            self._cache_put(key, state)
+        self.logger.debug(f"Session saved for {platform}/{account}")
+        return expires_at
+
+    def compact(self, platform: str, account: str = DEFAULT_ACCOUNT) -> None:
+        """Fold a session's delta log back into its base file"""
+        key = (platform, account)
+        with self._lock:
+            state = self._cache.get(key) or self._read_persisted(key)
+            if state is not None and self._delta_counts.get(key):
+                self._write_base(key, state)
+
+    def load(self, platform: str, account: str = DEFAULT_ACCOUNT) -> Optional[Dict[str, Any]]:
+        """
+        Return a valid storage state, or None if it is missing or expired.
+        The returned state is shared with the cache and must not be mutated.
+        """
+        key = (platform, account)
+        with self._lock:
+            if not self.is_valid(platform, account):
+                self._cache.pop(key, None)
+                return None
+
+            state = self._cache.get(key)
+            if state is not None:
+                self._cache.move_to_end(key)
+                return state
+
+            state = self._read_persisted(key)
+            if state is None:
+                return None
+            self._cache_put(key, state)
+            return state
+
+    def expires_at(self, platform: str, account: str = DEFAULT_ACCOUNT) -> Optional[float]:
+        """Expiry time of a stored session as a Unix timestamp, None if there is none"""
+        entry = self._index.get(self._index_key(platform, account))
+        return entry["expires_at"] if entry else None
+
+    def is_valid(self, platform: str, account: str = DEFAULT_ACCOUNT, now: Optional[float] = None) -> bool:
+        """Check whether a stored session exists and has not expired"""
+        expires_at = self.expires_at(platform, account)
+        return expires_at is not None and (now or time.time()) < expires_at
+
+    def needs_refresh(self, platform: str, account: str = DEFAULT_ACCOUNT, now: Optional[float] = None) -> bool:
+        """
+        Check whether a session should be renewed: it is missing, expired,
+        or expires within authentication.refresh_margin_hours
+        """
+        expires_at = self.expires_at(platform, account)
+        if expires_at is None:
+            return True
+        margin = self.config.get("authentication.refresh_margin_hours", 12) * HOUR_MS / MS_PER_SECOND
+        return (now or time.time()) >= expires_at - margin
+
+    def reload(self) -> None:
+        """
+        Re-read the expiry index from disk to pick up sessions saved by other
+        processes, dropping cached states that were replaced in the meantime
+        """
+        with self._lock:
+            index = read_json(self.index_path, {})
+            for platform, account in list(self._cache):
+                key = self._index_key(platform, account)
+                if index.get(key) != self._index.get(key):
+                    del self._cache[(platform, account)]
+            self._index = index
+
+    def invalidate(
+            self,
+            platform: str,
+            account: str = DEFAULT_ACCOUNT,
+            state: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Forget a session so the next load forces a fresh login
+        Args:
+            platform: Platform name
+            account: Account the session belongs to
+            state: If given, only invalidate while this state is still the persisted
+                one, so a worker holding a stale state cannot discard a session
+                renewed since, in this process or another one
+        """
+        key = (platform, account)
+        index_key = self._index_key(platform, account)
+        with self._lock:
+            index = read_json(self.index_path, {})
+            if state is not None:
+                if index.get(index_key) != self._index.get(index_key):
+                    # Renewed or removed by another process since this one last saw it
+                    return
+                current = self._cache.get(key)
+                if current is None:
+                    current = self._read_persisted(key)
+                if current is not None and current is not state and diff_storage_state(current, state):
+                    return
+            self._cache.pop(key, None)
+            self._index = index
+            if self._index.pop(index_key, None) is not None:
+                write_json_atomic(self.index_path, self._index)
+            path = self.path_for(platform, account)
+            path.unlink(missing_ok=True)
+            self._delta_path(path).unlink(missing_ok=True)
+            self._delta_counts.pop((platform, account), None)
+
+
+class SessionLeases:
+    """
+    Shares one login per account across concurrent workers.
+
+    A worker leases a session instead of logging in itself. The first worker to
+    find no valid session performs the login while every other worker, in this
+    process or another one, waits and then reuses the resulting storage state.
+    Concurrent leases per account are bounded by session.max_concurrency.
+    """
+
+    def __init__(
+            self,
+            store: Optional[SessionStore] = None,
+            poll_interval: float = 0.5,
+            config: Optional[Config] = None
+    ):
+        self.store = store or get_session_store()
+        self.config = config or self.store.config
+        self.poll_interval = poll_interval
+        self.logger = LogManager().get_logger(self.__class__.__name__)
+
+        self._semaphores: Dict[SessionKey, asyncio.Semaphore] = {}
+        self._logins: Dict[SessionKey, asyncio.Future] = {}
+
+    def max_concurrency(self, platform: str) -> int:
+        return self.config.get(f"platforms.{platform}.session.max_concurrency", 1)
+
+    def _lock_timeout(self, platform: str) -> float:
+        # A login holding the lock for longer than two login timeouts is presumed dead
+        return 2 * self.config.get(f"platforms.{platform}.timeouts.login_ms", 30000) / MS_PER_SECOND
+
+    def _semaphore(self, key: SessionKey) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency(key[0]))
+            self._semaphores[key] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def lease(
+            self,
+            platform: str,
+            login: Callable[[], Awaitable[Dict[str, Any]]],
+            account: str = DEFAULT_ACCOUNT,
+            validate: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Lease a valid storage state for an account, logging in at most once
+        Args:
+            platform: Platform name
+            login: Coroutine function performing the login and returning the new storage state
+            account: Account to lease
+            validate: Optional extra check on a stored state, e.g. BaseAuth.check_session
+        Yields:
+            Storage state to create the worker's browser context from
+        """
+        key = (platform, account)
+        async with self._semaphore(key):
+            yield await self._acquire(key, login, validate)
+
+    def _usable(self, key: SessionKey, validate) -> Optional[Dict[str, Any]]:
+        state = self.store.load(*key)
+        if state is not None and (validate is None or validate(state)):
+            return state
+        return None
+
+    async def _acquire(self, key: SessionKey, login, validate) -> Dict[str, Any]:
+        state = self._usable(key, validate)
+        if state is not None:
+            return state
+
+        pending = self._logins.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._login_once(key, login, validate))
+            self._logins[key] = pending
+            pending.add_done_callback(lambda _: self._logins.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _login_once(self, key: SessionKey, login, validate) -> Dict[str, Any]:
+        """Log in under a cross-process lock unless another process beats us to it"""
+        platform, account = key
+        lock_path = self.store.path_for(platform, account).parent / LOGIN_LOCK_FILENAME
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_timeout = self._lock_timeout(platform)
+
+        while not self._try_lock(lock_path, lock_timeout):
+            await asyncio.sleep(self.poll_interval)
+            self.store.reload()
+            state = self._usable(key, validate)
+            if state is not None:
+                self.logger.debug(f"Reusing session for {platform}/{account} renewed by another worker")
+                return state
+
+        try:
+            self.store.reload()
+            state = self._usable(key, validate)
+            if state is None:
+                self.logger.info(f"Logging in {platform}/{account} on behalf of all workers")
+                state = await login()
+                self.store.save(platform, state, account)
+            return state
+        finally:
+            lock_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _try_lock(lock_path: Path, lock_timeout: float) -> bool:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > lock_timeout:
+                    lock_path.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+            return False
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        return True
+
+    def release_invalid(self, platform: str, state: Dict[str, Any], account: str = DEFAULT_ACCOUNT) -> None:
+        """Report a leased state the platform rejected so the next lease logs in again"""
+        self.store.invalidate(platform, account, state=state)
+
+
+_default_store: Optional[SessionStore] = None
+
+
+def get_session_store() -> SessionStore:
+    """Return the process-wide session store shared by all fetchers"""
+    global _default_store
+    if _default_store is None:
+        _default_store = SessionStore()
+    return _default_store
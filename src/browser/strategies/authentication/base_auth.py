@@ -0,0 +1,202 @@
+"""
+Base authentication strategy module for handling website login.
+"""
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, List
+from urllib.parse import urlparse
+
+from playwright.async_api import Page, Error as PlaywrightError
+
+from src.browser.session_store import SessionStore, get_session_store, DEFAULT_ACCOUNT
+from src.core.config import Config
+from src.core.exceptions import FetcherException
+from src.core.log_manager import LogManager
+from src.utils.retry import RetryPolicy, Deadline, retry_async
+
+
+class BaseAuth(ABC):
+    """
+    Base authentication strategy class for handling login to various platforms.
+
+    This class defines the interface for authentication strategies and provides
+    common functionality for login operations, including a navigation-free check
+    of the stored session so most runs can skip the login and verification pages.
+    """
+
+    def __init__(
+            self,
+            config: Optional[Dict[str, Any]] = None,
+            session_store: Optional[SessionStore] = None
+    ):
+        """
+        Initialize the authentication strategy.
+
+        Args:
+            config: Optional configuration dictionary
+            session_store: Optional session store, defaults to the shared store
+        """
+        self.config = config or {}
+        self.app_config = Config()
+        self.log_manager = LogManager()
+        self.logger = self.log_manager.get_logger(self.__class__.__name__)
+        self.page: Optional[Page] = None
+        self.is_authenticated = False
+
+        self.platform: str = self.config.get("platform") or self.app_config.get("fetcher.default_platform")
+        self.account: str = self.config.get("account", DEFAULT_ACCOUNT)
+        self.session_store = session_store or get_session_store()
+
+        session_config = self.app_config.get(f"platforms.{self.platform}.session", {})
+        self.required_cookies: List[str] = self.config.get(
+            "required_cookies", session_config.get("required_cookies", []))
+        self.probe_url: Optional[str] = self.config.get("probe_url", session_config.get("probe_url"))
+        self.login_url: Optional[str] = self.app_config.get(f"platforms.{self.platform}.login_url")
+        self.probe_timeout: int = self.app_config.get(
+            f"platforms.{self.platform}.timeouts.action_ms", 10000)
+        self.retry_policy = RetryPolicy.from_config(
+            self.app_config.get("fetcher.retry"), retry_on=(PlaywrightError,))
+
+    def initialize(self, page: Page) -> None:
+        """
+        Set the Playwright page object for this authentication strategy.
+
+        Args:
+            page: Playwright Page object
+
+        Raises:
+            ValueError: If page is None
+        """
+        if page is None:
+            raise ValueError("Page cannot be None")
+
+        self.page = page
+        self.logger.info(f"Initialized {self.__class__.__name__} with Playwright page")
+
+    @abstractmethod
+    async def authenticate(self, deadline: Optional[Deadline] = None) -> bool:
+        """
+        Authenticate the user on the platform.
+
+        Args:
+            deadline: Optional deadline of the fetch; waits use its remaining time
+                as their timeout
+
+        Returns:
+            bool: True if authentication was successful, False otherwise
+
+        Raises:
+            AuthenticationException: If authentication fails
+        """
+        raise NotImplementedError("Authentication strategy must implement authenticate()")
+
+    def _cookie_domain(self) -> str:
+        base_url = self.app_config.get(f"platforms.{self.platform}.base_url", "")
+        host = urlparse(base_url).hostname or ""
+        return host[4:] if host.startswith("www.") else host
+
+    def check_session(self, state: Optional[Dict[str, Any]] = None, now: Optional[float] = None) -> bool:
+        """
+        Check a storage state without touching the network: the session must be
+        stored and unexpired, and every required auth cookie for the platform
+        domain must be present and unexpired.
+
+        Args:
+            state: Storage state to check, defaults to the stored session
+            now: Reference time as a Unix timestamp
+
+        Returns:
+            bool: True if the session looks logged in
+        """
+        if state is None:
+            state = self.session_store.load(self.platform, self.account)
+        if not state:
+            return False
+
+        now = now or time.time()
+        domain = self._cookie_domain()
+        live = set()
+        for cookie in state.get("cookies", []):
+            cookie_domain = cookie.get("domain", "").lstrip(".")
+            if domain and cookie_domain != domain and not cookie_domain.endswith("." + domain):
+                continue
+            expires = cookie.get("expires", -1)
+            # Playwright stores session cookies with expires == -1
+            if expires == -1 or expires > now:
+                live.add(cookie.get("name"))
+
+        missing = [name for name in self.required_cookies if name not in live]
+        if missing:
+            self.logger.debug(f"Stored session for {self.platform} lacks live cookies: {missing}")
+            return False
+        return True
+
+    async def probe_session(self, deadline: Optional[Deadline] = None) -> bool:
+        """
+        Confirm the session with a single lightweight request through the page's
+        context, without rendering anything. A redirect to the login page or a
+        non-2xx status means the session is no longer valid. Transient network
+        errors are retried with backoff.
+
+        Args:
+            deadline: Optional deadline bounding the probe and its retries
+
+        Returns:
+            bool: True if the probe succeeded or no probe URL is configured
+        """
+        if not self.probe_url:
+            return True
+        if self.page is None:
+            self.logger.error("Page not initialized, cannot probe session")
+            return False
+
+        async def _probe():
+            timeout = self.probe_timeout if deadline is None else deadline.timeout_ms(self.probe_timeout)
+            return await self.page.context.request.get(self.probe_url, max_redirects=0, timeout=timeout)
+
+        try:
+            response = await retry_async(_probe, policy=self.retry_policy, deadline=deadline, logger=self.logger)
+        except FetcherException as e:
+            self.log_manager.log_exception(self.logger, e, f"Session probe failed for {self.platform}")
+            return False
+
+        location = response.headers.get("location", "")
+        if self.login_url and location.startswith(self.login_url):
+            return False
+        return response.ok
+
+    async def has_valid_session(self, deadline: Optional[Deadline] = None) -> bool:
+        """
+        Fast-path session validity: the offline cookie check, followed by the
+        optional probe request with the stored cookies. Neither loads a page.
+        """
+        state = self.session_store.load(self.platform, self.account)
+        if not self.check_session(state):
+            return False
+        if self.probe_url and self.page is not None:
+            await self.page.context.add_cookies(state["cookies"])
+        return await self.probe_session(deadline)
+
+    async def is_login_required(self, deadline: Optional[Deadline] = None) -> bool:
+        """
+        Check if login is required.
+
+        Args:
+            deadline: Optional deadline bounding the session probe
+
+        Returns:
+            bool: True if login is required, False if already logged in
+        """
+        if self.is_authenticated:
+            return False
+        return not await self.has_valid_session(deadline)
+
+    def verify_login(self) -> bool:
+        """
+        Verify if the login was successful.
+
+        Returns:
+            bool: True if successfully logged in, False otherwise
+        """
+        # Basic implementation, subclasses should override with specific logic
+        return self.is_authenticated
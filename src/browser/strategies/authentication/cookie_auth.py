@@ -0,0 +1,43 @@
+from typing import Optional
+
+from src.core.exceptions import AuthenticationException
+from src.utils.retry import Deadline
+
+from .base_auth import BaseAuth
+
+
+class CookieAuth(BaseAuth):
+    """Authentication strategy that restores stored session cookies instead of logging in."""
+
+    async def authenticate(self, deadline: Optional[Deadline] = None) -> bool:
+        """
+        Restore the stored session into the page's context.
+        The stored state is checked offline (and probed if configured)
+        before any cookie is applied, so no login or verification page is loaded.
+
+        Args:
+            deadline: Optional deadline bounding the session probe
+
+        Returns:
+            bool: True if a valid session was restored, False if a login is required
+
+        Raises:
+            AuthenticationException: If the page is not initialized
+        """
+        if self.page is None:
+            raise AuthenticationException("Page not initialized, cannot restore session")
+
+        state = self.session_store.load(self.platform, self.account)
+        if not self.check_session(state):
+            self.logger.info(f"No usable stored session for {self.platform}/{self.account}")
+            return False
+
+        await self.page.context.add_cookies(state["cookies"])
+        if not await self.probe_session(deadline):
+            self.logger.info(f"Stored session for {self.platform}/{self.account} was rejected")
+            self.session_store.invalidate(self.platform, self.account, state=state)
+            return False
+
+        self.is_authenticated = True
+        self.logger.info(f"Restored session for {self.platform}/{self.account}")
+        return True
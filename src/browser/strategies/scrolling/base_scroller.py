@@ -0,0 +1,282 @@
+"""
+Base scrolling strategy module for handling page navigation.
+"""
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, Callable, Awaitable, List
+
+from playwright.async_api import Page, ElementHandle, Error as PlaywrightError
+
+from src.core.config import Config
+from src.core.constants import MS_PER_SECOND
+from src.core.exceptions import FetcherException
+from src.core.log_manager import LogManager
+from src.utils.retry import RetryPolicy, Deadline, retry_async
+
+# Called with the element handles of items that appeared since the previous step
+ItemsCallback = Callable[[List[ElementHandle]], Awaitable[Any]]
+
+PAGE_METRICS_JS = """
+() => ({
+    height: document.documentElement.scrollHeight,
+    bottom: (window.scrollY || window.pageYOffset) + window.innerHeight
+})
+"""
+
+# Slack in pixels when deciding the viewport has reached the bottom of the page
+BOTTOM_SLACK_PX = 2
+
+
+class BaseScroller(ABC):
+    """
+    Base scrolling strategy class for handling page scrolling on various platforms.
+
+    This class defines the interface for scrolling strategies and provides
+    common functionality for navigation operations.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the scrolling strategy.
+
+        Args:
+            config: Optional configuration dictionary
+        """
+        self.config = config or {}
+        self.log_manager = LogManager()
+        self.logger = self.log_manager.get_logger(self.__class__.__name__)
+        self.page: Optional[Page] = None
+
+        # Scrolling configuration
+        self.scroll_timeout = self.config.get("scroll_timeout", 30000)  # 30 seconds default
+        self.scroll_delay = self.config.get("scroll_delay", 1000)  # 1 second default
+        self.max_scroll_attempts = self.config.get("max_scroll_attempts", 10)
+        self.retry_policy = RetryPolicy.from_config(
+            Config().get("fetcher.retry"), retry_on=(PlaywrightError,))
+
+        # Stall detection
+        self.stall_steps = self.config.get("stall_steps", 3)
+        self.network_idle_ms = self.config.get("network_idle_ms", 2000)
+        self.stop_reason: Optional[str] = None
+        self.stopped = False
+        self._last_items = 0
+        self._last_height = 0
+        self._stalled_steps = 0
+        self._inflight = 0
+
+    def initialize(self, page: Page) -> None:
+        """
+        Set the Playwright page object for this scrolling strategy.
+
+        Args:
+            page: Playwright Page object
+
+        Raises:
+            ValueError: If page is None
+        """
+        if page is None:
+            raise ValueError("Page cannot be None")
+
+        self.page = page
+        self._inflight = 0
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_request_done)
+        page.on("requestfailed", self._on_request_done)
+        self.logger.info(f"Initialized {self.__class__.__name__} with Playwright page")
+
+    def _on_request(self, _request) -> None:
+        self._inflight += 1
+
+    def _on_request_done(self, _request) -> None:
+        self._inflight = max(0, self._inflight - 1)
+
+    @abstractmethod
+    async def scroll(
+            self,
+            target_items: int = 0,
+            max_time: int = 0,
+            deadline: Optional[Deadline] = None,
+            on_items: Optional[ItemsCallback] = None
+    ) -> bool:
+        """
+        Scroll the page to load more content.
+
+        Args:
+            target_items: Target number of items to load (0 for unlimited)
+            max_time: Maximum time in milliseconds to scroll (0 for unlimited)
+            deadline: Optional deadline of the fetch, see scroll_deadline()
+            on_items: Optional callback extracting new items after each step,
+                so items can be pruned from the DOM as the feed grows
+
+        Returns:
+            bool: True if scrolling was successful or reached limits, False if error
+
+        Raises:
+            ScrollingException: If scrolling fails
+        """
+        raise NotImplementedError("Scrolling strategy must implement scroll()")
+
+    @staticmethod
+    def scroll_deadline(max_time: int = 0, deadline: Optional[Deadline] = None) -> Deadline:
+        """
+        The deadline bounding a scroll: the fetch's deadline, cut short by
+        max_time if that ends sooner.
+        """
+        if not max_time:
+            return deadline or Deadline()
+        own = Deadline.after_ms(max_time)
+        if deadline is None or deadline.expires_at is None or own.expires_at < deadline.expires_at:
+            return own
+        return deadline
+
+    async def pause(self, delay_ms: Optional[float] = None, deadline: Optional[Deadline] = None) -> None:
+        """Wait between scroll steps without blocking the event loop."""
+        delay_s = (self.scroll_delay if delay_ms is None else delay_ms) / MS_PER_SECOND
+        if deadline is not None:
+            delay_s = deadline.timeout_s(delay_s)
+        await asyncio.sleep(delay_s)
+
+    async def scroll_to_element(self, selector: str, deadline: Optional[Deadline] = None) -> bool:
+        """
+        Scroll to a specific element on the page.
+
+        Args:
+            selector: CSS selector for the target element
+            deadline: Optional deadline bounding the wait and its retries
+
+        Returns:
+            bool: True if element was found and scrolled to, False otherwise
+        """
+        if self.page is None:
+            self.logger.error("Page not initialized, cannot scroll to element")
+            return False
+
+        async def _scroll():
+            timeout = self.scroll_timeout if deadline is None else deadline.timeout_ms(self.scroll_timeout)
+            element = await self.page.wait_for_selector(selector, timeout=timeout)
+            if element:
+                await element.scroll_into_view_if_needed()
+                return True
+            return False
+
+        try:
+            return await retry_async(
+                _scroll, policy=self.retry_policy, deadline=deadline, logger=self.logger)
+        except FetcherException as e:
+            self.log_manager.log_exception(
+                self.logger, e, f"Error scrolling to element with selector '{selector}'")
+        return False
+
+    def reset_progress(self, items_loaded: int = 0) -> None:
+        """Start stall detection afresh, e.g. at the beginning of a scroll."""
+        self.stop_reason = None
+        self.stopped = False
+        self._last_items = items_loaded
+        self._last_height = 0
+        self._stalled_steps = 0
+
+    def stop(self, reason: str) -> None:
+        """Ask a running scroll to end after the current step, e.g. from an on_items callback."""
+        self.stop_reason = reason
+        self.stopped = True
+
+    async def page_metrics(self) -> Dict[str, int]:
+        """Current scroll height of the document and the bottom edge of the viewport."""
+        return await self.page.evaluate(PAGE_METRICS_JS)
+
+    async def item_count(self) -> Optional[int]:
+        """Number of feed items on the page, None for scrollers that do not count them."""
+        return None
+
+    async def wait_for_network_idle(self, deadline: Optional[Deadline] = None) -> bool:
+        """
+        Wait until the page has no requests in flight, up to network_idle_ms.
+
+        Returns:
+            bool: True if the network went idle in time
+        """
+        timeout_s = self.network_idle_ms / MS_PER_SECOND
+        if deadline is not None:
+            timeout_s = deadline.timeout_s(timeout_s)
+        give_up_at = time.monotonic() + timeout_s
+        while self._inflight > 0:
+            if time.monotonic() >= give_up_at:
+                return False
+            await asyncio.sleep(0.05)
+        return True
+
+    async def check_progress(
+            self,
+            items_loaded: int,
+            target_items: int = 0,
+            deadline: Optional[Deadline] = None
+    ) -> bool:
+        """
+        Decide after a scroll step whether to keep scrolling. Scrolling stops once
+        target_items are loaded, or after stall_steps consecutive steps in which
+        neither the item count nor the scroll height grew. Before a step counts as
+        stalled, in-flight requests get up to network_idle_ms to land, so slow feeds
+        are not abandoned while the next page is still loading; the step is only
+        spared if what landed grew the page, so background traffic (long-polls,
+        analytics) does not keep an ended feed scrolling. The reason is left in
+        stop_reason.
+
+        Args:
+            items_loaded: Items loaded so far
+            target_items: Target number of items (0 for unlimited)
+            deadline: Optional deadline bounding the network idle wait
+
+        Returns:
+            bool: True to keep scrolling
+        """
+        if target_items and items_loaded >= target_items:
+            self.stop_reason = "target reached"
+            return False
+
+        metrics = await self.page_metrics()
+        progressed = items_loaded > self._last_items or metrics["height"] > self._last_height
+        self._last_items = max(self._last_items, items_loaded)
+        self._last_height = max(self._last_height, metrics["height"])
+        if progressed:
+            self._stalled_steps = 0
+            return True
+
+        if self._inflight > 0 and await self.wait_for_network_idle(deadline):
+            # Responses just landed; let the next step see what they rendered, if anything
+            metrics = await self.page_metrics()
+            count = await self.item_count()
+            if metrics["height"] > self._last_height or (count is not None and count > self._last_items):
+                return True
+
+        self._stalled_steps += 1
+        if self._stalled_steps < self.stall_steps:
+            return True
+        at_bottom = metrics["bottom"] >= metrics["height"] - BOTTOM_SLACK_PX
+        self.stop_reason = "end of feed" if at_bottom else "stalled"
+        self.logger.info(f"Stopping after {self._stalled_steps} steps without new content ({self.stop_reason})")
+        return False
+
+    async def get_scroll_position(self) -> Dict[str, int]:
+        """
+        Get the current scroll position of the page.
+
+        Returns:
+            Dict containing scroll X and Y positions
+        """
+        if self.page is None:
+            self.logger.error("Page not initialized, cannot get scroll position")
+            return {"x": 0, "y": 0}
+
+        try:
+            return await self.page.evaluate("""
+                () => {
+                    return {
+                        x: window.scrollX || window.pageXOffset,
+                        y: window.scrollY || window.pageYOffset
+                    }
+                }
+            """)
+        except PlaywrightError as e:
+            self.log_manager.log_exception(self.logger, e, "Error getting scroll position")
+            return {"x": 0, "y": 0}
@@ -0,0 +1,247 @@
+"""
+Infinite scrolling strategy module for feeds that load more items as they are scrolled.
+"""
+import asyncio
+import itertools
+from typing import Dict, Any, Optional
+
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+from src.core.constants import PruneMode
+from src.core.exceptions import ScrollingException, DeadlineExceededException
+from src.utils.retry import Deadline
+
+from .base_scroller import BaseScroller, ItemsCallback
+
+DEFAULT_ITEM_SELECTOR = "[role='article']"
+PROCESSED_ATTR = "data-lemon-processed"
+
+# Counts feed items as the page adds them, so waits can end as soon as new content arrives
+INSTALL_OBSERVER_JS = """
+(selector) => {
+    if (window.__lemonFeed) {
+        return window.__lemonFeed.count;
+    }
+    const state = {count: document.querySelectorAll(selector).length, lastMutation: performance.now()};
+    state.observer = new MutationObserver((mutations) => {
+        state.lastMutation = performance.now();
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType !== Node.ELEMENT_NODE) {
+                    continue;
+                }
+                if (node.matches(selector)) {
+                    state.count += 1;
+                }
+                state.count += node.querySelectorAll(selector).length;
+            }
+        }
+    });
+    state.observer.observe(document.body, {childList: true, subtree: true});
+    window.__lemonFeed = state;
+    return state.count;
+}
+"""
+
+# Resolves once items were added since the last step, or the DOM has been quiet for quiet_ms
+# since the scroll, so a page still idle from before the scroll gets its full quiet window
+NEW_ITEMS_OR_QUIET_JS = """
+({previous, quietMs, scrollStart}) => {
+    const state = window.__lemonFeed;
+    const quietSince = Math.max(state.lastMutation, scrollStart || 0);
+    return state.count > previous || performance.now() - quietSince >= quietMs;
+}
+"""
+
+# Marks extracted items, or swaps them for same-height placeholders / removes them so the
+# renderer does not keep thousands of feed nodes alive
+RELEASE_ITEMS_JS = """
+({nodes, mode, attr}) => {
+    for (const node of nodes) {
+        if (mode === 'placeholder') {
+            const placeholder = document.createElement('div');
+            placeholder.style.height = node.offsetHeight + 'px';
+            placeholder.setAttribute(attr, '');
+            node.replaceWith(placeholder);
+        } else if (mode === 'detach') {
+            node.remove();
+        } else {
+            node.setAttribute(attr, '');
+        }
+    }
+}
+"""
+
+FEED_COUNT_JS = "() => window.__lemonFeed ? window.__lemonFeed.count : 0"
+
+# Scrolls to the bottom, returning the page clock at the scroll
+SCROLL_TO_BOTTOM_JS = "() => { window.scrollTo(0, document.body.scrollHeight); return performance.now(); }"
+
+
+class InfiniteScroller(BaseScroller):
+    """
+    Scrolling strategy for infinite scrolling pages.
+
+    Instead of sleeping a fixed scroll_delay after each scroll, a MutationObserver
+    injected into the page counts feed items as they are added. Each step waits
+    until new items appear or the DOM stays quiet for quiet_ms, bounded by
+    mutation_timeout_ms, so waits follow the page instead of the worst case.
+
+    With an on_items callback, new items are extracted after every step and
+    marked as processed. Setting prune to placeholder or detach also swaps them
+    for placeholders or removes them from the DOM, so renderer memory and the
+    cost of each step stay flat however long the feed gets; it is off by default
+    because it rewrites nodes owned by the page's own framework.
+    """
+    # Whether max_scroll_attempts bounds a scroll, rather than time alone
+    bounded_by_attempts = True
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the infinite scroller.
+
+        Args:
+            config: Optional configuration dictionary, adding item_selector, quiet_ms,
+                mutation_timeout_ms and prune to the base scrolling settings
+        """
+        super().__init__(config)
+        self.item_selector: str = self.config.get("item_selector", DEFAULT_ITEM_SELECTOR)
+        self.quiet_ms: int = self.config.get("quiet_ms", 500)
+        self.mutation_timeout_ms: int = self.config.get("mutation_timeout_ms", self.scroll_timeout)
+        self.prune = PruneMode(self.config.get("prune", PruneMode.NONE.value))
+        self.items_loaded = 0
+        self.items_processed = 0
+
+    async def install_observer(self) -> int:
+        """
+        Inject the feed observer into the page, once per document.
+
+        Returns:
+            int: Number of feed items present when the observer was installed
+        """
+        return await self.page.evaluate(INSTALL_OBSERVER_JS, self.item_selector)
+
+    async def item_count(self) -> int:
+        """Number of feed items the observer has seen so far."""
+        return await self.page.evaluate(FEED_COUNT_JS)
+
+    async def wait_for_new_items(
+            self,
+            previous: int,
+            deadline: Optional[Deadline] = None,
+            scroll_start: Optional[float] = None
+    ) -> int:
+        """
+        Wait until feed items beyond previous appear or the DOM goes quiet.
+
+        Args:
+            previous: Item count before the last scroll
+            deadline: Optional deadline bounding the wait
+            scroll_start: Page clock (performance.now()) at the last scroll; the
+                quiet window starts no earlier than it
+
+        Returns:
+            int: The item count after the wait
+        """
+        timeout = self.mutation_timeout_ms if deadline is None else deadline.timeout_ms(self.mutation_timeout_ms)
+        try:
+            await self.page.wait_for_function(
+                NEW_ITEMS_OR_QUIET_JS,
+                arg={"previous": previous, "quietMs": self.quiet_ms, "scrollStart": scroll_start},
+                timeout=timeout
+            )
+        except PlaywrightTimeoutError:
+            self.logger.debug(f"No feed activity within {timeout:.0f}ms")
+        return await self.item_count()
+
+    async def process_new_items(self, on_items: ItemsCallback) -> int:
+        """
+        Hand the items not processed yet to on_items, then mark or prune them in
+        the DOM according to the prune mode and release their handles.
+
+        Returns:
+            int: Number of items processed
+        """
+        handles = await self.page.query_selector_all(f"{self.item_selector}:not([{PROCESSED_ATTR}])")
+        if not handles:
+            return 0
+        try:
+            await on_items(handles)
+            await self.page.evaluate(
+                RELEASE_ITEMS_JS, {"nodes": handles, "mode": self.prune.value, "attr": PROCESSED_ATTR})
+        finally:
+            await asyncio.gather(*(handle.dispose() for handle in handles), return_exceptions=True)
+        self.items_processed += len(handles)
+        return len(handles)
+
+    async def scroll_step(self, deadline: Optional[Deadline] = None) -> int:
+        """
+        Scroll to the bottom once and wait for the page to react.
+
+        Returns:
+            int: Number of items added by this step
+        """
+        previous = await self.item_count()
+        scroll_start = await self.page.evaluate(SCROLL_TO_BOTTOM_JS)
+        self.items_loaded = await self.wait_for_new_items(previous, deadline, scroll_start)
+        return self.items_loaded - previous
+
+    async def scroll(
+            self,
+            target_items: int = 0,
+            max_time: int = 0,
+            deadline: Optional[Deadline] = None,
+            on_items: Optional[ItemsCallback] = None
+    ) -> bool:
+        """
+        Scroll the feed until target_items are loaded, the feed ends or stalls
+        (see check_progress), max_scroll_attempts steps are taken or the deadline
+        passes.
+
+        Args:
+            target_items: Target number of items to load (0 for unlimited)
+            max_time: Maximum time in milliseconds to scroll (0 for unlimited)
+            deadline: Optional deadline of the fetch
+            on_items: Optional callback extracting new items after each step
+
+        Returns:
+            bool: True if scrolling finished or reached its limits
+
+        Raises:
+            ScrollingException: If the page is missing or the browser fails
+        """
+        if self.page is None:
+            raise ScrollingException("Page not initialized, cannot scroll")
+
+        deadline = self.scroll_deadline(max_time, deadline)
+        try:
+            self.items_loaded = await self.install_observer()
+            self.reset_progress(self.items_loaded)
+            if on_items is not None:
+                await self.process_new_items(on_items)
+            for step in itertools.count(1):
+                if self.stopped:
+                    break
+                if self.bounded_by_attempts and step > self.max_scroll_attempts:
+                    self.stop_reason = "max attempts"
+                    break
+                if target_items and self.items_loaded >= target_items:
+                    self.stop_reason = "target reached"
+                    break
+                if deadline.expired:
+                    self.stop_reason = "deadline"
+                    break
+                added = await self.scroll_step(deadline)
+                if on_items is not None:
+                    await self.process_new_items(on_items)
+                self.logger.debug(f"Scroll step {step}: {added} new items, {self.items_loaded} total")
+                if not await self.check_progress(self.items_loaded, target_items, deadline):
+                    break
+        except DeadlineExceededException:
+            self.stop_reason = "deadline"
+        except PlaywrightError as e:
+            self.log_manager.log_exception(self.logger, e, "Error while scrolling the feed")
+            raise ScrollingException(f"Infinite scrolling failed: {e}") from e
+
+        self.logger.info(f"Loaded {self.items_loaded} items, stopped: {self.stop_reason}")
+        return True
@@ -0,0 +1,214 @@
+"""
+Pagination strategy module for listings split over numbered or offset pages.
+"""
+import asyncio
+from collections import deque
+from typing import Dict, Any, Optional, Deque, List, Tuple
+from urllib.parse import urljoin
+
+from playwright.async_api import Page, ElementHandle, Error as PlaywrightError
+
+from src.browser.manager import PagePool
+from src.core.config import Config
+from src.core.exceptions import ScrollingException, DeadlineExceededException
+from src.utils.rate_limiter import RateLimiter, get_rate_limiter
+from src.utils.retry import Deadline
+
+from .base_scroller import BaseScroller, ItemsCallback
+
+DEFAULT_ITEM_SELECTOR = "[role='article']"
+
+LoadedPage = Tuple[Page, List[ElementHandle]]
+
+
+class PaginationScroller(BaseScroller):
+    """
+    Scrolling strategy for paginated content.
+
+    When page URLs can be predicted from url_template, which may use {page} and
+    {offset} placeholders, the next pages are loaded concurrently on pooled pages,
+    up to concurrency at a time and through the platform's rate limiter. Items are
+    still handed over page by page in order. Listings whose next page is only
+    known from the current one (cursors) are followed through next_selector; with
+    a pool, the next page is speculatively loaded on a pooled page while the
+    current one is being extracted, so navigation and extraction overlap.
+    """
+
+    def __init__(
+            self,
+            config: Optional[Dict[str, Any]] = None,
+            pool: Optional[PagePool] = None,
+            rate_limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Initialize the pagination scroller.
+
+        Args:
+            config: Optional configuration dictionary, adding url_template, start_page,
+                page_size, max_pages, concurrency, item_selector, next_selector and
+                prefetch to the base scrolling settings
+            pool: Page pool for concurrent loads, required with url_template and
+                used for prefetching with next_selector
+            rate_limiter: Optional rate limiter, defaults to the platform's shared limiter
+        """
+        super().__init__(config)
+        platform = self.config.get("platform") or Config().get("fetcher.default_platform")
+        self.pool = pool
+        self.rate_limiter = rate_limiter or get_rate_limiter(platform)
+
+        self.url_template: Optional[str] = self.config.get("url_template")
+        self.start_page: int = self.config.get("start_page", 1)
+        self.page_size: int = self.config.get("page_size", 20)
+        self.max_pages: int = self.config.get("max_pages", self.max_scroll_attempts)
+        self.concurrency: int = self.config.get("concurrency", pool.size if pool else 1)
+        self.item_selector: str = self.config.get("item_selector", DEFAULT_ITEM_SELECTOR)
+        self.next_selector: Optional[str] = self.config.get("next_selector")
+        self.prefetch: bool = self.config.get("prefetch", True) and pool is not None
+        self.items_loaded = 0
+        self.pages_loaded = 0
+
+    def page_url(self, index: int) -> str:
+        """URL of the index-th page, counting from zero."""
+        return self.url_template.format(page=self.start_page + index, offset=index * self.page_size)
+
+    async def _navigate(self, page: Page, url: str, deadline: Deadline) -> List[ElementHandle]:
+        await self.rate_limiter.acquire()
+        await page.goto(url, timeout=deadline.timeout_ms(self.scroll_timeout))
+        return await page.query_selector_all(self.item_selector)
+
+    async def _load(self, url: str, deadline: Deadline) -> LoadedPage:
+        page = await self.pool.acquire()
+        try:
+            return page, await self._navigate(page, url, deadline)
+        except BaseException:
+            self.pool.release(page)
+            raise
+
+    async def _hand_over(self, handles: List[ElementHandle], on_items: Optional[ItemsCallback]) -> None:
+        try:
+            if on_items is not None and handles:
+                await on_items(handles)
+        finally:
+            await asyncio.gather(*(handle.dispose() for handle in handles), return_exceptions=True)
+        self.items_loaded += len(handles)
+        self.pages_loaded += 1
+
+    def _should_stop(self, found: int, target_items: int, deadline: Deadline) -> bool:
+        if self.stopped:
+            return True
+        if found == 0:
+            self.stop_reason = "end of feed"
+        elif target_items and self.items_loaded >= target_items:
+            self.stop_reason = "target reached"
+        elif deadline.expired:
+            self.stop_reason = "deadline"
+        return self.stop_reason is not None
+
+    async def _drain(self, pending: Deque[asyncio.Task]) -> None:
+        """Cancel loads that are no longer needed and return their pages to the pool."""
+        for task in pending:
+            task.cancel()
+        for result in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(result, tuple):
+                page, handles = result
+                await asyncio.gather(*(handle.dispose() for handle in handles), return_exceptions=True)
+                self.pool.release(page)
+        pending.clear()
+
+    async def _scroll_concurrently(self, target_items: int, deadline: Deadline, on_items: Optional[ItemsCallback]):
+        pending: Deque[asyncio.Task] = deque()
+        index = 0
+        try:
+            while True:
+                while len(pending) < self.concurrency and index < self.max_pages:
+                    pending.append(asyncio.create_task(self._load(self.page_url(index), deadline)))
+                    index += 1
+                if not pending:
+                    self.stop_reason = "max pages"
+                    return
+                page, handles = await pending.popleft()
+                try:
+                    await self._hand_over(handles, on_items)
+                finally:
+                    self.pool.release(page)
+                if self._should_stop(len(handles), target_items, deadline):
+                    return
+        finally:
+            await self._drain(pending)
+
+    async def _next_href(self, page: Page) -> Optional[str]:
+        link = await page.query_selector(self.next_selector) if self.next_selector else None
+        href = await link.get_attribute("href") if link else None
+        return urljoin(page.url, href) if href else None
+
+    async def _follow_links(self, target_items: int, deadline: Deadline, on_items: Optional[ItemsCallback]):
+        page, handles = self.page, await self.page.query_selector_all(self.item_selector)
+        pending: Deque[asyncio.Task] = deque()
+        try:
+            while True:
+                href = await self._next_href(page) if self.pages_loaded + 1 < self.max_pages else None
+                if href and self.prefetch:
+                    # Load the next page on a pooled page while this one is extracted
+                    pending.append(asyncio.create_task(self._load(href, deadline)))
+                try:
+                    await self._hand_over(handles, on_items)
+                finally:
+                    if page is not self.page:
+                        self.pool.release(page)
+                if self._should_stop(len(handles), target_items, deadline):
+                    return
+                if not href:
+                    self.stop_reason = "end of feed" if self.pages_loaded < self.max_pages else "max pages"
+                    return
+                if pending:
+                    page, handles = await pending.popleft()
+                else:
+                    page, handles = self.page, await self._navigate(self.page, href, deadline)
+        finally:
+            await self._drain(pending)
+
+    async def scroll(
+            self,
+            target_items: int = 0,
+            max_time: int = 0,
+            deadline: Optional[Deadline] = None,
+            on_items: Optional[ItemsCallback] = None
+    ) -> bool:
+        """
+        Load pages until one comes back empty, target_items are loaded, max_pages
+        are loaded or the deadline passes.
+
+        Args:
+            target_items: Target number of items to load (0 for unlimited)
+            max_time: Maximum time in milliseconds to paginate (0 for unlimited)
+            deadline: Optional deadline of the fetch
+            on_items: Optional callback extracting each page's items, in page order
+
+        Returns:
+            bool: True if pagination finished or reached its limits
+
+        Raises:
+            ScrollingException: If no page source is configured or the browser fails
+        """
+        deadline = self.scroll_deadline(max_time, deadline)
+        self.reset_progress()
+        self.items_loaded = 0
+        self.pages_loaded = 0
+        try:
+            if self.url_template is not None:
+                if self.pool is None:
+                    raise ScrollingException("Concurrent pagination requires a page pool")
+                await self._scroll_concurrently(target_items, deadline, on_items)
+            elif self.page is not None:
+                await self._follow_links(target_items, deadline, on_items)
+            else:
+                raise ScrollingException("Page not initialized and no url_template configured")
+        except DeadlineExceededException:
+            self.stop_reason = "deadline"
+        except PlaywrightError as e:
+            self.log_manager.log_exception(self.logger, e, "Error while paginating")
+            raise ScrollingException(f"Pagination failed: {e}") from e
+
+        self.logger.info(f"Loaded {self.items_loaded} items from {self.pages_loaded} pages, "
+                         f"stopped: {self.stop_reason}")
+        return True
@@ -0,0 +1,160 @@
+"""
+Timed scrolling strategy module for feeds scrolled within a time budget.
+"""
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterable
+
+from src.core.constants import CACHE_DIR, MS_PER_SECOND
+from src.utils.retry import Deadline
+from src.utils.storage import read_json, write_json_atomic
+
+from .base_scroller import ItemsCallback
+from .infinite_scroller import InfiniteScroller
+
+YIELD_STATS_FILENAME = "scroll_yield.json"
+
+# Assumed yield, in items per second, while no source has been measured
+DEFAULT_RATE = 1.0
+
+
+class YieldStats:
+    """
+    Items per second each source produced in past runs, kept as an exponential
+    moving average in the run metadata and used to share a job's scroll time
+    between sources by expected yield.
+    """
+
+    def __init__(self, path: Optional[Path] = None, smoothing: float = 0.3):
+        """
+        Args:
+            path: JSON file holding the stats, defaults to CACHE_DIR/scroll_yield.json
+            smoothing: Weight of the latest run in the moving average
+        """
+        self.path = Path(path or CACHE_DIR / YIELD_STATS_FILENAME)
+        self.smoothing = smoothing
+        self._stats: Dict[str, Dict[str, Any]] = read_json(self.path, {})
+        self._lock = threading.Lock()
+
+    def rate(self, source: str) -> Optional[float]:
+        """Expected items per second for a source, None if it was never measured."""
+        entry = self._stats.get(source)
+        return None if entry is None else entry["rate"]
+
+    def record(self, source: str, items: int, seconds: float) -> float:
+        """
+        Fold a run's yield into the source's average and persist the stats.
+
+        Returns:
+            float: The source's updated rate
+        """
+        if seconds <= 0:
+            return self.rate(source) or 0.0
+        observed = items / seconds
+        with self._lock:
+            entry = self._stats.get(source)
+            if entry is None:
+                entry = {"rate": observed, "runs": 0}
+            else:
+                entry["rate"] += self.smoothing * (observed - entry["rate"])
+            entry["runs"] += 1
+            entry["updated_at"] = time.time()
+            self._stats[source] = entry
+            write_json_atomic(self.path, self._stats)
+        return entry["rate"]
+
+    def allocate(self, sources: Iterable[str], budget_ms: float, min_ms: float = 0) -> Dict[str, float]:
+        """
+        Split a job's scroll budget between sources in proportion to their expected
+        yield. Every source gets at least min_ms while the budget allows, and
+        sources never measured are assumed to yield the average of the known ones,
+        so they get a fair first run.
+
+        Args:
+            sources: Source keys to share the budget between
+            budget_ms: Total scroll time of the job in milliseconds
+            min_ms: Floor per source in milliseconds
+
+        Returns:
+            Dict mapping each source to its scroll time in milliseconds
+        """
+        sources = list(dict.fromkeys(sources))
+        if not sources:
+            return {}
+        known = [rate for rate in (self.rate(source) for source in sources) if rate is not None]
+        prior = sum(known) / len(known) if known else DEFAULT_RATE
+        rates = {source: self.rate(source) if self.rate(source) is not None else prior for source in sources}
+
+        floor = min(min_ms, budget_ms / len(sources))
+        remaining = budget_ms - floor * len(sources)
+        total_rate = sum(rates.values())
+        if total_rate <= 0:
+            return {source: floor + remaining / len(sources) for source in sources}
+        return {source: floor + remaining * rate / total_rate for source, rate in rates.items()}
+
+
+class TimedScroller(InfiniteScroller):
+    """
+    Scrolling strategy with a time budget per source.
+
+    The scroller keeps stepping through the feed, as InfiniteScroller does, until its
+    time is up rather than for a fixed number of attempts, and stops early once the
+    feed ends or stalls. Each run's items per second are recorded in YieldStats,
+    and the run's figures are kept in run_stats for the job's metadata.
+    """
+    bounded_by_attempts = False
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, stats: Optional[YieldStats] = None):
+        """
+        Initialize the timed scroller.
+
+        Args:
+            config: Optional configuration dictionary, adding source and max_time
+                to the infinite scrolling settings
+            stats: Optional yield statistics, defaults to the shared stats file
+        """
+        super().__init__(config)
+        self.source: str = self.config.get("source", "default")
+        self.max_time: int = self.config.get("max_time", self.scroll_timeout)
+        self.stats = stats or YieldStats()
+        self.run_stats: Dict[str, Any] = {}
+
+    async def scroll(
+            self,
+            target_items: int = 0,
+            max_time: int = 0,
+            deadline: Optional[Deadline] = None,
+            on_items: Optional[ItemsCallback] = None
+    ) -> bool:
+        """
+        Scroll the feed for max_time milliseconds, or the configured max_time,
+        bounded by the deadline of the fetch.
+
+        Args:
+            target_items: Target number of items to load (0 for unlimited)
+            max_time: Time in milliseconds to scroll, e.g. from YieldStats.allocate()
+            deadline: Optional deadline of the fetch
+            on_items: Optional callback extracting new items after each step
+
+        Returns:
+            bool: True if scrolling finished or reached its limits
+        """
+        budget_ms = max_time or self.max_time
+        start = time.monotonic()
+        result = await super().scroll(target_items, budget_ms, deadline, on_items)
+        elapsed = time.monotonic() - start
+
+        rate = self.stats.record(self.source, self.items_loaded, elapsed)
+        self.run_stats = {
+            "source": self.source,
+            "items": self.items_loaded,
+            "seconds": round(elapsed, 3),
+            "budget_ms": budget_ms,
+            "items_per_second": round(self.items_loaded / elapsed, 3) if elapsed > 0 else 0.0,
+            "expected_rate": round(rate, 3),
+            "stop_reason": self.stop_reason,
+        }
+        self.logger.info(f"Scrolled {self.source} for {elapsed:.1f}s of {budget_ms / MS_PER_SECOND:.0f}s, "
+                         f"{self.items_loaded} items")
+        return result
@@ -34,22 +34,59 @@ DEFAULT_CONFIG = {
         "cache": "cache",
         "raw_data": "raw",
         "processed_data": "processed",
-        "proxies": "proxies"
+        "proxies": "proxies",
+        "write_behind": {
+            "max_pending": 10000,
+            "batch_size": 500
+        },
+        "high_water_marks": {
+            "seen_streak": 3,
+            "recent_ids": 50
+        },
+        "checkpoint_interval_ms": 5000
+    },
+    "validation": {
+        "mode": ValidationMode.FULL.value,
+        "sample_rate": 0.05,
+        "strict_window_ms": 30 * MINUTE_MS
+    },
+    "dedupe": {
+        "num_perm": 128,
+        "bands": 16,
+        "shingle_size": 3,
+        "threshold": 0.8,
+        "action": DuplicateAction.MARK.value,
+        "batch_size": 1000
     },
     "fetcher": {
         "default_platform": "facebook",
         "timeout_ms": 60000,
+        "fetch_deadline_ms": 180000,
+        "page_pool_size": 4,
         "stealth_mode": True,
         "screenshot_on_error": True,
         "retry": {
             "attempts": 3,
-            "delay_ms": 5000
+            "delay_ms": 5000,
+            "max_delay_ms": 60000,
+            "multiplier": 2,
+            "budget": 20
+        },
+        "circuit_breaker": {
+            "failure_rate": 0.5,
+            "window_size": 20,
+            "min_calls": 10,
+            "open_ms": 60000,
+            "probe_calls": 1
         }
     },
     "authentication": {
         "method": AuthMethod.CREDENTIAL.value,
         "session_validity_days": 7,
-        "auto_renew_session": True
+        "auto_renew_session": True,
+        "refresh_margin_hours": 12,
+        "session_cache_size": 32,
+        "session_compact_after": 50
     },
     "stealth": {
         "user_agent_rotation": True,
@@ -87,12 +124,16 @@ DEFAULT_CONFIG = {
             },
             "session": {
                 "storage_path": "facebook",
-                "max_age_days": 7
+                "max_age_days": 7,
+                "required_cookies": ["c_user", "xs"],
+                "probe_url": None,
+                "max_concurrency": 4
             },
             "rate_limits": {
                 "requests_per_hour": 100,
                 "delay_between_requests_ms": 1000
-            }
+            },
+            "fetch_modes": {}
         }
     }
 }
@@ -16,6 +16,7 @@ CACHE_DIR = DATA_DIR / "caches"
 RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
 PROXIES_DIR = DATA_DIR / "proxies"
+STATE_DIR = DATA_DIR / "state"
 
 
 class BrowserType(Enum):
@@ -34,6 +35,39 @@ class FetchStatus(Enum):
     RETRY = "retry"
 
 
+class FetchMode(Enum):
+    """How a query type is fetched"""
+    BROWSER = "browser"
+    HTTP = "http"
+
+
+class CircuitState(Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class PruneMode(Enum):
+    """What happens to feed items in the DOM once they are extracted"""
+    NONE = "none"
+    PLACEHOLDER = "placeholder"
+    DETACH = "detach"
+
+
+class ValidationMode(Enum):
+    """How much of each batch of extracted records is validated"""
+    FULL = "full"
+    SAMPLE = "sample"
+    LAZY = "lazy"
+
+
+class DuplicateAction(Enum):
+    """What the dedupe stage does with near-duplicate records"""
+    MARK = "mark"
+    DROP = "drop"
+
+
 class AuthMethod(Enum):
     """Authentication methods"""
     CREDENTIAL = "credential"
@@ -1,11 +1,26 @@
 # src/core/exceptions.py
+from typing import Optional
 
-class FetcherException(Exception):
-    """Base exception for all fetcher-related errors."""
 
-    def __init__(self, message: str = "", details: dict = None):
+class FetcherException(Exception):
+    """
+    Base exception for all fetcher-related errors.
+
+    Each class carries its classification, so the retry, scheduling and circuit
+    breaking layers decide with an attribute lookup:
+        retryable: Another attempt may succeed
+        refresh_session: The session must be refreshed before retrying
+        trips_breaker: The failure counts against the target's health
+        retry_after: Optional hint in seconds before the next attempt, per instance
+    """
+    retryable: bool = False
+    refresh_session: bool = False
+    trips_breaker: bool = False
+
+    def __init__(self, message: str = "", details: dict = None, retry_after: Optional[float] = None):
         self.message = message
         self.details = details or {}
+        self.retry_after = retry_after
         super().__init__(self.message)
 
 
@@ -23,7 +38,8 @@ class InitializationException(FetcherException):
 # Browser and Network
 class BrowserException(FetcherException):
     """Base class for browser-related exceptions."""
-    pass
+    retryable = True
+    trips_breaker = True
 
 
 class PlaywrightException(BrowserException):
@@ -33,7 +49,8 @@ class PlaywrightException(BrowserException):
 
 class SessionException(BrowserException):
     """Raised for all session-related errors."""
-    pass
+    refresh_session = True
+    trips_breaker = False
 
 
 class NetworkException(BrowserException):
@@ -49,7 +66,38 @@ class DataException(FetcherException):
 
 class FetchException(DataException):
     """Raised when there's an error fetching data."""
-    pass
+    retryable = True
+    trips_breaker = True
+
+
+class DeadlineExceededException(FetchException):
+    """Raised when an operation runs out of its time budget."""
+    # The time budget is spent, another attempt cannot finish in time
+    retryable = False
+
+
+class ClientErrorException(FetchException):
+    """Raised when a request is refused as malformed or for a missing resource (4xx)."""
+    # Sending the same request again gets the same answer, and the target is healthy
+    retryable = False
+    trips_breaker = False
+
+
+class RetriesExhaustedException(FetchException):
+    """Raised when an operation still fails after its retries or the retry budget ran out."""
+    # Retrying the retries multiplies them; whether the target is at fault follows the last error
+    retryable = False
+
+    def __init__(self, message: str = "", details: dict = None, cause: Optional[BaseException] = None):
+        super().__init__(message, details)
+        self.trips_breaker = getattr(cause, "trips_breaker", self.trips_breaker)
+
+
+class CircuitOpenException(FetchException):
+    """Raised when a circuit breaker rejects a call to a failing target."""
+    # Retrying inside the open window is futile; retry_after says when it reopens
+    retryable = False
+    trips_breaker = False
 
 
 class ExtractionException(DataException):
@@ -62,6 +110,11 @@ class ValidationException(DataException):
     pass
 
 
+class StorageException(DataException):
+    """Raised when there's an error persisting data."""
+    retryable = True
+
+
 # Strategy-specific
 class StrategyException(FetcherException):
     """Base class for strategy-related exceptions."""
@@ -70,14 +123,16 @@ class StrategyException(FetcherException):
 
 class AuthenticationException(StrategyException):
     """Raised when there's an error with authentication."""
-    pass
+    refresh_session = True
 
 
 class ScrollingException(StrategyException):
     """Raised when there's an error with page scrolling."""
-    pass
+    retryable = True
+    trips_breaker = True
 
 
 class StealthException(StrategyException):
     """Raised when there's an error with stealth measures."""
-    pass
+    # Detection calls for backing off the platform, not hammering it again
+    trips_breaker = True
@@ -0,0 +1,190 @@
+# src/core/state.py
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .config import Config
+from .constants import STATE_DIR, MS_PER_SECOND
+from .log_manager import LogManager
+from src.utils.storage import WriteBehindBuffer, read_json, write_json_atomic
+
+
+@dataclass
+class SourceProgress:
+    """How far a job got with one source"""
+    cursor: Optional[str] = None
+    scroll_depth: int = 0
+    items: int = 0
+    done: bool = False
+
+
+@dataclass
+class JobState:
+    """
+    Progress of a fetch job: its queue of sources and the position in it, the
+    progress within each source, and the committed size of every dataset file
+    the job appends to, so bytes written after the last checkpoint can be
+    discarded on resume.
+    """
+    job_id: str
+    queue: List[str] = field(default_factory=list)
+    position: int = 0
+    sources: Dict[str, SourceProgress] = field(default_factory=dict)
+    segments: Dict[str, int] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def finished(self) -> bool:
+        return self.position >= len(self.queue)
+
+    @property
+    def current(self) -> Optional[str]:
+        """The source the job is working on, None once the queue is done"""
+        return None if self.finished else self.queue[self.position]
+
+    def progress(self, source: str) -> SourceProgress:
+        """Progress of a source, created on first use"""
+        progress = self.sources.get(source)
+        if progress is None:
+            progress = self.sources[source] = SourceProgress()
+        return progress
+
+    def advance(self) -> None:
+        """Mark the current source done and move to the next one"""
+        if not self.finished:
+            self.progress(self.queue[self.position]).done = True
+            self.position += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> JobState:
+        data = dict(data)
+        data["sources"] = {source: SourceProgress(**progress) for source, progress in data.get("sources", {}).items()}
+        return cls(**data)
+
+
+class Checkpointer:
+    """
+    Snapshots a job's state to STATE_DIR/<job_id>.json so a restarted job can
+    resume where it stopped.
+
+    The state is a few kilobytes of compact JSON written to a temporary file and
+    renamed into place, so a checkpoint costs one small write and a crash never
+    leaves a torn file. maybe_save() only writes once interval_ms has passed,
+    so callers can invoke it after every step.
+
+    With a write-behind buffer, each checkpoint waits for the records submitted
+    before it to be written and records the size of every dataset file; resuming
+    truncates the files back to those sizes, so records are neither lost nor
+    duplicated across a crash. The size of a dataset file before the job first
+    opens it is recorded right away in STATE_DIR/<job_id>.segments.json, so
+    datasets first written after the last checkpoint are cut back too.
+    """
+
+    def __init__(
+            self,
+            job_id: str,
+            base_dir: Optional[Path] = None,
+            interval_ms: Optional[int] = None,
+            buffer: Optional[WriteBehindBuffer] = None,
+            datasets: Optional[Iterable[str]] = None,
+            config: Optional[Config] = None
+    ):
+        """
+        Args:
+            job_id: Identifier of the job, names the checkpoint file
+            base_dir: Directory holding checkpoints, defaults to STATE_DIR
+            interval_ms: Minimum time between periodic checkpoints
+            buffer: Optional write-behind buffer the job writes records through
+            datasets: Datasets the job may write, recorded at their current size
+                when the job starts
+            config: Optional Config instance
+        """
+        config = config or Config()
+        self.job_id = job_id
+        self.path = Path(base_dir or STATE_DIR) / f"{job_id}.json"
+        self.segments_path = self.path.with_name(f"{job_id}.segments.json")
+        self.interval_s: float = (interval_ms or config.get("storage.checkpoint_interval_ms", 5000)) / MS_PER_SECOND
+        self.buffer = buffer
+        self.datasets = list(datasets or [])
+        self.logger = LogManager().get_logger(self.__class__.__name__)
+        self._last_saved = 0.0
+        self._lock = threading.Lock()
+        if buffer is not None:
+            buffer.writer.on_open = self._dataset_opened
+
+    def _dataset_opened(self, dataset: str, size: int) -> None:
+        # Runs on the writer thread before the dataset's first write
+        with self._lock:
+            opened = read_json(self.segments_path, {})
+            if dataset not in opened:
+                opened[dataset] = size
+                write_json_atomic(self.segments_path, opened)
+
+    def load(self) -> Optional[JobState]:
+        """The last checkpoint of the job, None if there is none"""
+        data = read_json(self.path)
+        return None if data is None else JobState.from_dict(data)
+
+    def resume_or_start(self, queue: List[str]) -> JobState:
+        """
+        Resume the job from its last checkpoint, or start it over the given queue
+        Args:
+            queue: Sources to fetch, used when no checkpoint exists
+        """
+        state = self.load()
+        if state is None:
+            self.segments_path.unlink(missing_ok=True)
+            state = JobState(self.job_id, list(queue))
+            if self.buffer is not None:
+                state.segments = {dataset: self.buffer.writer.size(dataset) for dataset in self.datasets}
+            self.save(state)
+            return state
+        if self.buffer is not None:
+            # Checkpointed sizes win over sizes recorded when datasets were first opened
+            self.buffer.writer.truncate_to({**read_json(self.segments_path, {}), **state.segments})
+        self.logger.info(f"Resuming job {self.job_id} at source {state.position + 1}/{len(state.queue)}")
+        return state
+
+    def _write(self, state: JobState, offsets: Dict[str, int]) -> None:
+        state.segments.update(offsets)
+        state.updated_at = time.time()
+        write_json_atomic(self.path, state.to_dict())
+        self._last_saved = time.monotonic()
+
+    def save(self, state: JobState) -> None:
+        """Write a checkpoint now, blocking until buffered records are written"""
+        self._write(state, self.buffer.checkpoint() if self.buffer is not None else {})
+
+    async def save_async(self, state: JobState) -> None:
+        """Write a checkpoint now without blocking the event loop on the buffer"""
+        self._write(state, await self.buffer.checkpoint_async() if self.buffer is not None else {})
+
+    def _due(self) -> bool:
+        return time.monotonic() - self._last_saved >= self.interval_s
+
+    def maybe_save(self, state: JobState) -> bool:
+        """Write a checkpoint if interval_ms passed since the last one"""
+        if not self._due():
+            return False
+        self.save(state)
+        return True
+
+    async def maybe_save_async(self, state: JobState) -> bool:
+        """maybe_save() for async callers"""
+        if not self._due():
+            return False
+        await self.save_async(state)
+        return True
+
+    def clear(self) -> None:
+        """Remove the checkpoint of a finished job"""
+        self.path.unlink(missing_ok=True)
+        self.segments_path.unlink(missing_ok=True)
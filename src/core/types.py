@@ -0,0 +1,308 @@
+# src/core/types.py
+from __future__ import annotations
+
+import sys
+from array import array
+from dataclasses import dataclass, fields
+from typing import (
+    Any, ClassVar, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union,
+    get_args, get_origin, get_type_hints
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, columns are plain arrays without it
+    np = None
+
+R = TypeVar("R", bound="Record")
+
+# array typecodes of numeric fields
+NUMERIC_TYPECODES = {int: "q", float: "d"}
+
+
+class Record:
+    """
+    Base of the extracted record types.
+
+    Records are slotted dataclasses: no per-instance __dict__, so one costs a
+    fraction of the equivalent dict. Strings repeated across many records
+    (platform, author and source IDs) are interned on from_dict(), so millions
+    of records share a single copy of each.
+    """
+    __slots__ = ()
+
+    # Dataset the records are written to
+    dataset: ClassVar[str] = "records"
+    # Fields holding values repeated across records
+    interned: ClassVar[Tuple[str, ...]] = ("platform",)
+
+    @classmethod
+    def from_dict(cls: Type[R], data: Dict[str, Any]) -> R:
+        """Build a record from a dict, ignoring keys that are not fields"""
+        values = {name: data[name] for name in cls.__slots__ if name in data}
+        for name in cls.interned:
+            value = values.get(name)
+            if type(value) is str:
+                values[name] = sys.intern(value)
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the record's fields, e.g. for JSON serialization"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Field value by name, as dict.get(), so records and dicts read alike"""
+        return getattr(self, name, default)
+
+
+@dataclass(slots=True)
+class Post(Record):
+    """A post in a group, page or profile feed"""
+    dataset: ClassVar[str] = "posts"
+    interned: ClassVar[Tuple[str, ...]] = ("platform", "source_id", "author_id")
+
+    id: str
+    platform: str
+    source_id: Optional[str] = None
+    author_id: Optional[str] = None
+    author_name: Optional[str] = None
+    text: Optional[str] = None
+    timestamp: Optional[float] = None
+    url: Optional[str] = None
+    reactions: int = 0
+    comments: int = 0
+    shares: int = 0
+    # ID of the post this one near-duplicates, set by the dedupe stage
+    duplicate_of: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Comment(Record):
+    """A comment on a post"""
+    dataset: ClassVar[str] = "comments"
+    interned: ClassVar[Tuple[str, ...]] = ("platform", "post_id", "author_id")
+
+    id: str
+    platform: str
+    post_id: str
+    author_id: Optional[str] = None
+    author_name: Optional[str] = None
+    text: Optional[str] = None
+    timestamp: Optional[float] = None
+    reactions: int = 0
+
+
+@dataclass(slots=True)
+class Profile(Record):
+    """A user, page or group profile"""
+    dataset: ClassVar[str] = "profiles"
+
+    id: str
+    platform: str
+    name: Optional[str] = None
+    url: Optional[str] = None
+    followers: Optional[int] = None
+    description: Optional[str] = None
+
+
+class NumericColumn:
+    """
+    Numeric field of a batch, stored in a typed array. Nullable columns keep a
+    validity byte per row; missing values are stored as zero.
+    """
+    __slots__ = ("values", "valid")
+
+    def __init__(self, typecode: str, nullable: bool = False):
+        self.values = array(typecode)
+        self.valid: Optional[bytearray] = bytearray() if nullable else None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Union[int, float, None]:
+        if self.valid is not None and not self.valid[index]:
+            return None
+        return self.values[index]
+
+    def __iter__(self) -> Iterator[Union[int, float, None]]:
+        if self.valid is None:
+            return iter(self.values)
+        return (value if valid else None for value, valid in zip(self.values, self.valid))
+
+    def append(self, value: Union[int, float, None]) -> None:
+        if self.valid is not None:
+            self.valid.append(value is not None)
+        self.values.append(0 if value is None else value)
+
+    def truncate(self, length: int) -> None:
+        del self.values[length:]
+        if self.valid is not None:
+            del self.valid[length:]
+
+    def take(self, indices: Sequence[int]) -> NumericColumn:
+        column = NumericColumn(self.values.typecode, self.valid is not None)
+        values = self.values
+        column.values.extend(values[i] for i in indices)
+        if self.valid is not None:
+            valid = self.valid
+            column.valid.extend(valid[i] for i in indices)
+        return column
+
+    def to_numpy(self):
+        """
+        The values as a NumPy array sharing the column's buffer; nullable columns
+        give a masked array with their missing rows masked.
+        """
+        if np is None:
+            raise ImportError("NumPy is required to convert columns to arrays")
+        values = np.frombuffer(self.values, dtype=self.values.typecode)
+        if self.valid is None:
+            return values
+        return np.ma.masked_array(values, mask=~np.frombuffer(self.valid, dtype=bool))
+
+
+class StringColumn:
+    """
+    String field of a batch, stored as one UTF-8 buffer and the offsets of each
+    row in it, so a batch holds no string object per row until one is read.
+    """
+    __slots__ = ("data", "offsets", "valid")
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array("q", [0])
+        self.valid = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        if not self.valid[index]:
+            return None
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode("utf-8")
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return (self[index] for index in range(len(self)))
+
+    def append(self, value: Optional[str]) -> None:
+        if value is not None:
+            self.data += value.encode("utf-8")
+        self.valid.append(value is not None)
+        self.offsets.append(len(self.data))
+
+    def truncate(self, length: int) -> None:
+        del self.data[self.offsets[length]:]
+        del self.offsets[length + 1:]
+        del self.valid[length:]
+
+    def lengths(self) -> array:
+        """Byte length of every row, from the offsets alone"""
+        offsets = self.offsets
+        return array("q", (offsets[i + 1] - offsets[i] for i in range(len(self))))
+
+    def take(self, indices: Sequence[int]) -> StringColumn:
+        column = StringColumn()
+        data, offsets = self.data, self.offsets
+        for i in indices:
+            column.data += data[offsets[i]:offsets[i + 1]]
+            column.valid.append(self.valid[i])
+            column.offsets.append(len(column.data))
+        return column
+
+
+Column = Union[NumericColumn, StringColumn]
+
+
+def _new_column(hint: Any) -> Column:
+    nullable = get_origin(hint) is Union and type(None) in get_args(hint)
+    if nullable:
+        hint = next(arg for arg in get_args(hint) if arg is not type(None))
+    typecode = NUMERIC_TYPECODES.get(hint)
+    return StringColumn() if typecode is None else NumericColumn(typecode, nullable)
+
+
+class RecordBatch(Generic[R]):
+    """
+    A batch of records of one type, held column by column.
+
+    Numeric fields live in typed arrays (NumPy views via to_numpy() when it is
+    installed) and string fields in offset-encoded UTF-8 buffers, so a batch of
+    thousands of records is a handful of objects, and per-field work such as
+    validation or statistics runs over a column instead of record by record.
+    Rows are only materialized as records when read.
+    """
+
+    def __init__(self, record_type: Type[R]):
+        """
+        Args:
+            record_type: Record type of the batch's rows
+        """
+        self.record_type = record_type
+        hints = get_type_hints(record_type)
+        self.columns: Dict[str, Column] = {field.name: _new_column(hints[field.name]) for field in fields(record_type)}
+        self._length = 0
+
+    @classmethod
+    def from_records(cls, record_type: Type[R], records: Iterable[Union[R, Dict[str, Any]]]) -> RecordBatch[R]:
+        """Build a batch from records or dicts"""
+        batch = cls(record_type)
+        batch.extend(records)
+        return batch
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[R]:
+        return (self.row(index) for index in range(self._length))
+
+    @property
+    def dataset(self) -> str:
+        return self.record_type.dataset
+
+    def column(self, name: str) -> Column:
+        """A field's column, raising KeyError for unknown fields"""
+        return self.columns[name]
+
+    def append(self, record: Union[R, Dict[str, Any]]) -> None:
+        """
+        Add a record, or a dict with the record's fields, as a row. A value the
+        column cannot hold, e.g. a string in an int field, raises TypeError and
+        leaves the batch unchanged.
+        """
+        get = record.get
+        try:
+            for name, column in self.columns.items():
+                column.append(get(name))
+        except (TypeError, AttributeError, OverflowError) as e:
+            # Undo the columns already extended, so every column keeps one value per row
+            for column in self.columns.values():
+                column.truncate(self._length)
+            raise TypeError(f"Invalid value for {self.record_type.__name__}.{name}: {e}") from e
+        self._length += 1
+
+    def extend(self, records: Iterable[Union[R, Dict[str, Any]]]) -> None:
+        for record in records:
+            self.append(record)
+
+    def row(self, index: int) -> R:
+        """The index-th row as a record"""
+        if not -self._length <= index < self._length:
+            raise IndexError("RecordBatch index out of range")
+        index %= self._length
+        return self.record_type.from_dict({name: column[index] for name, column in self.columns.items()})
+
+    def take(self, indices: Sequence[int]) -> RecordBatch[R]:
+        """A new batch of the given rows, in the given order"""
+        batch = RecordBatch(self.record_type)
+        batch.columns = {name: column.take(indices) for name, column in self.columns.items()}
+        batch._length = len(indices)
+        return batch
+
+    def filter(self, mask: Iterable[Any]) -> RecordBatch[R]:
+        """A new batch of the rows whose mask entry is truthy"""
+        return self.take([index for index, keep in enumerate(mask) if keep])
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Rows as dicts, column by column without building records"""
+        names = list(self.columns)
+        return [dict(zip(names, values)) for values in zip(*self.columns.values())]
@@ -0,0 +1,380 @@
+# src/fetchers/base_fetcher.py
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable, List, Union, TYPE_CHECKING
+
+from playwright.async_api import Page, Error as PlaywrightError
+
+from src.browser.session_store import SessionStore, get_session_store, DEFAULT_ACCOUNT
+from src.core.config import Config
+from src.core.constants import SCREENSHOTS_DIR, FetchMode
+from src.core.exceptions import (
+    ConfigurationException, InitializationException, FetchException
+)
+from src.core.log_manager import LogManager
+from src.core.types import Record
+from src.fetchers.http_fetcher import HttpFetcher
+from src.utils.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from src.utils.rate_limiter import RateLimiter, get_rate_limiter
+from src.utils.retry import RetryPolicy, RetryBudget, Deadline, retry_async, with_timeout
+from src.utils.sanitizer import sanitize_batch, sanitize_value
+from src.utils.storage import HighWaterMarks
+
+if TYPE_CHECKING:
+    from src.browser.strategies.scrolling.base_scroller import BaseScroller
+
+
+class BaseFetcher(ABC):
+    """
+    Base class for all data fetchers.
+
+    This abstract class defines the interface and common functionality for all platform-specific
+    data fetchers. It handles configuration management, logging, error handling, session
+    persistence and resource management.
+    """
+
+    def __init__(
+            self,
+            config: Optional[Dict[str, Any]] = None,
+            session_store: Optional[SessionStore] = None,
+            http_fetcher: Optional[HttpFetcher] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            retry_budget: Optional[RetryBudget] = None,
+            circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Initialize the base fetcher.
+
+        Args:
+            config: Optional custom configuration that overrides default settings.
+            session_store: Optional session store, defaults to the shared store
+            http_fetcher: Optional browser-free fetch path for query types configured as "http"
+            rate_limiter: Optional rate limiter, defaults to the platform's shared limiter
+            retry_budget: Optional retry budget shared by the job, defaults to fetcher.retry.budget
+            circuit_breaker: Optional circuit breaker, defaults to the platform's shared breaker
+        """
+        self.log_manager = LogManager()
+        self.logger = self.log_manager.get_logger(self.__class__.__name__)
+        self.logger.info(f"Initializing {self.__class__.__name__}")
+
+        self.app_config = Config()
+        self.config: Dict[str, Any] = {}
+        self.platform: str = (config or {}).get("platform") or self.app_config.get("fetcher.default_platform")
+        self._load_config(config)
+
+        # Initialize core attributes
+        self.page: Optional[Page] = None
+        self.is_initialized = False
+        self.session_store = session_store or get_session_store()
+        self.account: str = self.config.get("account", DEFAULT_ACCOUNT)
+        self.http = http_fetcher
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.platform)
+
+        # Timeout and retry settings
+        self.timeout: int = self.config.get("timeout_ms", 60000)
+        self.fetch_deadline: Optional[int] = self.config.get("fetch_deadline_ms")
+        self.retry_policy = RetryPolicy.from_config(self.config.get("retry"))
+        self.retry_budget = retry_budget or RetryBudget(self.config.get("retry", {}).get("budget", 20))
+        self.retry_attempts: int = self.retry_policy.attempts
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(self.platform)
+
+    def _load_config(self, custom_config: Optional[Dict[str, Any]] = None) -> None:
+        """Load configuration settings from Config and custom overrides."""
+        try:
+            # Platform-specific configuration
+            self.config.update(self.app_config.get(f"platforms.{self.platform}", {}))
+
+            # General fetcher configuration
+            self.config.update(self.app_config.get("fetcher", {}))
+
+            # Custom configuration (highest priority)
+            if custom_config:
+                self.config.update(custom_config)
+
+            self.logger.debug(f"Configuration loaded for {self.__class__.__name__}")
+        except Exception as e:
+            self.log_manager.log_exception(self.logger, e, "Error loading configuration")
+            raise ConfigurationException(f"Error loading configuration: {str(e)}") from e
+
+    def initialize(self, page: Page) -> None:
+        """
+        Initialize the fetcher with a Playwright page.
+
+        Args:
+            page: Playwright page object to use for web interactions
+
+        Raises:
+            InitializationException: If page is None
+        """
+        if page is None:
+            raise InitializationException("Page cannot be None")
+
+        self.page = page
+        self.is_initialized = True
+        self.logger.info(f"Initialized {self.__class__.__name__} with Playwright page")
+
+    @abstractmethod
+    async def fetch(self, query: str, **kwargs) -> Any:
+        """
+        Main method to fetch data from the source.
+
+        Implementations create one deadline with new_deadline() and pass it to every
+        phase (goto, authentication, scrolling, extraction), each wrapped in
+        deadline.phase(name), so the whole fetch is bounded by fetch_deadline_ms.
+
+        Args:
+            query: The search query or identifier for the data to fetch
+            **kwargs: Additional parameters specific to the fetcher implementation
+
+        Returns:
+            The fetched data in a format specific to the implementation
+
+        Raises:
+            FetchException: If fetcher not initialized
+        """
+        if not self.is_initialized:
+            raise FetchException("Fetcher must be initialized before fetching data")
+
+    @abstractmethod
+    async def extract(self, element) -> Dict[str, Any]:
+        """
+        Extract structured data from elements.
+
+        Args:
+            element: The element to extract data from (type depends on implementation)
+
+        Returns:
+            Dictionary containing the extracted data
+        """
+        pass
+
+    def fetch_mode(self, query_type: str) -> FetchMode:
+        """
+        Return how a query type is fetched, from the platform's fetch_modes mapping.
+        Query types default to the browser, and fall back to it when no HTTP path is attached.
+        """
+        mode = FetchMode(self.config.get("fetch_modes", {}).get(query_type, FetchMode.BROWSER.value))
+        if mode is FetchMode.HTTP and self.http is None:
+            self.logger.warning(f"No HTTP fetch path attached, fetching '{query_type}' with the browser")
+            return FetchMode.BROWSER
+        return mode
+
+    def new_deadline(self, budget_ms: Optional[int] = None) -> Deadline:
+        """Create the deadline bounding a single fetch, fetch_deadline_ms by default."""
+        return Deadline.after_ms(budget_ms if budget_ms is not None else self.fetch_deadline)
+
+    async def goto(self, url: str, timeout=None, deadline: Optional[Deadline] = None):
+        """Navigate the page to a URL through the platform's rate limiter, within the deadline if given."""
+        if not self.is_initialized:
+            raise FetchException("Fetcher must be initialized before navigating")
+        timeout = timeout or self.timeout
+        if deadline is not None:
+            deadline.check(f"navigating to {url}")
+            await with_timeout(self.rate_limiter.acquire(), deadline=deadline, operation="rate limiter")
+            timeout = deadline.timeout_ms(timeout)
+        else:
+            await self.rate_limiter.acquire()
+        return await self.page.goto(url, timeout=timeout)
+
+    async def collect(
+            self,
+            scroller: BaseScroller,
+            sink: Callable[[List[Dict[str, Any]]], Any],
+            target_items: int = 0,
+            deadline: Optional[Deadline] = None,
+            source: Optional[str] = None,
+            marks: Optional[HighWaterMarks] = None
+    ) -> int:
+        """
+        Scroll the page and extract items as they load, instead of scrolling to the
+        end first. Each step's records are sanitized and handed to sink (e.g.
+        list.extend or a storage buffer), and the scroller prunes extracted nodes.
+
+        With a source and high-water marks, records at or below the source's mark
+        (by their timestamp, else their id) are dropped, and scrolling stops after
+        storage.high_water_marks.seen_streak of them in a row. New records are
+        observed on the marks; commit the marks once the sink has persisted them.
+
+        Args:
+            scroller: Scrolling strategy, initialized with this fetcher's page
+            sink: Receives each step's batch of records
+            target_items: Target number of items to load (0 for unlimited)
+            deadline: Optional deadline of the fetch
+            source: Optional source key (group, profile...) for incremental fetching
+            marks: Optional high-water marks for incremental fetching
+
+        Returns:
+            int: Number of records extracted
+        """
+        if not self.is_initialized:
+            raise FetchException("Fetcher must be initialized before collecting data")
+        incremental = source is not None and marks is not None
+        seen_streak = self.app_config.get("storage.high_water_marks.seen_streak", 3)
+        extracted = 0
+        streak = 0
+
+        async def on_items(elements) -> None:
+            nonlocal extracted, streak
+            records = []
+            for record in self.sanitize_batch([await self.extract(element) for element in elements]):
+                if incremental:
+                    timestamp, item_id = record.get("timestamp"), record.get("id")
+                    if marks.is_seen(source, timestamp, item_id):
+                        # A few seen items in a row, not just a pinned post, mean the rest is stored
+                        streak += 1
+                        if streak >= seen_streak:
+                            scroller.stop("reached seen content")
+                            break
+                        continue
+                    streak = 0
+                    marks.observe(source, timestamp, item_id)
+                records.append(record)
+            if records:
+                sink(records)
+            extracted += len(records)
+
+        await scroller.scroll(target_items=target_items, deadline=deadline, on_items=on_items)
+        self.logger.info(f"Collected {extracted} records from {self.platform}")
+        return extracted
+
+    async def close(self) -> None:
+        """Clean up resources used by the fetcher."""
+        try:
+            if self.page:
+                self.logger.debug("Closing Playwright page")
+                await self.page.close()
+        except PlaywrightError as e:
+            self.logger.warning(f"Error while closing page: {str(e)}")
+        finally:
+            self.page = None
+            self.is_initialized = False
+            self.logger.info(f"Closed {self.__class__.__name__} resources")
+
+    async def _retry(self, func, *args, attempts=None, exceptions=None, policy: Optional[RetryPolicy] = None,
+                     deadline: Optional[Deadline] = None, **kwargs):
+        """
+        Run an operation, retrying failures the policy deems retryable with
+        exponential backoff and full jitter, while the job's retry budget lasts.
+        Backoffs are awaited, never slept, so other pages on the loop keep going.
+        Every attempt goes through the platform's circuit breaker, so a failing
+        platform fails fast with CircuitOpenException instead of timing out.
+        Failures marked refresh_session renew the session before the next attempt.
+
+        Args:
+            func: Coroutine function to run
+            attempts: Optional override of the policy's attempt count
+            exceptions: Optional override of the exception types to retry
+            policy: Optional policy replacing the fetcher's default
+            deadline: Optional deadline bounding all attempts and backoffs
+        """
+        policy = (policy or self.retry_policy).with_overrides(attempts=attempts, retry_on=exceptions)
+        try:
+            return await retry_async(
+                self.circuit_breaker.call, func, *args, policy=policy, budget=self.retry_budget,
+                deadline=deadline, logger=self.logger, on_refresh=self.refresh_session, **kwargs)
+        except FetchException as e:
+            if e.__cause__ is not None:
+                self.log_manager.log_exception(self.logger, e.__cause__, f"[{self.platform}] {e.message}")
+            raise
+
+    @staticmethod
+    def sanitize_data(raw_data: Union[Dict[str, Any], Record]) -> Union[Dict[str, Any], Record]:
+        """
+        Sanitizes or formats common types of data fields from raw extraction:
+        strings are stripped and normalized, nested lists and dicts are cleaned
+        and None values are dropped. Clean data is returned without copying.
+        """
+        return sanitize_value(raw_data)
+
+    @staticmethod
+    def sanitize_batch(records: List[Union[Dict[str, Any], Record]]) -> List[Union[Dict[str, Any], Record]]:
+        """Sanitizes a batch of records extracted together in one pass."""
+        return sanitize_batch(records)
+
+    def handle_exception(self, exc: Exception, message: str):
+        """Logs and raises formatted exceptions."""
+        self.log_manager.log_exception(self.logger, exc, message)
+        raise FetchException(message) from exc
+
+    async def save_session(self) -> None:
+        """Persist the page's storage state (cookies/localStorage) for later runs."""
+        try:
+            state = await self.page.context.storage_state()
+            self.session_store.save(self.platform, state, self.account)
+        except Exception as e:
+            self.handle_exception(e, f"Failed saving session data for {self.platform}/{self.account}")
+
+    def load_session(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored storage state for this fetcher's account,
+        or None if there is no session or it has expired.
+        """
+        state = self.session_store.load(self.platform, self.account)
+        if state is None:
+            self.logger.warning(f"No valid session stored for {self.platform}/{self.account}")
+        return state
+
+    async def refresh_session(self) -> None:
+        """
+        Pick up the latest stored session, e.g. one renewed by another worker,
+        in the page's context and the HTTP path.
+        """
+        self.session_store.reload()
+        state = self.load_session()
+        if state is None:
+            return
+        if self.page is not None:
+            await self.page.context.add_cookies(state.get("cookies", []))
+        if self.http is not None:
+            await self.http.refresh_session()
+        self.logger.info(f"Refreshed session for {self.platform}/{self.account}")
+
+    def session_needs_refresh(self) -> bool:
+        """Check from the expiry index alone whether the session should be renewed."""
+        return self.session_store.needs_refresh(self.platform, self.account)
+
+    async def health_check(self) -> None:
+        """Validates fetcher readiness."""
+        if not self.is_initialized or not self.page:
+            raise InitializationException(f"{self.platform} fetcher not properly initialized.")
+
+        try:
+            _ = await self.page.title()
+            self.logger.debug(f"{self.platform} fetcher health check passed.")
+        except Exception as e:
+            self.handle_exception(e, f"{self.platform} fetcher health check failed.")
+
+    async def capture_screenshot(self, name: str) -> Path:
+        """Captures a screenshot into SCREENSHOTS_DIR and returns its path."""
+        path = SCREENSHOTS_DIR / self.platform / f"{name}.png"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            await self.page.screenshot(path=str(path))
+            self.logger.info(f"Captured screenshot: {path}")
+        except Exception as e:
+            self.handle_exception(e, "Screenshot capturing failed")
+        return path
+
+    async def wait_for_selector(self, selector: str, timeout=None, deadline: Optional[Deadline] = None):
+        """Wait for specified selector to be visible, within the deadline if given."""
+        timeout = timeout or self.timeout
+
+        async def _wait():
+            attempt_timeout = timeout if deadline is None else deadline.timeout_ms(timeout)
+            await self.page.wait_for_selector(selector, timeout=attempt_timeout)
+            self.logger.debug(f"{self.platform}: Selector '{selector}' is visible")
+
+        await self._retry(_wait, exceptions=(PlaywrightError,), deadline=deadline)
+
+    async def __aenter__(self) -> BaseFetcher:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Ensure resources are cleaned up, propagating any exception."""
+        if exc_type is not None:
+            self.log_manager.log_exception(self.logger, exc_val, f"Error in {self.__class__.__name__}")
+
+        await self.close()
+        return False
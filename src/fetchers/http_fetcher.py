@@ -0,0 +1,157 @@
+# src/fetchers/http_fetcher.py
+from __future__ import annotations
+
+from typing import Optional, Dict, Any
+
+from playwright.async_api import Playwright, APIRequestContext, APIResponse, Error as PlaywrightError
+
+from src.browser.session_store import SessionStore, get_session_store, DEFAULT_ACCOUNT
+from src.core.config import Config
+from src.core.constants import DEFAULT_HEADERS, DEFAULT_USER_AGENT
+from src.core.exceptions import ClientErrorException, FetchException, NetworkException, SessionException
+from src.core.log_manager import LogManager
+from src.utils.circuit_breaker import get_circuit_breaker
+from src.utils.rate_limiter import RateLimiter, get_rate_limiter
+
+# 4xx statuses worth retrying: request timeout and rate limiting (with Retry-After)
+TRANSIENT_CLIENT_STATUSES = (408, 429)
+
+
+class HttpFetcher:
+    """
+    Browser-free fetch path for endpoints that return data directly (e.g. JSON).
+
+    Requests go through a Playwright APIRequestContext, which needs no browser or
+    renderer, keeps connections alive and pools them per host. Cookies come from the
+    session store, and every request passes through the platform's rate limiter,
+    shared with the browser path.
+    """
+
+    def __init__(
+            self,
+            playwright: Playwright,
+            config: Optional[Dict[str, Any]] = None,
+            session_store: Optional[SessionStore] = None,
+            rate_limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Initialize the HTTP fetcher.
+
+        Args:
+            playwright: Running async Playwright instance
+            config: Optional custom configuration that overrides default settings
+            session_store: Optional session store, defaults to the shared store
+            rate_limiter: Optional rate limiter, defaults to the platform's shared limiter
+        """
+        self.log_manager = LogManager()
+        self.logger = self.log_manager.get_logger(self.__class__.__name__)
+        self.app_config = Config()
+        self.config = config or {}
+
+        self.playwright = playwright
+        self.platform: str = self.config.get("platform") or self.app_config.get("fetcher.default_platform")
+        self.account: str = self.config.get("account", DEFAULT_ACCOUNT)
+        self.base_url: Optional[str] = self.config.get(
+            "base_url", self.app_config.get(f"platforms.{self.platform}.base_url"))
+        self.timeout: int = self.config.get("timeout_ms", self.app_config.get("fetcher.timeout_ms", 60000))
+
+        self.session_store = session_store or get_session_store()
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.platform)
+        self.context: Optional[APIRequestContext] = None
+
+    async def start(self) -> None:
+        """
+        Open the request context with the stored session's cookies.
+
+        Raises:
+            SessionException: If no valid session is stored for the account
+        """
+        state = self.session_store.load(self.platform, self.account)
+        if state is None:
+            raise SessionException(f"No valid session stored for {self.platform}/{self.account}")
+
+        self.context = await self.playwright.request.new_context(
+            base_url=self.base_url,
+            storage_state=state,
+            extra_http_headers=DEFAULT_HEADERS,
+            user_agent=DEFAULT_USER_AGENT,
+            timeout=self.timeout
+        )
+        self.logger.info(f"HTTP fetch path ready for {self.platform}/{self.account}")
+
+    async def refresh_session(self) -> None:
+        """Reopen the request context with the latest stored cookies."""
+        await self.close()
+        await self.start()
+
+    async def request(self, url: str, method: str = "GET", endpoint: Optional[str] = None,
+                      **kwargs) -> APIResponse:
+        """
+        Send a rate-limited request through the endpoint's circuit breaker.
+
+        Args:
+            url: Absolute URL or path relative to the platform's base URL
+            method: HTTP method
+            endpoint: Optional endpoint name keying a dedicated circuit breaker,
+                defaults to the platform's breaker
+            **kwargs: Passed through to APIRequestContext.fetch (params, data, headers...)
+
+        Returns:
+            The response
+
+        Raises:
+            FetchException: If the fetcher has not been started
+            CircuitOpenException: If the endpoint's circuit is open
+            SessionException: If the platform rejects the session
+            ClientErrorException: If the request is refused with a permanent 4xx status
+            NetworkException: If the request fails, times out, is throttled or hits a server error
+        """
+        if self.context is None:
+            raise FetchException("HTTP fetcher must be started before fetching data")
+
+        breaker = get_circuit_breaker(f"{self.platform}:{endpoint}" if endpoint else self.platform)
+        return await breaker.call(self._send, url, method, **kwargs)
+
+    async def _send(self, url: str, method: str, **kwargs) -> APIResponse:
+        await self.rate_limiter.acquire()
+        try:
+            response = await self.context.fetch(url, method=method, **kwargs)
+        except PlaywrightError as e:
+            raise NetworkException(f"{method} {url} failed: {e}", {"url": url}) from e
+
+        if not response.ok:
+            details = {"url": url, "status": response.status}
+            if response.status in (401, 403):
+                raise SessionException(f"{method} {url} rejected the session ({response.status})", details)
+            if 400 <= response.status < 500 and response.status not in TRANSIENT_CLIENT_STATUSES:
+                raise ClientErrorException(f"{method} {url} returned {response.status}", details)
+            raise NetworkException(
+                f"{method} {url} returned {response.status}", details,
+                retry_after=self._retry_after(response)
+            )
+        return response
+
+    @staticmethod
+    def _retry_after(response: APIResponse) -> Optional[float]:
+        """Seconds from a Retry-After header given in seconds, if any"""
+        value = response.headers.get("retry-after", "")
+        return float(value) if value.isdigit() else None
+
+    async def get_json(self, url: str, **kwargs) -> Any:
+        """Send a GET request and decode the JSON body."""
+        response = await self.request(url, **kwargs)
+        return await response.json()
+
+    async def close(self) -> None:
+        """Dispose of the request context and its pooled connections."""
+        if self.context is not None:
+            await self.context.dispose()
+            self.context = None
+
+    async def __aenter__(self) -> HttpFetcher:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        await self.close()
+        return False
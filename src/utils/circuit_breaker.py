@@ -0,0 +1,156 @@
+# src/utils/circuit_breaker.py
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from src.core.config import Config
+from src.core.constants import CircuitState, MS_PER_SECOND
+from src.core.exceptions import CircuitOpenException, FetcherException
+from src.core.log_manager import LogManager
+
+T = TypeVar("T")
+
+
+class CircuitBreaker:
+    """
+    Stops sending work to a failing target.
+
+    The breaker tracks the outcome of the last window_size calls. Once at least
+    min_calls are recorded and the failure rate reaches the threshold it opens, and
+    every call fails fast with CircuitOpenException. After open_ms it lets up to
+    probe_calls probe calls through: a successful probe closes it, a failed one
+    opens it again. FetcherExceptions only count as failures if their class is
+    marked trips_breaker; any other exception does.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            failure_rate: float = 0.5,
+            window_size: int = 20,
+            min_calls: int = 10,
+            open_ms: int = 60000,
+            probe_calls: int = 1,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_s = open_ms / MS_PER_SECOND
+        self.probe_calls = probe_calls
+        self.clock = clock
+        self.logger = LogManager().get_logger(self.__class__.__name__)
+
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, name: str, config: Optional[Config] = None) -> CircuitBreaker:
+        """Build a breaker from the fetcher.circuit_breaker configuration section"""
+        settings = (config or Config()).get("fetcher.circuit_breaker", {})
+        return cls(name, **settings)
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if self._state is CircuitState.OPEN and self.clock() - self._opened_at >= self.open_s:
+            self._state = CircuitState.HALF_OPEN
+            self._probes_in_flight = 0
+            self.logger.info(f"Circuit '{self.name}' half-open, letting probes through")
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self.clock()
+        self._probes_in_flight = 0
+        self.logger.warning(f"Circuit '{self.name}' opened for {self.open_s:.0f}s")
+
+    def before_call(self) -> None:
+        """
+        Admit a call or reject it
+        Raises:
+            CircuitOpenException: If the circuit is open or all probe slots are taken
+        """
+        with self._lock:
+            self._maybe_half_open()
+            if self._state is CircuitState.CLOSED:
+                return
+            if self._state is CircuitState.HALF_OPEN and self._probes_in_flight < self.probe_calls:
+                self._probes_in_flight += 1
+                return
+            retry_after = max(0.0, self._opened_at + self.open_s - self.clock())
+            raise CircuitOpenException(
+                f"Circuit '{self.name}' is open",
+                {"circuit": self.name},
+                retry_after=retry_after
+            )
+
+    def release(self) -> None:
+        """Give back the slot of an admitted call that ended without an outcome, e.g. cancelled"""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._probes_in_flight:
+                self._probes_in_flight -= 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._state = CircuitState.CLOSED
+                self._outcomes.clear()
+                self.logger.info(f"Circuit '{self.name}' closed after a successful probe")
+            self._outcomes.append(True)
+
+    def record_failure(self, exc: Optional[BaseException] = None) -> None:
+        """Record a failed call; failures not marked trips_breaker say nothing about the target"""
+        if isinstance(exc, FetcherException) and not exc.trips_breaker:
+            # The target answered; the fault lies with our request or data
+            self.record_success()
+            return
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._open()
+                return
+            self._outcomes.append(False)
+            calls = len(self._outcomes)
+            failures = calls - sum(self._outcomes)
+            if self._state is CircuitState.CLOSED and calls >= self.min_calls \
+                    and failures / calls >= self.failure_rate:
+                self._open()
+
+    async def call(self, func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """Run a coroutine function through the breaker"""
+        self.before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        except BaseException:
+            # Cancelled: neither a success nor a failure, but the probe slot is free again
+            self.release()
+            raise
+        self.record_success()
+        return result
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(key: str, config: Optional[Config] = None) -> CircuitBreaker:
+    """
+    Return the breaker shared by all fetchers for a key, a platform name
+    or a 'platform:endpoint' pair
+    """
+    breaker = _breakers.get(key)
+    if breaker is None:
+        breaker = CircuitBreaker.from_config(key, config)
+        _breakers[key] = breaker
+    return breaker
@@ -0,0 +1,335 @@
+# src/utils/dedupe.py
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import re
+import os
+import sqlite3
+import uuid
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.core.config import Config
+from src.core.constants import PROCESSED_DATA_DIR, RAW_DATA_DIR, DuplicateAction
+from src.core.exceptions import ConfigurationException, StorageException
+from src.core.log_manager import LogManager
+from src.utils.storage import RecordWriter
+
+DEDUPE_INDEX_FILENAME = "dedupe_index.sqlite"
+
+# Mersenne prime modulus of the MinHash permutations; values fit in 32 bits,
+# halving the size of stored signatures, and products stay small integers
+MERSENNE_PRIME = (1 << 31) - 1
+# array typecode of signatures
+SIGNATURE_TYPECODE = "I"
+
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_text(text: str) -> List[str]:
+    """
+    Words of a post's text, casefolded and without URLs or punctuation, so
+    reshares differing in links, emoji or formatting normalize alike.
+    """
+    return _WORD_RE.findall(_URL_RE.sub(" ", text.casefold()))
+
+
+class MinHasher:
+    """
+    MinHash signatures of texts over their word shingles.
+
+    The Jaccard similarity of two texts' shingle sets is estimated by the share
+    of equal positions in their signatures. Permutations are drawn from a fixed
+    seed, so signatures are comparable across runs and processes.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 1):
+        """
+        Args:
+            num_perm: Signature length
+            shingle_size: Words per shingle
+            seed: Seed of the permutations
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._permutations: List[Tuple[int, int]] = [
+            (rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+
+    def shingles(self, text: str) -> set:
+        """32-bit hashes of the text's word shingles"""
+        words = normalize_text(text)
+        size = self.shingle_size
+        if len(words) <= size:
+            return {zlib.crc32(" ".join(words).encode("utf-8"))} if words else set()
+        return {zlib.crc32(" ".join(words[i:i + size]).encode("utf-8")) for i in range(len(words) - size + 1)}
+
+    def signature(self, text: str) -> Optional[array]:
+        """MinHash signature of a text, None if it has no words"""
+        hashes = self.shingles(text)
+        if not hashes:
+            return None
+        prime = MERSENNE_PRIME
+        return array(SIGNATURE_TYPECODE, [min([(a * h + b) % prime for h in hashes]) for a, b in self._permutations])
+
+
+def similarity(first: Sequence[int], second: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures"""
+    return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+
+class DedupeIndex:
+    """
+    On-disk LSH index of post signatures, in an SQLite database.
+
+    Signatures are split into bands; posts sharing any band's hash are
+    candidates, and a candidate is a near-duplicate when the estimated
+    similarity reaches threshold. With b bands of r rows, pairs are likely to
+    collide above a similarity of about (1/b)^(1/r), so candidate lookups stay
+    a few indexed queries per post however large the index grows. Every
+    duplicate points at the first post of its cluster, and only those first
+    posts are bucketed, so a large cluster still costs one comparison per lookup.
+
+    Each post records the run that last saw it: a post ID seen again in the same
+    run is a repeat and is dropped, while a new run (e.g. reprocessing the raw
+    data) gets every post's stored verdict back.
+    """
+
+    def __init__(
+            self,
+            path: Optional[Path] = None,
+            hasher: Optional[MinHasher] = None,
+            config: Optional[Config] = None
+    ):
+        """
+        Args:
+            path: Database file, defaults to PROCESSED_DATA_DIR/dedupe_index.sqlite
+            hasher: Optional MinHasher, configured from dedupe.* by default
+            config: Optional Config instance
+        """
+        config = config or Config()
+        self.hasher = hasher or MinHasher(config.get("dedupe.num_perm", 128), config.get("dedupe.shingle_size", 3))
+        self.bands: int = config.get("dedupe.bands", 16)
+        self.threshold: float = config.get("dedupe.threshold", 0.8)
+        self.action = DuplicateAction(config.get("dedupe.action", DuplicateAction.MARK.value))
+        if self.hasher.num_perm % self.bands:
+            raise ConfigurationException(
+                f"dedupe.num_perm ({self.hasher.num_perm}) must be a multiple of dedupe.bands ({self.bands})")
+        self.rows = self.hasher.num_perm // self.bands
+        self.path = Path(path or PROCESSED_DATA_DIR / DEDUPE_INDEX_FILENAME)
+        self.logger = LogManager().get_logger(self.__class__.__name__)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self._db = sqlite3.connect(self.path)
+            self._db.executescript("""
+                PRAGMA journal_mode = WAL;
+                PRAGMA synchronous = NORMAL;
+                CREATE TABLE IF NOT EXISTS signatures (
+                    id TEXT PRIMARY KEY,
+                    signature BLOB NOT NULL,
+                    duplicate_of TEXT,
+                    run TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS buckets (
+                    key INTEGER NOT NULL,
+                    id TEXT NOT NULL,
+                    PRIMARY KEY (key, id)
+                ) WITHOUT ROWID;
+            """)
+        except sqlite3.Error as e:
+            raise StorageException(f"Failed to open dedupe index {self.path}: {e}") from e
+        self.run = uuid.uuid4().hex
+
+    def new_run(self) -> None:
+        """Start a new run, in which every indexed post may be seen once more"""
+        self.run = uuid.uuid4().hex
+
+    def band_keys(self, signature: array) -> List[int]:
+        """Hash of each band of a signature, salted with the band number"""
+        data = signature.tobytes()
+        width = self.rows * signature.itemsize
+        return [
+            int.from_bytes(hashlib.blake2b(data[band * width:(band + 1) * width], digest_size=8,
+                                           salt=band.to_bytes(8, "little")).digest(), "little", signed=True)
+            for band in range(self.bands)
+        ]
+
+    def _match(self, signature: array, keys: List[int]) -> Optional[str]:
+        placeholders = ",".join("?" * len(keys))
+        rows = self._db.execute(
+            f"SELECT id, signature FROM signatures WHERE id IN "
+            f"(SELECT id FROM buckets WHERE key IN ({placeholders}))", keys).fetchall()
+        best, best_similarity = None, self.threshold
+        for candidate_id, blob in rows:
+            score = similarity(signature, array(SIGNATURE_TYPECODE, blob))
+            if score >= best_similarity:
+                best, best_similarity = candidate_id, score
+        return best
+
+    def add(self, record_id: str, text: str) -> Optional[str]:
+        """
+        Index a post and find what it duplicates.
+
+        Args:
+            record_id: ID of the post
+            text: Text of the post
+
+        Returns:
+            ID of the first post of its cluster if it is a near-duplicate, the
+            post's own ID if it was already seen in this run, else None
+        """
+        row = self._db.execute("SELECT duplicate_of, run FROM signatures WHERE id = ?", (record_id,)).fetchone()
+        if row is not None:
+            duplicate_of, run = row
+            if run == self.run:
+                return record_id
+            # Indexed by an earlier run, e.g. the raw data is processed again
+            self._db.execute("UPDATE signatures SET run = ? WHERE id = ?", (self.run, record_id))
+            return duplicate_of
+        signature = self.hasher.signature(text)
+        if signature is None:
+            return None
+        keys = self.band_keys(signature)
+        duplicate_of = self._match(signature, keys)
+        self._db.execute("INSERT INTO signatures VALUES (?, ?, ?, ?)",
+                         (record_id, signature.tobytes(), duplicate_of, self.run))
+        if duplicate_of is None:
+            self._db.executemany("INSERT INTO buckets VALUES (?, ?)", [(key, record_id) for key in keys])
+        return duplicate_of
+
+    def dedupe(
+            self,
+            records: Iterable[Any],
+            action: Optional[DuplicateAction] = None,
+            text_field: str = "text"
+    ) -> List[Any]:
+        """
+        Find near-duplicates in a batch of records, against the index and each
+        other, in one transaction. Repeats of a post already seen in this run are
+        always dropped.
+
+        Args:
+            records: Dicts or records with "id" and text_field
+            action: mark sets duplicate_of on duplicates, drop leaves them out;
+                defaults to dedupe.action
+            text_field: Field holding the text
+
+        Returns:
+            The batch, marked or without its duplicates
+        """
+        action = action or self.action
+        result = []
+        try:
+            with self._db:
+                for record in records:
+                    record_id, text = record.get("id"), record.get(text_field)
+                    if record_id is None or not text:
+                        result.append(record)
+                        continue
+                    record_id = str(record_id)
+                    duplicate_of = self.add(record_id, text)
+                    if duplicate_of == record_id:
+                        continue
+                    if duplicate_of is None:
+                        result.append(record)
+                    elif action is DuplicateAction.MARK:
+                        if isinstance(record, dict):
+                            record["duplicate_of"] = duplicate_of
+                        else:
+                            record.duplicate_of = duplicate_of
+                        result.append(record)
+        except sqlite3.Error as e:
+            raise StorageException(f"Dedupe index update failed: {e}") from e
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """Number of indexed posts and of near-duplicates among them"""
+        total, duplicates = self._db.execute(
+            "SELECT COUNT(*), COUNT(duplicate_of) FROM signatures").fetchone()
+        return {"posts": total, "duplicates": duplicates}
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> DedupeIndex:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+
+def dedupe_dataset(
+        dataset: str,
+        index: Optional[DedupeIndex] = None,
+        raw_dir: Optional[Path] = None,
+        processed_dir: Optional[Path] = None,
+        config: Optional[Config] = None
+) -> Dict[str, int]:
+    """
+    Dedupe stage of the raw to processed pipeline: stream a raw dataset's JSON
+    lines through the index in batches of dedupe.batch_size and write them to
+    the processed dataset, marked or without their near-duplicates as set by
+    dedupe.action. The processed dataset is written to a temporary file renamed
+    over it at the end, so running the stage again replaces its output.
+
+    Args:
+        dataset: Dataset name, e.g. "posts"
+        index: Optional open index, opened at its default path otherwise
+        raw_dir: Directory of raw datasets, defaults to RAW_DATA_DIR
+        processed_dir: Directory of processed datasets, defaults to PROCESSED_DATA_DIR
+
+    Returns:
+        Dict with the number of records read and written
+    """
+    config = config or Config()
+    batch_size: int = config.get("dedupe.batch_size", 1000)
+    source = RecordWriter(raw_dir or RAW_DATA_DIR).path_for(dataset)
+    if not source.exists():
+        raise StorageException(f"No raw data for dataset {dataset} at {source}")
+    writer = RecordWriter(processed_dir or PROCESSED_DATA_DIR)
+    partial = f"{dataset}.partial"
+    writer.path_for(partial).unlink(missing_ok=True)
+    own_index = index is None
+    index = index or DedupeIndex(config=config)
+    index.new_run()
+    counts = {"read": 0, "written": 0}
+
+    def flush(batch: List[Dict[str, Any]]) -> None:
+        kept = index.dedupe(batch)
+        if kept:
+            writer.write_batch(partial, kept)
+        counts["read"] += len(batch)
+        counts["written"] += len(kept)
+
+    try:
+        with open(source, "r", encoding="utf-8") as f:
+            batch: List[Dict[str, Any]] = []
+            for line in f:
+                if line.strip():
+                    batch.append(json.loads(line))
+                if len(batch) >= batch_size:
+                    flush(batch)
+                    batch = []
+            if batch:
+                flush(batch)
+        writer.close()
+        partial_path = writer.path_for(partial)
+        partial_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path.touch()
+        os.replace(partial_path, writer.path_for(dataset))
+    finally:
+        writer.close()
+        writer.path_for(partial).unlink(missing_ok=True)
+        if own_index:
+            index.close()
+    index.logger.info(
+        f"Deduped {dataset}: {counts['read']} records read, {counts['written']} written")
+    return counts
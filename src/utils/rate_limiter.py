@@ -0,0 +1,71 @@
+# src/utils/rate_limiter.py
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from src.core.config import Config
+from src.core.constants import MS_PER_SECOND
+
+
+class RateLimiter:
+    """
+    Async rate limiter enforcing a maximum number of requests per sliding window
+    and a minimum delay between consecutive requests.
+    Shared by every fetch path of a platform, browser or HTTP.
+    """
+
+    def __init__(self, max_requests: int, window_s: float = 3600, min_interval_ms: int = 0):
+        if max_requests <= 0:
+            raise ValueError("max_requests must be positive")
+        self.max_requests = max_requests
+        self.window_s = window_s
+        self.min_interval_s = min_interval_ms / MS_PER_SECOND
+        self._sent: Deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    def _wait_time(self, now: float) -> float:
+        while self._sent and now - self._sent[0] >= self.window_s:
+            self._sent.popleft()
+
+        wait = 0.0
+        if len(self._sent) >= self.max_requests:
+            wait = self._sent[0] + self.window_s - now
+        if self._sent:
+            wait = max(wait, self._sent[-1] + self.min_interval_s - now)
+        return wait
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent and record it"""
+        async with self._lock:
+            wait = self._wait_time(time.monotonic())
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self._wait_time(time.monotonic())
+            self._sent.append(time.monotonic())
+
+    async def __aenter__(self) -> RateLimiter:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return False
+
+
+_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(platform: str, config: Optional[Config] = None) -> RateLimiter:
+    """Return the rate limiter shared by all fetchers of a platform"""
+    limiter = _limiters.get(platform)
+    if limiter is None:
+        config = config or Config()
+        limits = config.get(f"platforms.{platform}.rate_limits", {})
+        limiter = RateLimiter(
+            max_requests=limits.get("requests_per_hour", 100),
+            min_interval_ms=limits.get("delay_between_requests_ms", 0)
+        )
+        _limiters[platform] = limiter
+    return limiter
@@ -0,0 +1,243 @@
+# src/utils/retry.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple, Type, TypeVar
+
+from src.core.constants import MS_PER_SECOND
+from src.core.exceptions import FetcherException, DeadlineExceededException, RetriesExhaustedException
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Decides whether a failed attempt is retried and how long to back off.
+    Delays grow exponentially and use full jitter, so workers failing together
+    spread their retries out instead of hitting the target again in lockstep.
+    FetcherExceptions are retried only if their class is marked retryable, and
+    never sooner than their retry_after hint.
+    """
+    attempts: int = 3
+    base_delay_ms: int = 5000
+    max_delay_ms: int = 60000
+    multiplier: float = 2.0
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,)
+    give_up_on: Tuple[Type[BaseException], ...] = ()
+
+    @classmethod
+    def from_config(cls, retry_config: Optional[Dict[str, Any]] = None, **overrides) -> RetryPolicy:
+        """
+        Build a policy from a fetcher.retry configuration section
+        Args:
+            retry_config: Mapping with attempts, delay_ms, max_delay_ms and multiplier
+            **overrides: Field values taking precedence over the configuration
+        """
+        retry_config = retry_config or {}
+        policy = cls(
+            attempts=retry_config.get("attempts", cls.attempts),
+            base_delay_ms=retry_config.get("delay_ms", cls.base_delay_ms),
+            max_delay_ms=retry_config.get("max_delay_ms", cls.max_delay_ms),
+            multiplier=retry_config.get("multiplier", cls.multiplier)
+        )
+        return replace(policy, **overrides) if overrides else policy
+
+    def with_overrides(self, **overrides) -> RetryPolicy:
+        """Return a copy of the policy with some fields replaced"""
+        overrides = {k: v for k, v in overrides.items() if v is not None}
+        return replace(self, **overrides) if overrides else self
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Check whether an exception is worth another attempt"""
+        if not isinstance(exc, self.retry_on) or isinstance(exc, self.give_up_on):
+            return False
+        return exc.retryable if isinstance(exc, FetcherException) else True
+
+    def backoff_ms(self, attempt: int, rng: random.Random = random) -> float:
+        """
+        Delay before the next attempt, drawn uniformly between zero and the
+        exponential ceiling for this attempt (full jitter)
+        Args:
+            attempt: Number of the attempt that just failed, starting at 1
+            rng: Random source, injectable for deterministic tests
+        """
+        ceiling = min(self.max_delay_ms, self.base_delay_ms * self.multiplier ** (attempt - 1))
+        return rng.uniform(0, ceiling)
+
+    def backoff_seconds(self, attempt: int, rng: random.Random = random) -> float:
+        return self.backoff_ms(attempt, rng) / MS_PER_SECOND
+
+    def delay_for(self, exc: BaseException, attempt: int, rng: random.Random = random) -> float:
+        """Seconds to wait before retrying exc, honouring its retry_after hint"""
+        delay = self.backoff_seconds(attempt, rng)
+        retry_after = getattr(exc, "retry_after", None)
+        return delay if retry_after is None else max(delay, retry_after)
+
+
+class RetryBudget:
+    """
+    Caps the total number of retries a job may spend across all its operations,
+    so a burst of failures cannot consume the job's throughput.
+    """
+
+    def __init__(self, max_retries: int):
+        self.max_retries = max_retries
+        self.spent = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.max_retries - self.spent)
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget, returning False if it is exhausted"""
+        with self._lock:
+            if self.spent >= self.max_retries:
+                return False
+            self.spent += 1
+            return True
+
+
+class Deadline:
+    """
+    Point in time by which an operation must finish.
+    Waits derive their timeouts from the remaining time instead of fixed values.
+    One deadline is created per fetch and handed to every phase (navigation, auth,
+    scrolling, extraction), which also records how long each phase took.
+    """
+
+    def __init__(self, timeout_s: Optional[float] = None):
+        self.started_at = time.monotonic()
+        self.expires_at: Optional[float] = None if timeout_s is None else self.started_at + timeout_s
+        self.phases: Dict[str, float] = {}
+
+    @classmethod
+    def after_ms(cls, timeout_ms: Optional[float]) -> Deadline:
+        return cls(None if timeout_ms is None else timeout_ms / MS_PER_SECOND)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, None for an unbounded deadline"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def timeout_s(self, cap_s: Optional[float] = None) -> Optional[float]:
+        """The smaller of the remaining time and an optional cap"""
+        remaining = self.remaining()
+        if remaining is None:
+            return cap_s
+        return remaining if cap_s is None else min(remaining, cap_s)
+
+    def timeout_ms(self, cap_ms: Optional[float] = None) -> Optional[float]:
+        """timeout_s in milliseconds, as Playwright expects; a zero timeout would wait forever"""
+        timeout = self.timeout_s(None if cap_ms is None else cap_ms / MS_PER_SECOND)
+        return None if timeout is None else max(1.0, timeout * MS_PER_SECOND)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[Deadline]:
+        """
+        Run a phase of the operation under this deadline, recording its duration
+        in seconds under phases[name]
+        Raises:
+            DeadlineExceededException: If the deadline passed before the phase started
+        """
+        self.check(name)
+        start = time.monotonic()
+        try:
+            yield self
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.monotonic() - start
+
+    def check(self, operation: str = "operation") -> None:
+        """Raise if the deadline has passed"""
+        if self.expired:
+            raise DeadlineExceededException(f"Deadline exceeded before {operation}")
+
+
+async def with_timeout(
+        awaitable: Awaitable[T],
+        timeout_s: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
+        operation: str = "operation"
+) -> T:
+    """
+    Await with a timeout bounded by both timeout_s and the deadline, without blocking
+    the event loop
+    Raises:
+        DeadlineExceededException: If the operation does not finish in time
+    """
+    if deadline is not None:
+        timeout_s = deadline.timeout_s(timeout_s)
+    try:
+        return await asyncio.wait_for(awaitable, timeout=timeout_s)
+    except asyncio.TimeoutError as e:
+        raise DeadlineExceededException(f"{operation} timed out after {timeout_s:.2f}s") from e
+
+
+async def retry_async(
+        func: Callable[..., Awaitable[T]],
+        *args,
+        policy: Optional[RetryPolicy] = None,
+        budget: Optional[RetryBudget] = None,
+        deadline: Optional[Deadline] = None,
+        logger: Optional[logging.Logger] = None,
+        on_refresh: Optional[Callable[[], Awaitable[Any]]] = None,
+        **kwargs
+) -> T:
+    """
+    Run a coroutine function with retries. Backoffs are awaited, so a task waiting
+    to retry holds no thread and other tasks on the loop keep making progress.
+
+    Args:
+        func: Coroutine function to run
+        policy: Retry policy, defaults to RetryPolicy()
+        budget: Optional retry budget shared by the job
+        deadline: Optional deadline; no retry is started that could not finish in time
+        logger: Optional logger for retry warnings
+        on_refresh: Optional coroutine function renewing the session, awaited before
+            retrying an exception marked refresh_session
+
+    Raises:
+        RetriesExhaustedException: When attempts or the budget are exhausted
+        DeadlineExceededException: When the deadline leaves no room for another attempt
+    """
+    policy = policy or RetryPolicy()
+    for attempt in range(1, policy.attempts + 1):
+        if deadline is not None:
+            deadline.check(getattr(func, "__name__", "operation"))
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            if not policy.is_retryable(e):
+                raise
+            if attempt == policy.attempts:
+                raise RetriesExhaustedException(
+                    f"Operation failed after {policy.attempts} attempts", cause=e) from e
+            if budget is not None and not budget.try_spend():
+                raise RetriesExhaustedException(
+                    f"Operation failed after {attempt} attempts, retry budget exhausted",
+                    {"budget": budget.max_retries},
+                    cause=e
+                ) from e
+
+            delay = policy.delay_for(e, attempt)
+            if deadline is not None and deadline.timeout_s(delay) < delay:
+                raise DeadlineExceededException(
+                    f"No time left to retry after attempt {attempt}/{policy.attempts}") from e
+            if logger is not None:
+                logger.warning(f"Attempt {attempt}/{policy.attempts} failed: {e}, retrying in {delay:.2f}s...")
+            await asyncio.sleep(delay)
+            if on_refresh is not None and getattr(e, "refresh_session", False):
+                await on_refresh()
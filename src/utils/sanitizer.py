@@ -0,0 +1,128 @@
+# src/utils/sanitizer.py
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any, Dict, List, Union
+
+from src.core.types import Record, RecordBatch, StringColumn
+
+# Returned for values dropped from their container
+_DROP = object()
+
+
+def _build_translation() -> Dict[int, Any]:
+    """
+    Translation table deleting control characters and mapping exotic whitespace
+    to plain spaces and newlines.
+    """
+    # C0 and C1 control characters, the whole of Unicode category Cc
+    table: Dict[int, Any] = dict.fromkeys((*range(0x20), *range(0x7F, 0xA0)))
+    # Zero-width characters and BOMs scraped from markup
+    table.update(dict.fromkeys((0x200B, 0x200C, 0x200D, 0x2060, 0xFEFF)))
+    table.update(dict.fromkeys((0x09, 0x0B, 0x0C, 0xA0, 0x1680, *range(0x2000, 0x200B), 0x202F, 0x205F, 0x3000), " "))
+    # Lone carriage returns (old Mac line ends) break lines too; \r\n is collapsed before translating
+    table.update(dict.fromkeys((0x0A, 0x0D, 0x85, 0x2028, 0x2029), "\n"))
+    return table
+
+
+TRANSLATION = _build_translation()
+
+
+def sanitize_text(value: str) -> str:
+    """
+    Strip a string and normalize its whitespace: control characters are removed,
+    tabs and non-breaking or typographic spaces become plain spaces, and line
+    separators become newlines. Clean strings are returned as is.
+    """
+    if value.isprintable():
+        # Line breaks, tabs and non-ASCII spaces all fail isprintable(), so clean text skips translate()
+        return value.strip()
+    clean = value.replace("\r\n", "\n") if "\r" in value else value
+    clean = clean.translate(TRANSLATION).strip()
+    return value if clean == value else clean
+
+
+def _sanitize_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    # Copy on write: the dict is only rebuilt from the first changed or dropped value
+    result = None
+    for index, (key, value) in enumerate(data.items()):
+        clean = _DROP if value is None else sanitize_value(value)
+        if result is None:
+            if clean is value:
+                continue
+            result = dict(islice(data.items(), index))
+        if clean is not _DROP:
+            result[key] = clean
+    return data if result is None else result
+
+
+def _sanitize_list(data: List[Any]) -> List[Any]:
+    result = None
+    for index, value in enumerate(data):
+        clean = sanitize_value(value)
+        if result is None:
+            if clean is value:
+                continue
+            result = data[:index]
+        result.append(clean)
+    return data if result is None else result
+
+
+def _sanitize_record(record: Record) -> Record:
+    for name in record.__slots__:
+        value = getattr(record, name)
+        if value is not None and type(value) not in (int, float, bool):
+            clean = sanitize_value(value)
+            if clean is not value:
+                setattr(record, name, clean)
+    return record
+
+
+def _sanitize_column(column: StringColumn) -> StringColumn:
+    result = None
+    for index, value in enumerate(column):
+        clean = value if value is None else sanitize_text(value)
+        if result is None:
+            if clean == value:
+                continue
+            result = column.take(range(index))
+        result.append(clean)
+    return column if result is None else result
+
+
+def sanitize_value(value: Any) -> Any:
+    """
+    Sanitize an extracted value: strings are normalized, dicts and lists are
+    sanitized recursively and None values are dropped from dicts. Values that
+    are already clean are returned as they are, and containers are only copied
+    when something in them changes. Records are sanitized in place.
+    """
+    kind = type(value)
+    if kind is str:
+        return sanitize_text(value)
+    if kind is dict:
+        return _sanitize_dict(value)
+    if kind is list:
+        return _sanitize_list(value)
+    if isinstance(value, Record):
+        return _sanitize_record(value)
+    return value
+
+
+def sanitize_batch(records: Union[List[Any], RecordBatch]) -> Union[List[Any], RecordBatch]:
+    """
+    Sanitize a batch of records in one pass.
+
+    Args:
+        records: Dicts or records extracted together, or a RecordBatch whose
+            string columns are then sanitized column by column
+
+    Returns:
+        The sanitized batch, the input itself when it was already clean
+    """
+    if isinstance(records, RecordBatch):
+        for name, column in records.columns.items():
+            if isinstance(column, StringColumn):
+                records.columns[name] = _sanitize_column(column)
+        return records
+    return _sanitize_list(records)
@@ -0,0 +1,397 @@
+# src/utils/storage.py
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, List, Optional, Tuple, Union
+
+from src.core.config import Config
+from src.core.constants import RAW_DATA_DIR, STATE_DIR
+from src.core.exceptions import StorageException
+from src.core.log_manager import LogManager
+from src.core.types import Record, RecordBatch
+
+# Marks the end of the queue for the writer thread
+_STOP = object()
+
+HIGH_WATER_MARKS_FILENAME = "high_water_marks.json"
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """
+    Write compact JSON to a temporary file and rename it over the target,
+    so readers never observe a partially written file
+    Args:
+        path: Destination file
+        data: JSON-serializable data
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def read_json(path: Path, default: Any = None) -> Any:
+    """Read a JSON file, returning default if it does not exist"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+class RecordWriter:
+    """
+    Appends records as JSON lines to one file per dataset.
+    File handles are kept open between batches so every write is a plain append.
+    """
+
+    def __init__(self, base_dir: Optional[Path] = None, encoding: str = "utf-8"):
+        self.base_dir: Path = Path(base_dir or RAW_DATA_DIR)
+        self.encoding = encoding
+        # Called with a dataset and its file size before the writer first opens it
+        self.on_open: Optional[Callable[[str, int], None]] = None
+        self._handles: Dict[str, IO[str]] = {}
+
+    def path_for(self, dataset: str) -> Path:
+        """Return the file path records of a dataset are appended to"""
+        return self.base_dir / f"{dataset}.jsonl"
+
+    def size(self, dataset: str) -> int:
+        """Size of a dataset file on disk, 0 if it does not exist"""
+        path = self.path_for(dataset)
+        return path.stat().st_size if path.exists() else 0
+
+    def _handle(self, dataset: str) -> IO[str]:
+        handle = self._handles.get(dataset)
+        if handle is None:
+            path = self.path_for(dataset)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if self.on_open is not None:
+                self.on_open(dataset, self.size(dataset))
+            handle = open(path, "a", encoding=self.encoding)
+            self._handles[dataset] = handle
+        return handle
+
+    def write_batch(self, dataset: str, records: Union[List[Union[Dict[str, Any], Record]], RecordBatch]) -> None:
+        """
+        Append a batch of records to a dataset
+        Args:
+            dataset: Dataset name, may contain '/' to nest under the base directory
+            records: Records to append: dicts, objects with to_dict() such as record types, or a RecordBatch
+        """
+        if isinstance(records, RecordBatch):
+            records = records.to_dicts()
+        lines = [
+            json.dumps(record if isinstance(record, dict) else record.to_dict(),
+                       ensure_ascii=False, separators=(",", ":"))
+            for record in records
+        ]
+        handle = self._handle(dataset)
+        handle.write("\n".join(lines))
+        handle.write("\n")
+
+    def flush(self) -> None:
+        """Flush all open dataset files"""
+        for handle in self._handles.values():
+            handle.flush()
+
+    def offsets(self) -> Dict[str, int]:
+        """Flush and return the size of every open dataset file, for checkpoints"""
+        self.flush()
+        return {dataset: handle.tell() for dataset, handle in self._handles.items()}
+
+    def truncate_to(self, offsets: Dict[str, int]) -> None:
+        """
+        Cut dataset files back to checkpointed sizes, dropping records written after
+        the checkpoint that a resumed job will fetch again
+        """
+        for dataset, offset in offsets.items():
+            handle = self._handles.pop(dataset, None)
+            if handle is not None:
+                handle.close()
+            path = self.path_for(dataset)
+            if path.exists() and path.stat().st_size > offset:
+                with open(path, "r+b") as f:
+                    f.truncate(offset)
+
+    def close(self) -> None:
+        """Flush and close all open dataset files"""
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
+
+class _Barrier:
+    """Queue marker; the writer thread fills offsets once everything before it is written"""
+    __slots__ = ("done", "offsets")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.offsets: Dict[str, int] = {}
+
+
+class WriteBehindBuffer:
+    """
+    Bounded write-behind queue between fetchers and a RecordWriter.
+
+    Fetchers hand records off with submit() and return immediately while a dedicated
+    writer thread drains the queue in batches. When the queue is full, submit() blocks
+    (or submit_async() yields) until the writer catches up, so a slow disk slows
+    fetching down instead of growing memory.
+    """
+
+    def __init__(
+            self,
+            writer: Optional[RecordWriter] = None,
+            max_pending: Optional[int] = None,
+            batch_size: Optional[int] = None,
+            config: Optional[Config] = None
+    ):
+        config = config or Config()
+        self.writer = writer or RecordWriter()
+        self.max_pending: int = max_pending or config.get("storage.write_behind.max_pending", 10000)
+        self.batch_size: int = batch_size or config.get("storage.write_behind.batch_size", 500)
+        self.logger = LogManager().get_logger(self.__class__.__name__)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=self.max_pending)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self.written = 0
+
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """Number of records waiting to be written"""
+        return self._queue.qsize()
+
+    def _check_usable(self) -> None:
+        if self._closed:
+            raise StorageException("Write-behind buffer is closed")
+        if self._error is not None:
+            raise StorageException(
+                f"Write-behind writer failed: {self._error}",
+                {"exception_type": type(self._error).__name__}
+            ) from self._error
+
+    def submit(self, dataset: str, record: Dict[str, Any], timeout: Optional[float] = None) -> None:
+        """
+        Hand a record off to the writer thread
+        Args:
+            dataset: Dataset the record belongs to
+            record: Record to persist
+            timeout: Seconds to wait for space when the buffer is full, None waits forever
+        Raises:
+            StorageException: If the buffer is closed, the writer failed or the timeout expired
+        """
+        self._check_usable()
+        try:
+            self._queue.put((dataset, record), timeout=timeout)
+        except queue.Full:
+            raise StorageException(
+                "Write-behind buffer is full",
+                {"pending": self.pending, "max_pending": self.max_pending}
+            )
+
+    async def _put_async(self, item: Any, poll_interval: float) -> None:
+        self._check_usable()
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                await asyncio.sleep(poll_interval)
+                self._check_usable()
+
+    async def submit_async(self, dataset: str, record: Dict[str, Any], poll_interval: float = 0.01) -> None:
+        """
+        Hand a record off without blocking the event loop.
+        When the buffer is full the calling task yields until space frees up.
+        """
+        await self._put_async((dataset, record), poll_interval)
+
+    def checkpoint(self) -> Dict[str, int]:
+        """
+        Block until every record submitted so far is written, and return the size
+        of each open dataset file at that point. Records submitted meanwhile by
+        other producers are not included.
+        """
+        self._check_usable()
+        barrier = _Barrier()
+        self._queue.put(barrier)
+        barrier.done.wait()
+        self._check_usable()
+        return barrier.offsets
+
+    async def checkpoint_async(self, poll_interval: float = 0.01) -> Dict[str, int]:
+        """checkpoint() for async callers, waiting without blocking the event loop"""
+        barrier = _Barrier()
+        await self._put_async(barrier, poll_interval)
+        await asyncio.to_thread(barrier.done.wait)
+        self._check_usable()
+        return barrier.offsets
+
+    def flush(self) -> None:
+        """Block until every submitted record has been written"""
+        self._queue.join()
+        if self._error is not None:
+            self._check_usable()
+
+    def close(self) -> None:
+        """Flush all pending records, stop the writer thread and close the writer"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self.writer.close()
+        self.logger.debug(f"Write-behind buffer closed after {self.written} records")
+        if self._error is not None:
+            raise StorageException(f"Write-behind writer failed: {self._error}") from self._error
+
+    def _next_batch(self) -> Tuple[Dict[str, List[Dict[str, Any]]], int, bool, Optional[_Barrier]]:
+        """Block for one item, then drain up to batch_size items without waiting, up to a barrier"""
+        batches: Dict[str, List[Dict[str, Any]]] = {}
+        taken = 0
+        stop = False
+        barrier = None
+        item = self._queue.get()
+        while True:
+            taken += 1
+            if item is _STOP:
+                stop = True
+                break
+            if isinstance(item, _Barrier):
+                barrier = item
+                break
+            dataset, record = item
+            batches.setdefault(dataset, []).append(record)
+            if taken >= self.batch_size:
+                break
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+        return batches, taken, stop, barrier
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batches, taken, stop, barrier = self._next_batch()
+            try:
+                if self._error is None:
+                    for dataset, records in batches.items():
+                        self.writer.write_batch(dataset, records)
+                        self.written += len(records)
+                    self.writer.flush()
+                    if barrier is not None:
+                        barrier.offsets = self.writer.offsets()
+            except Exception as e:
+                # Keep draining so producers and flush() never deadlock on a dead writer
+                self._error = e
+                LogManager().log_exception(self.logger, e, "Write-behind writer failed")
+            finally:
+                if barrier is not None:
+                    barrier.done.set()
+                for _ in range(taken):
+                    self._queue.task_done()
+
+    def __enter__(self) -> WriteBehindBuffer:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+
+class HighWaterMarks:
+    """
+    Newest content seen per source (group, profile...), so incremental runs stop
+    as soon as they reach items stored by an earlier run.
+
+    A mark holds the newest item timestamp and the IDs of the most recent items,
+    for feeds without usable timestamps. Items observed during a run only move
+    the marks on commit(), which callers run once the items are durably written,
+    so a crashed run never skips content it did not store.
+    """
+
+    def __init__(self, path: Optional[Path] = None, recent_ids: Optional[int] = None,
+                 config: Optional[Config] = None):
+        """
+        Args:
+            path: JSON file holding the marks, defaults to STATE_DIR/high_water_marks.json
+            recent_ids: Number of newest item IDs kept per source
+            config: Optional Config instance
+        """
+        config = config or Config()
+        self.path = Path(path or STATE_DIR / HIGH_WATER_MARKS_FILENAME)
+        self.recent_ids: int = recent_ids or config.get("storage.high_water_marks.recent_ids", 50)
+        self._marks: Dict[str, Dict[str, Any]] = read_json(self.path, {})
+        self._seen_ids: Dict[str, set] = {}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, source: str) -> Optional[Dict[str, Any]]:
+        """The committed mark of a source: timestamp, ids and updated_at"""
+        return self._marks.get(source)
+
+    def is_seen(self, source: str, timestamp: Optional[float] = None, item_id: Optional[str] = None) -> bool:
+        """
+        Check whether an item is below the source's committed mark. Items sharing
+        the mark's timestamp are only seen if their ID is among the mark's IDs, so
+        new items posted in the same second as the newest stored one are kept.
+        """
+        mark = self._marks.get(source)
+        if mark is None:
+            return False
+        if timestamp is not None and mark.get("timestamp") is not None and timestamp != mark["timestamp"]:
+            return timestamp < mark["timestamp"]
+        if item_id is None:
+            return False
+        seen = self._seen_ids.get(source)
+        if seen is None:
+            seen = self._seen_ids[source] = set(mark.get("ids", []))
+        return str(item_id) in seen
+
+    def observe(self, source: str, timestamp: Optional[float] = None, item_id: Optional[str] = None) -> None:
+        """Note an item fetched in this run; it moves the mark on the next commit()"""
+        with self._lock:
+            pending = self._pending.setdefault(source, {"timestamp": None, "ids": []})
+            if timestamp is not None and (pending["timestamp"] is None or timestamp > pending["timestamp"]):
+                pending["timestamp"] = timestamp
+            if item_id is not None:
+                pending["ids"].append(str(item_id))
+
+    def commit(self) -> None:
+        """Fold the observed items into the marks and persist them atomically"""
+        with self._lock:
+            if not self._pending:
+                return
+            for source, pending in self._pending.items():
+                mark = self._marks.get(source, {"timestamp": None, "ids": []})
+                if pending["timestamp"] is not None and (
+                        mark["timestamp"] is None or pending["timestamp"] > mark["timestamp"]):
+                    mark["timestamp"] = pending["timestamp"]
+                # Feeds list the newest items first, so they lead the kept IDs
+                ids = list(dict.fromkeys(pending["ids"] + mark["ids"]))
+                mark["ids"] = ids[:self.recent_ids]
+                mark["updated_at"] = time.time()
+                self._marks[source] = mark
+                self._seen_ids.pop(source, None)
+            self._pending.clear()
+            write_json_atomic(self.path, self._marks)
@@ -0,0 +1,392 @@
+# src/utils/validation.py
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import random
+import re
+import time
+from dataclasses import MISSING, dataclass, fields as record_fields
+from pathlib import Path
+from typing import (
+    Any, Callable, Collection, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Type, Union,
+    get_args, get_origin, get_type_hints
+)
+
+from src.core.config import Config
+from src.core.constants import MS_PER_SECOND, STATE_DIR, ValidationMode
+from src.core.exceptions import ConfigurationException, ValidationException
+from src.core.log_manager import LogManager
+from src.core.types import Comment, Post, Profile, Record, RecordBatch
+from src.utils.storage import read_json, write_json_atomic
+
+EXTRACTOR_CHANGES_FILENAME = "extractor_changes.json"
+
+# Accepted Python types per annotated field type
+ACCEPTED_TYPES = {str: (str,), int: (int,), float: (int, float), bool: (bool,)}
+
+
+class FieldError(NamedTuple):
+    """A field of a record that failed validation"""
+    index: int
+    field: str
+    message: str
+
+
+BatchValidator = Callable[[Iterable[Any]], List[FieldError]]
+FieldCheck = Callable[[Any], Optional[str]]
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    Constraints of one field.
+
+    Attributes:
+        types: Accepted types of non-null values
+        required: Whether the field must be present and not None
+        pattern: Regular expression string values must fully match
+        choices: Allowed values
+    """
+    types: Tuple[type, ...] = (str,)
+    required: bool = False
+    pattern: Optional[str] = None
+    choices: Optional[FrozenSet[Any]] = None
+
+
+class Schema:
+    """
+    Declared fields of a record type, compiled into a validator.
+
+    The schema is turned into the source of a function with one straight-line
+    block of checks per field, so validating a batch costs a lookup and a few
+    comparisons per field of each record rather than a walk over the schema.
+    Records may be dicts or record types; every error in the batch is collected
+    in the same pass.
+    """
+
+    def __init__(self, name: str, fields: Dict[str, FieldSpec]):
+        """
+        Args:
+            name: Schema name, used in error messages
+            fields: Constraints per field name
+        """
+        self.name = name
+        self.fields = dict(fields)
+        self.source: Optional[str] = None
+        self._validator: Optional[BatchValidator] = None
+        self._field_checks: Dict[str, Optional[FieldCheck]] = {}
+
+    @classmethod
+    def for_record(cls, record_type: Type[Record], **overrides: FieldSpec) -> Schema:
+        """
+        Derive a schema from a record type's annotations: fields without a default
+        are required. Fields can be constrained further with overrides.
+        """
+        hints = get_type_hints(record_type)
+        fields = {}
+        for field in record_fields(record_type):
+            hint = hints[field.name]
+            if get_origin(hint) is Union:
+                hint = next(arg for arg in get_args(hint) if arg is not type(None))
+            fields[field.name] = FieldSpec(ACCEPTED_TYPES.get(hint, (hint,)), required=field.default is MISSING)
+        fields.update(overrides)
+        return cls(record_type.dataset, fields)
+
+    def with_fields(self, **overrides: FieldSpec) -> Schema:
+        """A copy of the schema with some fields redeclared"""
+        return Schema(self.name, {**self.fields, **overrides})
+
+    @property
+    def validator(self) -> BatchValidator:
+        """The compiled validator, built on first use"""
+        if self._validator is None:
+            self._validator = self.compile()
+        return self._validator
+
+    def _field_lines(self, number: int, name: str, spec: FieldSpec, namespace: Dict[str, Any], fail: str) -> List[str]:
+        """
+        Check lines for one field's value, calling fail.format(message=...) with
+        the expression of each error message.
+        """
+        namespace[f"types_{number}"] = spec.types
+        expected = " or ".join(t.__name__ for t in spec.types)
+        lines = ["if value is None:", "    " + (fail.format(message="'missing'") if spec.required else "pass")]
+        lines.append(f"elif not isinstance(value, types_{number}):")
+        lines.append("    " + fail.format(message=f"'expected {expected}, got ' + type(value).__name__"))
+        if spec.choices is not None:
+            namespace[f"choices_{number}"] = frozenset(spec.choices)
+            lines.append(f"elif value not in choices_{number}:")
+            lines.append("    " + fail.format(message="'unexpected value ' + repr(value)"))
+        if spec.pattern is not None:
+            if not all(issubclass(t, str) for t in spec.types):
+                raise ConfigurationException(f"Pattern on non-string field {self.name}.{name}")
+            namespace[f"match_{number}"] = re.compile(spec.pattern).fullmatch
+            lines.append(f"elif match_{number}(value) is None:")
+            lines.append("    " + fail.format(message=f"'does not match ' + {spec.pattern!r}"))
+        return lines
+
+    def compile(self) -> BatchValidator:
+        """
+        Generate and compile the validator function of the schema.
+
+        Returns:
+            A function taking an iterable of records and returning their errors
+        """
+        namespace: Dict[str, Any] = {"FieldError": FieldError}
+        lines = [
+            "def validate(records):",
+            "    errors = []",
+            "    append = errors.append",
+            "    for index, record in enumerate(records):",
+            "        get = record.get",
+        ]
+        for number, (name, spec) in enumerate(self.fields.items()):
+            lines.append(f"        value = get({name!r})")
+            fail = f"append(FieldError(index, {name!r}, {{message}}))"
+            lines.extend("        " + line for line in self._field_lines(number, name, spec, namespace, fail))
+        lines.append("    return errors")
+
+        self.source = "\n".join(lines)
+        exec(compile(self.source, f"<schema {self.name}>", "exec"), namespace)
+        return namespace["validate"]
+
+    def field_check(self, name: str) -> Optional[FieldCheck]:
+        """
+        The compiled check of a single field, returning the error message of a
+        value or None if it is valid. None for fields the schema does not declare.
+        """
+        if name not in self._field_checks:
+            spec = self.fields.get(name)
+            if spec is None:
+                self._field_checks[name] = None
+            else:
+                namespace: Dict[str, Any] = {}
+                lines = ["def check(value):"]
+                lines.extend("    " + line for line in self._field_lines(0, name, spec, namespace, "return {message}"))
+                lines.append("    return None")
+                exec(compile("\n".join(lines), f"<schema {self.name}.{name}>", "exec"), namespace)
+                self._field_checks[name] = namespace["check"]
+        return self._field_checks[name]
+
+    def check_field(self, name: str, value: Any, index: int = 0) -> None:
+        """
+        Validate one field's value.
+
+        Raises:
+            ValidationException: If the value violates the field's constraints
+        """
+        check = self.field_check(name)
+        message = check(value) if check is not None else None
+        if message is not None:
+            raise ValidationException(
+                f"Invalid {self.name}.{name}: {message}",
+                details={"index": index, "field": name, "message": message})
+
+    def validate(self, records: Union[Iterable[Any], RecordBatch]) -> List[FieldError]:
+        """
+        Validate a batch of records.
+
+        Args:
+            records: Dicts, record types or a RecordBatch
+
+        Returns:
+            Every error found in the batch, empty if all records are valid
+        """
+        if isinstance(records, RecordBatch):
+            records = records.to_dicts()
+        return self.validator(records)
+
+    def check(self, records: Union[Iterable[Any], RecordBatch]) -> None:
+        """
+        Validate a batch of records, raising if any record is invalid.
+
+        Raises:
+            ValidationException: With every error of the batch in details["errors"]
+        """
+        errors = self.validate(records)
+        if errors:
+            raise ValidationException(
+                f"{len(errors)} invalid field(s) in {self.name} batch",
+                details={"errors": [error._asdict() for error in errors]})
+
+
+def invalid_indices(errors: Collection[FieldError]) -> List[int]:
+    """Indices of the records with at least one error, in order"""
+    return sorted({error.index for error in errors})
+
+
+class LazyRecord:
+    """
+    A record validated field by field as it is read. Each field is checked on
+    first access, so fields no consumer reads are never validated.
+    """
+    __slots__ = ("record", "index", "_schema", "_checked")
+
+    def __init__(self, record: Union[Dict[str, Any], Record], schema: Schema, index: int = 0):
+        self.record = record
+        self.index = index
+        self._schema = schema
+        self._checked: Optional[set] = None
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        Field value by name, validated on first access.
+
+        Raises:
+            ValidationException: If the value violates the schema
+        """
+        value = self.record.get(name)
+        checked = self._checked
+        if checked is None:
+            checked = self._checked = set()
+        if name not in checked:
+            self._schema.check_field(name, value, self.index)
+            checked.add(name)
+        return default if value is None else value
+
+    def __getitem__(self, name: str) -> Any:
+        value = self.get(name, MISSING)
+        if value is MISSING:
+            raise KeyError(name)
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        value = self.get(name, MISSING)
+        if value is MISSING:
+            raise AttributeError(name)
+        return value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The wrapped record as a dict, without validating it"""
+        return self.record.to_dict() if isinstance(self.record, Record) else self.record
+
+
+def fingerprint(value: Any) -> str:
+    """Stable short hash of a JSON-serializable configuration"""
+    encoded = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class ExtractorChanges:
+    """
+    When each platform's extractor configuration (its selectors) last changed,
+    kept in STATE_DIR/extractor_changes.json. A platform seen for the first time
+    counts as changed.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or STATE_DIR / EXTRACTOR_CHANGES_FILENAME)
+        self._entries: Dict[str, Dict[str, Any]] = read_json(self.path, {})
+
+    def changed_at(self, platform: str, digest: str) -> float:
+        """
+        Time the platform's configuration changed to the one with this fingerprint.
+        Args:
+            platform: Platform name
+            digest: fingerprint() of the current extractor configuration
+        """
+        entry = self._entries.get(platform)
+        if entry is None or entry["fingerprint"] != digest:
+            entry = self._entries[platform] = {"fingerprint": digest, "changed_at": time.time()}
+            write_json_atomic(self.path, self._entries)
+        return entry["changed_at"]
+
+
+class ValidationResult(NamedTuple):
+    """
+    Outcome of validating a batch.
+
+    Attributes:
+        records: The batch, with records wrapped in LazyRecord in lazy mode
+        errors: Errors found, indexed by position in the batch
+        checked: Number of records fully validated
+    """
+    records: Sequence[Any]
+    errors: List[FieldError]
+    checked: int
+
+
+class RecordValidator:
+    """
+    Validates batches of a platform's records with the configured mode.
+
+    full validates every record; sample validates a random sample_rate of each
+    batch and falls back to the whole batch when the sample has errors; lazy
+    wraps records so only the fields consumers read are validated. For
+    strict_window_ms after the platform's selectors change, every batch is fully
+    validated whatever the mode, so a broken extractor is caught right away.
+    """
+
+    def __init__(
+            self,
+            schema: Schema,
+            platform: Optional[str] = None,
+            mode: Optional[ValidationMode] = None,
+            sample_rate: Optional[float] = None,
+            extractor_config: Optional[Any] = None,
+            changes: Optional[ExtractorChanges] = None,
+            config: Optional[Config] = None,
+            rng: Optional[random.Random] = None
+    ):
+        """
+        Args:
+            schema: Schema of the records
+            platform: Optional platform the records come from, enables the strict window
+            mode: Validation mode, defaults to validation.mode
+            sample_rate: Share of each batch validated in sample mode, defaults to validation.sample_rate
+            extractor_config: Configuration whose changes open the strict window,
+                defaults to the platform's selectors
+            changes: Optional extractor change tracker
+            config: Optional Config instance
+            rng: Optional random generator for sampling
+        """
+        config = config or Config()
+        self.schema = schema
+        self.mode = ValidationMode(mode or config.get("validation.mode", ValidationMode.FULL.value))
+        self.sample_rate: float = sample_rate if sample_rate is not None else config.get("validation.sample_rate", 0.05)
+        self.logger = LogManager().get_logger(self.__class__.__name__)
+        self._random = rng or random.Random()
+        self._strict_until = 0.0
+        if platform is not None:
+            if extractor_config is None:
+                extractor_config = config.get(f"platforms.{platform}.selectors", {})
+            changed_at = (changes or ExtractorChanges()).changed_at(platform, fingerprint(extractor_config))
+            strict_window_ms = config.get("validation.strict_window_ms", 0)
+            self._strict_until = changed_at + strict_window_ms / MS_PER_SECOND
+
+    @property
+    def effective_mode(self) -> ValidationMode:
+        """The mode in force now, full within the strict window"""
+        return ValidationMode.FULL if time.time() < self._strict_until else self.mode
+
+    def _sample(self, records: Sequence[Any]) -> ValidationResult:
+        size = min(len(records), math.ceil(len(records) * self.sample_rate))
+        indices = sorted(self._random.sample(range(len(records)), size))
+        sample = records.take(indices) if isinstance(records, RecordBatch) else [records[i] for i in indices]
+        if not self.schema.validate(sample):
+            return ValidationResult(records, [], size)
+        self.logger.warning(f"Invalid {self.schema.name} in sample, validating the whole batch")
+        return ValidationResult(records, self.schema.validate(records), len(records))
+
+    def validate(self, records: Union[Sequence[Any], RecordBatch]) -> ValidationResult:
+        """
+        Validate a batch of dicts, records or a RecordBatch.
+
+        Returns:
+            ValidationResult: The batch to pass on, the errors found and how many
+                records were checked
+        """
+        mode = self.effective_mode
+        if mode is ValidationMode.SAMPLE:
+            return self._sample(records)
+        if mode is ValidationMode.LAZY:
+            schema = self.schema
+            return ValidationResult([LazyRecord(record, schema, index) for index, record in enumerate(records)], [], 0)
+        return ValidationResult(records, self.schema.validate(records), len(records))
+
+
+RECORD_SCHEMAS: Dict[str, Schema] = {
+    record_type.dataset: Schema.for_record(record_type) for record_type in (Post, Comment, Profile)
+}
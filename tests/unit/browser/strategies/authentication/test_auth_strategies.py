@@ -0,0 +1,118 @@
+# tests/unit/browser/strategies/authentication/test_auth_strategies.py
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.browser.session_store import SessionStore
+from src.browser.strategies.authentication.cookie_auth import CookieAuth
+from src.core.exceptions import AuthenticationException
+
+
+def make_state(expires=-1, names=("c_user", "xs"), domain=".facebook.com"):
+    return {
+        "cookies": [{"name": n, "value": "v", "domain": domain, "path": "/", "expires": expires} for n in names],
+        "origins": []
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(tmp_path)
+
+
+@pytest.fixture
+def mock_page():
+    page = MagicMock()
+    page.context.add_cookies = AsyncMock()
+    page.context.request.get = AsyncMock()
+    return page
+
+
+def make_auth(store, page=None, **config):
+    auth = CookieAuth({"platform": "facebook", "required_cookies": ["c_user", "xs"], **config}, session_store=store)
+    if page is not None:
+        auth.initialize(page)
+    return auth
+
+
+class TestSessionCheck:
+    def test_valid_cookies(self, store):
+        """Test that live required cookies pass the offline check"""
+        auth = make_auth(store)
+        assert auth.check_session(make_state())
+        assert auth.check_session(make_state(expires=time.time() + 3600))
+
+    def test_expired_or_missing_cookies(self, store):
+        """Test that expired, missing or foreign-domain cookies fail"""
+        auth = make_auth(store)
+        assert not auth.check_session(make_state(expires=time.time() - 1))
+        assert not auth.check_session(make_state(names=("c_user",)))
+        assert not auth.check_session(make_state(domain=".example.com"))
+        assert not auth.check_session(make_state(domain=".evilfacebook.com"))
+        assert auth.check_session(make_state(domain="m.facebook.com"))
+        assert not auth.check_session()  # nothing stored
+
+    @pytest.mark.asyncio
+    async def test_login_required_without_navigation(self, store, mock_page):
+        """Test that login status is decided without loading a page"""
+        auth = make_auth(store, mock_page)
+        assert await auth.is_login_required()
+
+        store.save("facebook", make_state())
+        assert not await auth.is_login_required()
+        mock_page.goto.assert_not_called()
+        mock_page.context.request.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_probe_rejects_login_redirect(self, store, mock_page):
+        """Test that the optional probe detects a redirect to the login page"""
+        store.save("facebook", make_state())
+        auth = make_auth(store, mock_page, probe_url="https://facebook.com/me")
+        mock_page.context.request.get.return_value = MagicMock(
+            ok=False, headers={"location": "https://facebook.com/login?next=me"})
+        assert not await auth.has_valid_session()
+
+        mock_page.context.request.get.return_value = MagicMock(ok=True, headers={})
+        assert await auth.has_valid_session()
+        mock_page.goto.assert_not_called()
+        mock_page.context.add_cookies.assert_awaited_with(make_state()["cookies"])
+
+
+class TestCookieAuth:
+    @pytest.mark.asyncio
+    async def test_restores_stored_session(self, store, mock_page):
+        """Test that a valid stored session is applied to the context"""
+        store.save("facebook", make_state())
+        auth = make_auth(store, mock_page)
+        assert await auth.authenticate()
+        assert auth.is_authenticated
+        mock_page.context.add_cookies.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rejected_session_is_invalidated(self, store, mock_page):
+        """Test that a session failing the probe is dropped from the store"""
+        store.save("facebook", make_state())
+        auth = make_auth(store, mock_page, probe_url="https://facebook.com/me")
+        mock_page.context.request.get.return_value = MagicMock(ok=False, headers={})
+        assert not await auth.authenticate()
+        assert store.load("facebook") is None
+
+    @pytest.mark.asyncio
+    async def test_rejected_stale_session_keeps_renewed_one(self, store, mock_page, tmp_path):
+        """Test that rejecting a stale cached session keeps one renewed by another store"""
+        store.save("facebook", make_state())
+        store.load("facebook")
+        renewed = make_state(expires=time.time() + 3600)
+        SessionStore(tmp_path).save("facebook", renewed)
+
+        auth = make_auth(store, mock_page, probe_url="https://facebook.com/me")
+        mock_page.context.request.get.return_value = MagicMock(ok=False, headers={})
+        assert not await auth.authenticate()
+        assert SessionStore(tmp_path).load("facebook") == renewed
+
+    @pytest.mark.asyncio
+    async def test_requires_page(self, store):
+        """Test that authenticating without a page fails"""
+        with pytest.raises(AuthenticationException):
+            await make_auth(store).authenticate()
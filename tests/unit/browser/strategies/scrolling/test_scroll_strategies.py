@@ -0,0 +1,465 @@
+# tests/unit/browser/strategies/scrolling/test_scroll_strategies.py
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+from src.browser.strategies.scrolling.base_scroller import BaseScroller, PAGE_METRICS_JS
+from src.browser.strategies.scrolling.infinite_scroller import (
+    InfiniteScroller, INSTALL_OBSERVER_JS, SCROLL_TO_BOTTOM_JS, RELEASE_ITEMS_JS, PROCESSED_ATTR
+)
+from src.browser.strategies.scrolling.pagination_scroller import PaginationScroller
+from src.browser.strategies.scrolling.timed_scroller import TimedScroller, YieldStats
+from src.browser.manager import PagePool
+from src.core.constants import PruneMode
+from src.core.exceptions import ScrollingException
+from src.utils.rate_limiter import RateLimiter
+from src.utils.retry import RetryPolicy, Deadline
+
+
+class DummyScroller(BaseScroller):
+    async def scroll(self, target_items: int = 0, max_time: int = 0, deadline=None, on_items=None) -> bool:
+        return True
+
+
+@pytest.fixture
+def mock_page():
+    page = MagicMock()
+    page.evaluate = AsyncMock()
+    page.wait_for_selector = AsyncMock()
+    return page
+
+
+@pytest.fixture
+def scroller(mock_page):
+    scroller = DummyScroller({"scroll_delay": 10})
+    scroller.retry_policy = RetryPolicy(attempts=2, base_delay_ms=1, max_delay_ms=1, retry_on=(PlaywrightError,))
+    scroller.initialize(mock_page)
+    return scroller
+
+
+class TestBaseScroller:
+    def test_initialize_requires_page(self):
+        """Test that a scroller rejects a missing page"""
+        with pytest.raises(ValueError):
+            DummyScroller().initialize(None)
+
+    @pytest.mark.asyncio
+    async def test_scroll_to_element_retries_transient_errors(self, scroller, mock_page):
+        """Test that scrolling to an element retries Playwright errors"""
+        element = MagicMock()
+        element.scroll_into_view_if_needed = AsyncMock()
+        mock_page.wait_for_selector.side_effect = [PlaywrightError("detached"), element]
+        assert await scroller.scroll_to_element("#feed")
+        element.scroll_into_view_if_needed.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_scroll_to_element_gives_up(self, scroller, mock_page):
+        """Test that persistent errors return False"""
+        mock_page.wait_for_selector.side_effect = PlaywrightError("timeout")
+        assert not await scroller.scroll_to_element("#feed")
+        assert mock_page.wait_for_selector.await_count == 2
+
+    def test_scroll_deadline_takes_the_sooner_end(self):
+        """Test that max_time only shortens the fetch's deadline"""
+        fetch_deadline = Deadline(60)
+        assert BaseScroller.scroll_deadline(0, fetch_deadline) is fetch_deadline
+        assert BaseScroller.scroll_deadline(1000, fetch_deadline).timeout_s() <= 1
+        short = Deadline(0.5)
+        assert BaseScroller.scroll_deadline(1000, short) is short
+        assert BaseScroller.scroll_deadline().remaining() is None
+
+    @pytest.mark.asyncio
+    async def test_check_progress(self, scroller, mock_page):
+        """Test stopping on the target and after consecutive stalled steps"""
+        mock_page.evaluate.return_value = {"height": 1000, "bottom": 600}
+        scroller.stall_steps = 2
+        scroller.reset_progress()
+        assert await scroller.check_progress(5)
+        assert await scroller.check_progress(5)
+        assert not await scroller.check_progress(5)
+        assert scroller.stop_reason == "stalled"
+
+        scroller.reset_progress()
+        assert not await scroller.check_progress(10, target_items=10)
+        assert scroller.stop_reason == "target reached"
+
+    @pytest.mark.asyncio
+    async def test_stall_waits_for_inflight_requests(self, scroller, mock_page):
+        """Test that a step with requests in flight waits for them instead of counting as stalled"""
+        mock_page.evaluate.side_effect = [
+            {"height": 1000, "bottom": 1000}, {"height": 1200, "bottom": 1000},
+            {"height": 1200, "bottom": 1200}, {"height": 1200, "bottom": 1200}
+        ]
+        scroller.stall_steps = 1
+        scroller.reset_progress(5)
+        scroller._last_height = 1000
+        scroller._on_request(None)
+        asyncio.get_running_loop().call_later(0.01, scroller._on_request_done, None)
+        assert await scroller.check_progress(5)
+        assert await scroller.check_progress(5)
+        assert not await scroller.check_progress(5)
+        assert scroller.stop_reason == "end of feed"
+
+    @pytest.mark.asyncio
+    async def test_requests_without_new_content_count_as_stalled(self, scroller, mock_page):
+        """Test that requests landing without growing the page do not spare a stalled step"""
+        mock_page.evaluate.return_value = {"height": 1000, "bottom": 1000}
+        scroller.stall_steps = 1
+        scroller.reset_progress(5)
+        scroller._last_height = 1000
+        scroller._on_request(None)
+        asyncio.get_running_loop().call_later(0.01, scroller._on_request_done, None)
+        assert not await scroller.check_progress(5)
+        assert scroller.stop_reason == "end of feed"
+
+    @pytest.mark.asyncio
+    async def test_get_scroll_position(self, scroller, mock_page):
+        """Test reading the scroll position and falling back on errors"""
+        mock_page.evaluate.return_value = {"x": 0, "y": 400}
+        assert await scroller.get_scroll_position() == {"x": 0, "y": 400}
+        mock_page.evaluate.side_effect = PlaywrightError("closed")
+        assert await scroller.get_scroll_position() == {"x": 0, "y": 0}
+
+
+class FakeFeedPage:
+    """Page double whose feed grows by a fixed number of items per scroll"""
+
+    def __init__(self, per_scroll: int = 5, initial: int = 3):
+        self.count = initial
+        self.unprocessed = initial
+        self.per_scroll = per_scroll
+        self.scrolls = 0
+        self.released = []
+        self.wait_for_function = AsyncMock()
+
+    async def evaluate(self, script, arg=None):
+        if script == INSTALL_OBSERVER_JS:
+            return self.count
+        if script == SCROLL_TO_BOTTOM_JS:
+            self.scrolls += 1
+            self.count += self.per_scroll
+            self.unprocessed += self.per_scroll
+            return self.scrolls * 1000.0
+        if script == RELEASE_ITEMS_JS:
+            self.released.append((len(arg["nodes"]), arg["mode"]))
+            self.unprocessed -= len(arg["nodes"])
+            return None
+        if script == PAGE_METRICS_JS:
+            return {"height": self.count * 100, "bottom": self.count * 100}
+        return self.count
+
+    def on(self, event, handler):
+        pass
+
+    async def query_selector_all(self, selector):
+        assert PROCESSED_ATTR in selector
+        return [MagicMock(dispose=AsyncMock()) for _ in range(self.unprocessed)]
+
+
+class ChattyFeedPage(FakeFeedPage):
+    """Feed page that keeps background requests going, like long-polls or analytics"""
+
+    def __init__(self, per_scroll: int = 5, initial: int = 3):
+        super().__init__(per_scroll, initial)
+        self.scroller = None
+
+    async def evaluate(self, script, arg=None):
+        if script == SCROLL_TO_BOTTOM_JS:
+            self.scroller._on_request(None)
+            asyncio.get_running_loop().call_later(0.01, self.scroller._on_request_done, None)
+        return await super().evaluate(script, arg)
+
+
+class TestInfiniteScroller:
+    @pytest.mark.asyncio
+    async def test_scrolls_until_target(self):
+        """Test that scrolling stops once the target item count is reached"""
+        page = FakeFeedPage(per_scroll=5, initial=3)
+        scroller = InfiniteScroller({"max_scroll_attempts": 10})
+        scroller.initialize(page)
+        assert await scroller.scroll(target_items=12)
+        assert scroller.items_loaded == 13
+        assert page.scrolls == 2
+
+    @pytest.mark.asyncio
+    async def test_waits_on_mutations_not_fixed_delay(self):
+        """Test that each step waits for new items or a quiet DOM"""
+        page = FakeFeedPage()
+        scroller = InfiniteScroller({"max_scroll_attempts": 3, "quiet_ms": 200, "mutation_timeout_ms": 4000})
+        scroller.initialize(page)
+        await scroller.scroll()
+        assert page.wait_for_function.await_count == 3
+        call = page.wait_for_function.call_args
+        assert call.kwargs["arg"]["quietMs"] == 200
+        assert call.kwargs["arg"]["scrollStart"] == 3000.0
+        assert call.kwargs["timeout"] <= 4000
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout_is_not_an_error(self):
+        """Test that a feed without activity ends the wait instead of failing"""
+        page = FakeFeedPage(per_scroll=0)
+        page.wait_for_function.side_effect = PlaywrightTimeoutError("timeout")
+        scroller = InfiniteScroller({"max_scroll_attempts": 2})
+        scroller.initialize(page)
+        assert await scroller.scroll()
+
+    @pytest.mark.asyncio
+    async def test_extracts_and_prunes_each_step(self):
+        """Test that new items are extracted after every step and then pruned"""
+        page = FakeFeedPage(per_scroll=4, initial=2)
+        scroller = InfiniteScroller({"max_scroll_attempts": 3, "prune": "detach"})
+        scroller.initialize(page)
+        batches = []
+
+        async def on_items(handles):
+            batches.append(len(handles))
+
+        await scroller.scroll(on_items=on_items)
+        assert batches == [2, 4, 4, 4]
+        assert page.released == [(2, "detach"), (4, "detach"), (4, "detach"), (4, "detach")]
+        assert scroller.items_processed == 14
+
+    @pytest.mark.asyncio
+    async def test_only_marks_items_by_default(self):
+        """Test that extracted items stay in the DOM unless pruning is enabled"""
+        page = FakeFeedPage(per_scroll=4, initial=2)
+        scroller = InfiniteScroller({"max_scroll_attempts": 1})
+        scroller.initialize(page)
+        await scroller.scroll(on_items=AsyncMock())
+        assert scroller.prune is PruneMode.NONE
+        assert page.released == [(2, "none"), (4, "none")]
+
+    @pytest.mark.asyncio
+    async def test_callback_can_stop_the_scroll(self):
+        """Test that on_items can end the scroll, e.g. on reaching seen content"""
+        page = FakeFeedPage(per_scroll=4)
+        scroller = InfiniteScroller({"max_scroll_attempts": 10})
+        scroller.initialize(page)
+
+        async def on_items(handles):
+            if page.scrolls == 2:
+                scroller.stop("reached seen content")
+
+        await scroller.scroll(on_items=on_items)
+        assert page.scrolls == 2
+        assert scroller.stop_reason == "reached seen content"
+
+    @pytest.mark.asyncio
+    async def test_stops_at_end_of_feed(self):
+        """Test that a feed that stops growing ends the scroll before max attempts"""
+        page = FakeFeedPage(per_scroll=0)
+        scroller = InfiniteScroller({"max_scroll_attempts": 50, "stall_steps": 2})
+        scroller.initialize(page)
+        assert await scroller.scroll()
+        assert page.scrolls == 3
+        assert scroller.stop_reason == "end of feed"
+
+    @pytest.mark.asyncio
+    async def test_background_traffic_does_not_prevent_end_of_feed(self):
+        """Test that an ended feed stops even while requests keep arriving"""
+        page = ChattyFeedPage(per_scroll=0)
+        scroller = InfiniteScroller({"max_scroll_attempts": 40, "stall_steps": 2})
+        page.scroller = scroller
+        scroller.initialize(page)
+        assert await scroller.scroll()
+        assert page.scrolls == 3
+        assert scroller.stop_reason == "end of feed"
+
+    @pytest.mark.asyncio
+    async def test_browser_errors_raise(self):
+        """Test that browser failures surface as ScrollingException"""
+        page = FakeFeedPage()
+        page.wait_for_function.side_effect = PlaywrightError("target closed")
+        scroller = InfiniteScroller()
+        scroller.initialize(page)
+        with pytest.raises(ScrollingException):
+            await scroller.scroll()
+
+
+class FakeListingContext:
+    """Browser context whose pages load numbered listing pages with varying latency"""
+
+    def __init__(self, items_per_page, last_page):
+        self.items_per_page = items_per_page
+        self.last_page = last_page
+        self.loaded = []
+        self.active = 0
+        self.max_active = 0
+
+    async def new_page(self):
+        page = MagicMock()
+        page.is_closed.return_value = False
+        page.close = AsyncMock()
+        context = self
+
+        async def goto(url, timeout=None):
+            number = int(url.rsplit("=", 1)[1])
+            context.active += 1
+            context.max_active = max(context.max_active, context.active)
+            # Later pages answer faster, so completion order differs from page order
+            await asyncio.sleep(0.001 * (10 - number % 10))
+            context.active -= 1
+            context.loaded.append(number)
+            page.current = number
+
+        async def query_selector_all(selector):
+            count = context.items_per_page if page.current <= context.last_page else 0
+            return [MagicMock(page=page.current, dispose=AsyncMock()) for _ in range(count)]
+
+        page.goto = goto
+        page.query_selector_all = query_selector_all
+        return page
+
+
+@pytest.fixture
+def limiter():
+    return RateLimiter(1000)
+
+
+class TestPaginationScroller:
+    @pytest.mark.asyncio
+    async def test_loads_pages_concurrently_in_order(self, limiter):
+        """Test that pages load concurrently but items are handed over in page order"""
+        context = FakeListingContext(items_per_page=3, last_page=8)
+        pool = PagePool(context, size=4)
+        scroller = PaginationScroller(
+            {"url_template": "https://example.com/list?page={page}", "max_pages": 20}, pool, limiter)
+        pages = []
+
+        async def on_items(handles):
+            pages.append(handles[0].page)
+
+        assert await scroller.scroll(on_items=on_items)
+        assert pages == list(range(1, 9))
+        assert scroller.items_loaded == 24
+        assert scroller.stop_reason == "end of feed"
+        assert 1 < context.max_active <= 4
+        assert pool.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_offset_template_and_target(self, limiter):
+        """Test offset URLs and stopping once the target is reached"""
+        scroller = PaginationScroller(
+            {"url_template": "https://example.com/list?offset={offset}", "page_size": 1}, None, limiter)
+        assert [scroller.page_url(i) for i in range(3)] == [
+            "https://example.com/list?offset=0", "https://example.com/list?offset=1", "https://example.com/list?offset=2"]
+
+        context = FakeListingContext(items_per_page=5, last_page=100)
+        pool = PagePool(context, size=3)
+        scroller = PaginationScroller(
+            {"url_template": "https://example.com/list?page={page}", "max_pages": 50}, pool, limiter)
+        await scroller.scroll(target_items=12)
+        assert scroller.items_loaded == 15
+        assert scroller.stop_reason == "target reached"
+        assert len(context.loaded) < 10
+        assert pool.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_requires_pool_for_templates(self, limiter):
+        """Test that concurrent pagination without a pool is rejected"""
+        scroller = PaginationScroller({"url_template": "https://example.com/list?page={page}"}, None, limiter)
+        with pytest.raises(ScrollingException):
+            await scroller.scroll()
+
+    @pytest.mark.asyncio
+    async def test_follows_next_links_sequentially(self, limiter):
+        """Test cursor pagination through next_selector on the scroller's page"""
+        page = MagicMock()
+        page.query_selector_all = AsyncMock(return_value=[MagicMock(dispose=AsyncMock())])
+        link = MagicMock()
+        link.get_attribute = AsyncMock(side_effect=["/list?cursor=a", "/list?cursor=b", None])
+        page.query_selector = AsyncMock(return_value=link)
+        page.goto = AsyncMock()
+        page.url = "https://example.com/list"
+        scroller = PaginationScroller({"next_selector": "a[rel=next]"}, None, limiter)
+        scroller.initialize(page)
+        await scroller.scroll()
+        assert page.goto.await_count == 2
+        assert page.goto.call_args.args[0] == "https://example.com/list?cursor=b"
+        assert scroller.pages_loaded == 3
+        assert scroller.stop_reason == "end of feed"
+
+
+    @pytest.mark.asyncio
+    async def test_prefetches_next_page_during_extraction(self, limiter):
+        """Test that the next cursor page loads on a pooled page while the current one is extracted"""
+        events = []
+
+        def make_page(number):
+            page = MagicMock()
+            page.url = f"https://example.com/list?cursor={number}"
+            page.is_closed.return_value = False
+            link = MagicMock()
+            link.get_attribute = AsyncMock(
+                side_effect=lambda name: f"?cursor={page.number + 1}" if page.number < 4 else None)
+            page.query_selector = AsyncMock(return_value=link)
+            page.query_selector_all = AsyncMock(
+                side_effect=lambda selector: [MagicMock(page=page.number, dispose=AsyncMock())])
+
+            async def goto(url, timeout=None):
+                page.number = int(url.rsplit("=", 1)[1])
+                page.url = url
+                events.append(f"load {page.number}")
+                await asyncio.sleep(0.01)
+
+            page.number = number
+            page.goto = goto
+            return page
+
+        context = MagicMock()
+        context.new_page = AsyncMock(side_effect=lambda: make_page(0))
+        pool = PagePool(context, size=2)
+        scroller = PaginationScroller({"next_selector": "a[rel=next]"}, pool, limiter)
+        scroller.initialize(make_page(1))
+
+        async def on_items(handles):
+            events.append(f"extract start {handles[0].page}")
+            await asyncio.sleep(0.02)
+            events.append(f"extract end {handles[0].page}")
+
+        await scroller.scroll(on_items=on_items)
+        assert [e for e in events if e.startswith("extract end")] == [f"extract end {n}" for n in range(1, 5)]
+        for number in (2, 3, 4):
+            assert events.index(f"load {number}") < events.index(f"extract end {number - 1}")
+        assert scroller.stop_reason == "end of feed"
+        assert pool.in_use == 0
+
+class TestYieldStats:
+    def test_record_smooths_and_persists(self, tmp_path):
+        """Test that rates are averaged across runs and survive a reload"""
+        stats = YieldStats(tmp_path / "yield.json", smoothing=0.5)
+        assert stats.rate("group") is None
+        assert stats.record("group", 100, 10) == 10
+        assert stats.record("group", 20, 10) == 6
+        assert YieldStats(tmp_path / "yield.json").rate("group") == 6
+
+    def test_allocate_by_expected_yield(self, tmp_path):
+        """Test that productive sources get more of the budget and new ones a fair share"""
+        stats = YieldStats(tmp_path / "yield.json")
+        stats.record("busy", 90, 10)
+        stats.record("quiet", 10, 10)
+        shares = stats.allocate(["busy", "quiet", "new"], 60000, min_ms=5000)
+        assert sum(shares.values()) == pytest.approx(60000)
+        assert shares["busy"] > shares["new"] > shares["quiet"] >= 5000
+        assert shares["new"] == pytest.approx(5000 + 45000 * 5 / 15)
+
+    def test_allocate_small_budget_splits_evenly(self, tmp_path):
+        """Test that a budget below the floors is split evenly"""
+        stats = YieldStats(tmp_path / "yield.json")
+        assert stats.allocate(["a", "b"], 1000, min_ms=5000) == {"a": 500, "b": 500}
+
+
+class TestTimedScroller:
+    @pytest.mark.asyncio
+    async def test_records_run_yield(self, tmp_path):
+        """Test that a timed scroll records its yield for the source"""
+        stats = YieldStats(tmp_path / "yield.json")
+        page = FakeFeedPage(per_scroll=2, initial=0)
+        scroller = TimedScroller({"source": "group-1", "stall_steps": 1}, stats)
+        scroller.initialize(page)
+        assert await scroller.scroll(target_items=6, max_time=5000)
+        assert scroller.run_stats["items"] == 6
+        assert scroller.run_stats["stop_reason"] == "target reached"
+        assert stats.rate("group-1") > 0
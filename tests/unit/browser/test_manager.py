@@ -0,0 +1,65 @@
+# tests/unit/browser/test_manager.py
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.browser.manager import PagePool
+
+
+def make_context():
+    context = MagicMock()
+
+    async def new_page():
+        page = MagicMock()
+        page.is_closed.return_value = False
+        page.close = AsyncMock()
+        return page
+
+    context.new_page = AsyncMock(side_effect=new_page)
+    return context
+
+
+class TestPagePool:
+    @pytest.mark.asyncio
+    async def test_pages_are_reused(self):
+        """Test that released pages are handed out again instead of opening new ones"""
+        context = make_context()
+        pool = PagePool(context, size=2)
+        async with pool.page() as first:
+            pass
+        async with pool.page() as second:
+            assert second is first
+        assert context.new_page.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_size_caps_concurrent_pages(self):
+        """Test that acquire waits once every page is in use"""
+        pool = PagePool(make_context(), size=2)
+        first = await pool.acquire()
+        await pool.acquire()
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        pool.release(first)
+        assert await asyncio.wait_for(waiter, 1) is first
+        assert pool.in_use == 2
+
+    @pytest.mark.asyncio
+    async def test_closed_pages_are_dropped(self):
+        """Test that a page closed while borrowed is replaced"""
+        context = make_context()
+        pool = PagePool(context, size=1)
+        page = await pool.acquire()
+        page.is_closed.return_value = True
+        pool.release(page)
+        assert await pool.acquire() is not page
+        assert context.new_page.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close_closes_all_pages(self):
+        """Test that closing the pool closes every page it opened"""
+        async with PagePool(make_context(), size=2) as pool:
+            pages = [await pool.acquire(), await pool.acquire()]
+        for page in pages:
+            page.close.assert_awaited_once()
@@ -0,0 +1,288 @@
+# tests/unit/browser/test_session_store.py
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from src.browser.session_store import (
+    SessionStore, SessionLeases, LOGIN_LOCK_FILENAME, DELTA_SUFFIX,
+    diff_storage_state, apply_storage_delta
+)
+from src.core.config import Config
+from src.core.constants import DAY_MS, MS_PER_SECOND
+
+STATE = {"cookies": [{"name": "c_user", "value": "1", "domain": ".facebook.com", "path": "/"}], "origins": []}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(tmp_path, capacity=2)
+
+
+class TestSessionStore:
+    def test_save_and_load_round_trip(self, store):
+        """Test that a saved session loads back unchanged"""
+        store.save("facebook", STATE)
+        assert store.load("facebook") == STATE
+
+    def test_writes_compact_json_without_temp_files(self, store, tmp_path):
+        """Test that writes are atomic and leave no temporary files behind"""
+        store.save("facebook", STATE, account="alice")
+        path = store.path_for("facebook", "alice")
+        assert json.loads(path.read_text()) == STATE
+        assert "\n" not in path.read_text()
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_load_served_from_memory(self, store):
+        """Test that repeated loads do not re-read the file"""
+        store.save("facebook", STATE)
+        store.path_for("facebook").unlink()
+        assert store.load("facebook") == STATE
+
+    def test_lru_evicts_least_recently_used(self, store):
+        """Test that the cache holds at most capacity states"""
+        for account in ("a", "b", "c"):
+            store.save("facebook", {"account": account}, account=account)
+        assert ("facebook", "a") not in store._cache
+        assert store.load("facebook", "a") == {"account": "a"}  # reloaded from disk
+
+    def test_expiry_uses_stricter_max_age(self, tmp_path, monkeypatch):
+        """Test that the platform max age caps the global validity"""
+        config = Config()
+        store = SessionStore(tmp_path, config=config)
+        monkeypatch.setitem(config.get("platforms.facebook.session"), "max_age_days", 2)
+        assert store.max_age_seconds("facebook") == 2 * DAY_MS / MS_PER_SECOND
+
+    def test_expired_session_is_not_returned(self, store):
+        """Test that an expired session is treated as missing"""
+        expires_at = store.save("facebook", STATE)
+        assert store.is_valid("facebook")
+        assert not store.is_valid("facebook", now=expires_at + 1)
+
+        store._index["facebook/default"]["expires_at"] = time.time() - 1
+        assert store.load("facebook") is None
+
+    def test_needs_refresh(self, store):
+        """Test refresh detection from the expiry index"""
+        assert store.needs_refresh("facebook")
+        expires_at = store.save("facebook", STATE)
+        assert not store.needs_refresh("facebook")
+        assert store.needs_refresh("facebook", now=expires_at - 60)
+
+    def test_index_persists_across_instances(self, store, tmp_path):
+        """Test that a new store sees sessions saved by another instance"""
+        expires_at = store.save("facebook", STATE)
+        other = SessionStore(tmp_path)
+        assert other.expires_at("facebook") == expires_at
+        assert other.load("facebook") == STATE
+
+    def test_invalidate(self, store):
+        """Test that invalidation removes the session everywhere"""
+        store.save("facebook", STATE)
+        store.invalidate("facebook")
+        assert store.load("facebook") is None
+        assert not store.path_for("facebook").exists()
+
+
+def with_cookie(state, name, value):
+    cookies = [c for c in state["cookies"] if c["name"] != name]
+    cookies.append({"name": name, "value": value, "domain": ".facebook.com", "path": "/"})
+    return {**state, "cookies": cookies}
+
+
+class TestIncrementalPersistence:
+    def test_diff_and_apply_round_trip(self):
+        """Test that applying a diff reproduces the new state"""
+        old = {"cookies": STATE["cookies"], "origins": [
+            {"origin": "https://facebook.com", "localStorage": [{"name": "a", "value": "1"}, {"name": "b", "value": "2"}]}
+        ]}
+        new = {"cookies": [{"name": "xs", "value": "2", "domain": ".facebook.com", "path": "/"}], "origins": [
+            {"origin": "https://facebook.com", "localStorage": [{"name": "a", "value": "9"}]}
+        ]}
+        delta = diff_storage_state(old, new)
+        assert delta == {
+            "set_cookies": new["cookies"],
+            "del_cookies": [["c_user", ".facebook.com", "/"]],
+            "set_storage": [["https://facebook.com", "a", "9"]],
+            "del_storage": [["https://facebook.com", "b"]]
+        }
+        assert apply_storage_delta(old, delta) == new
+        assert diff_storage_state(new, new) == {}
+
+    def test_saves_append_only_changes(self, store):
+        """Test that later saves append deltas instead of rewriting the base"""
+        store.save("facebook", STATE)
+        base = store.path_for("facebook")
+        base_content = base.read_text()
+
+        store.save("facebook", with_cookie(STATE, "xs", "1"))
+        store.save("facebook", with_cookie(STATE, "xs", "2"))
+        delta_path = base.with_name(base.name + DELTA_SUFFIX)
+        assert base.read_text() == base_content
+        assert len(delta_path.read_text().splitlines()) == 2
+        assert "c_user" not in delta_path.read_text()
+
+        reopened = SessionStore(store.base_dir)
+        assert reopened.load("facebook") == with_cookie(STATE, "xs", "2")
+
+    def test_unchanged_state_writes_nothing(self, store):
+        """Test that saving an identical state does not touch disk"""
+        store.save("facebook", STATE)
+        mtime = store.index_path.stat().st_mtime_ns
+        store.save("facebook", json.loads(json.dumps(STATE)))
+        assert store.index_path.stat().st_mtime_ns == mtime
+        assert not store.path_for("facebook").with_name("storage.json" + DELTA_SUFFIX).exists()
+
+    def test_periodic_compaction(self, tmp_path):
+        """Test that the delta log is folded into the base after compact_after saves"""
+        store = SessionStore(tmp_path)
+        store.compact_after = 3
+        state = STATE
+        store.save("facebook", state)
+        for i in range(3):
+            state = with_cookie(state, "xs", str(i))
+            store.save("facebook", state)
+
+        base = store.path_for("facebook")
+        assert not base.with_name(base.name + DELTA_SUFFIX).exists()
+        assert json.loads(base.read_text()) == state
+
+    def test_torn_delta_line_is_ignored(self, store):
+        """Test that a partially written final delta does not break loading"""
+        store.save("facebook", STATE)
+        store.save("facebook", with_cookie(STATE, "xs", "1"))
+        base = store.path_for("facebook")
+        with open(base.with_name(base.name + DELTA_SUFFIX), "a") as f:
+            f.write('{"set_cookies":[{"na')
+        assert SessionStore(store.base_dir).load("facebook") == with_cookie(STATE, "xs", "1")
+
+
+class TestSessionLeases:
+    @pytest.mark.asyncio
+    async def test_concurrent_workers_share_one_login(self, store):
+        """Test that N workers starting together cost a single login"""
+        logins = 0
+
+        async def login():
+            nonlocal logins
+            logins += 1
+            await asyncio.sleep(0.05)
+            return STATE
+
+        leases = SessionLeases(store, poll_interval=0.01)
+
+        async def worker():
+            async with leases.lease("facebook", login) as state:
+                return state
+
+        results = await asyncio.gather(*(worker() for _ in range(8)))
+        assert logins == 1
+        assert all(state == STATE for state in results)
+        assert not (store.path_for("facebook").parent / LOGIN_LOCK_FILENAME).exists()
+
+    @pytest.mark.asyncio
+    async def test_leases_bounded_per_account(self, store, monkeypatch):
+        """Test that concurrent leases never exceed max_concurrency"""
+        monkeypatch.setitem(store.config.get("platforms.facebook.session"), "max_concurrency", 2)
+        store.save("facebook", STATE)
+        leases = SessionLeases(store)
+        active = peak = 0
+
+        async def worker():
+            nonlocal active, peak
+            async with leases.lease("facebook", login=None):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(worker() for _ in range(6)))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_waits_for_login_in_other_process(self, store, tmp_path):
+        """Test that a held login lock makes workers reuse the other process's session"""
+        lock_path = store.path_for("facebook").parent / LOGIN_LOCK_FILENAME
+        lock_path.parent.mkdir(parents=True)
+        lock_path.write_text("12345")
+
+        async def login():
+            raise AssertionError("must not log in while another process holds the lock")
+
+        async def other_process():
+            await asyncio.sleep(0.05)
+            SessionStore(tmp_path).save("facebook", STATE)
+            os.unlink(lock_path)
+
+        leases = SessionLeases(store, poll_interval=0.01)
+
+        async def worker():
+            async with leases.lease("facebook", login) as state:
+                return state
+
+        state, _ = await asyncio.gather(worker(), other_process())
+        assert state == STATE
+
+    @pytest.mark.asyncio
+    async def test_rejected_state_forces_new_login(self, store):
+        """Test that releasing a rejected state triggers a fresh login"""
+        store.save("facebook", {"cookies": [], "origins": []})
+        leases = SessionLeases(store)
+
+        async def login():
+            return STATE
+
+        async with leases.lease("facebook", login) as state:
+            leases.release_invalid("facebook", state)
+        async with leases.lease("facebook", login) as state:
+            assert state == STATE
+
+    def test_stale_state_does_not_invalidate_renewed_session(self, store):
+        """Test that invalidating an outdated state keeps the current one"""
+        store.save("facebook", {"cookies": [], "origins": []})
+        stale = store.load("facebook")
+        store.save("facebook", STATE)
+        store.invalidate("facebook", state=stale)
+        assert store.load("facebook") == STATE
+
+
+class TestSessionStoreConsistency:
+    def test_torn_delta_log_is_compacted(self, store):
+        """Test that saves after a torn delta line are not lost"""
+        store.save("facebook", STATE)
+        store.save("facebook", with_cookie(STATE, "xs", "1"))
+        base = store.path_for("facebook")
+        with open(base.with_name(base.name + DELTA_SUFFIX), "a") as f:
+            f.write('{"set_cookies":[{"na')
+        other = SessionStore(store.base_dir)
+        other.save("facebook", with_cookie(STATE, "xs", "2"))
+        assert SessionStore(store.base_dir).load("facebook") == with_cookie(STATE, "xs", "2")
+
+    def test_unchanged_save_renews_expired_entry(self, store, monkeypatch):
+        """Test that saving an unchanged state past its expiry refreshes the index"""
+        store.save("facebook", STATE)
+        later = time.time() + 30 * DAY_MS / MS_PER_SECOND
+        monkeypatch.setattr(time, "time", lambda: later)
+        assert not store.is_valid("facebook")
+        assert store.save("facebook", STATE) > later
+        assert store.is_valid("facebook")
+
+    def test_save_keeps_entries_renewed_by_other_processes(self, store, tmp_path):
+        """Test that a stale in-memory entry does not overwrite a renewed one on disk"""
+        store.save("facebook", STATE)
+        store.save("instagram", STATE)
+        other = SessionStore(tmp_path)
+        renewed = other.save("instagram", with_cookie(STATE, "xs", "1"))
+        store.save("facebook", with_cookie(STATE, "xs", "1"))
+        assert SessionStore(tmp_path).expires_at("instagram") == renewed
+
+    def test_stale_state_does_not_invalidate_session_renewed_elsewhere(self, store, tmp_path):
+        """Test that the invalidate guard holds when the state is not cached"""
+        store.save("facebook", {"cookies": [], "origins": []})
+        stale = store.load("facebook")
+        store._cache.clear()
+        SessionStore(tmp_path).save("facebook", STATE)
+        store.invalidate("facebook", state=stale)
+        assert SessionStore(tmp_path).load("facebook") == STATE
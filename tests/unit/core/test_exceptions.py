@@ -23,8 +23,13 @@ def test_exception_inheritance():
         ],
         DataException: [
             FetchException,
+            DeadlineExceededException,
+            ClientErrorException,
+            RetriesExhaustedException,
+            CircuitOpenException,
             ExtractionException,
-            ValidationException
+            ValidationException,
+            StorageException
         ],
         StrategyException: [
             AuthenticationException,
@@ -48,7 +53,9 @@ def test_all_exceptions_instantiation():
     exceptions = [
         FetcherException, ConfigurationException, InitializationException,
         BrowserException, PlaywrightException, SessionException, NetworkException,
-        DataException, FetchException, ExtractionException, ValidationException,
+        DataException, FetchException, DeadlineExceededException, ClientErrorException,
+        RetriesExhaustedException, CircuitOpenException,
+        ExtractionException, ValidationException, StorageException,
         StrategyException, AuthenticationException, ScrollingException, StealthException
     ]
 
@@ -70,3 +77,24 @@ def test_all_exceptions_instantiation():
         exc = exception_class()
         assert exc.message == ""
         assert exc.details == {}
+
+
+def test_retry_classification():
+    """Test the retry metadata carried by the exception classes."""
+    assert NetworkException.retryable and NetworkException.trips_breaker
+    assert SessionException.retryable and SessionException.refresh_session
+    assert not SessionException.trips_breaker
+    for permanent in (ConfigurationException, InitializationException, ValidationException):
+        assert not permanent.retryable and not permanent.trips_breaker
+    assert not CircuitOpenException.retryable and not CircuitOpenException.trips_breaker
+    assert not DeadlineExceededException.retryable
+    assert not ClientErrorException.retryable and not ClientErrorException.trips_breaker
+
+    # Not retryable again, and trips the breaker only when the last error did
+    assert not RetriesExhaustedException.retryable
+    assert RetriesExhaustedException("gave up", cause=NetworkException()).trips_breaker
+    assert not RetriesExhaustedException("gave up", cause=SessionException()).trips_breaker
+    assert RetriesExhaustedException("gave up", cause=TimeoutError()).trips_breaker  # class default
+
+    assert NetworkException("slow down", retry_after=30).retry_after == 30
+    assert NetworkException().retry_after is None
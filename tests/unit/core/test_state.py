@@ -0,0 +1,117 @@
+# tests/unit/core/test_state.py
+import json
+
+import pytest
+
+from src.core.state import Checkpointer, JobState
+from src.utils.storage import RecordWriter, WriteBehindBuffer
+
+
+@pytest.fixture
+def checkpointer(tmp_path):
+    return Checkpointer("job-1", tmp_path, interval_ms=60000)
+
+
+class TestJobState:
+    def test_queue_progress(self):
+        """Test moving through the queue of sources"""
+        state = JobState("job", ["a", "b"])
+        assert state.current == "a"
+        state.progress("a").cursor = "page=3"
+        state.advance()
+        assert state.current == "b"
+        assert state.sources["a"].done
+        state.advance()
+        assert state.finished and state.current is None
+
+    def test_round_trip(self):
+        """Test conversion to and from plain dicts"""
+        state = JobState("job", ["a"], segments={"posts": 120})
+        state.progress("a").scroll_depth = 7
+        restored = JobState.from_dict(json.loads(json.dumps(state.to_dict())))
+        assert restored == state
+
+
+class TestCheckpointer:
+    def test_resume_from_last_checkpoint(self, checkpointer, tmp_path):
+        """Test that a restarted job picks up from its checkpoint"""
+        state = checkpointer.resume_or_start(["a", "b", "c"])
+        state.advance()
+        state.progress("b").cursor = "cursor-2"
+        checkpointer.save(state)
+
+        resumed = Checkpointer("job-1", tmp_path).resume_or_start(["ignored"])
+        assert resumed.queue == ["a", "b", "c"]
+        assert resumed.current == "b"
+        assert resumed.progress("b").cursor == "cursor-2"
+
+    def test_maybe_save_is_rate_limited(self, checkpointer):
+        """Test that periodic checkpoints are written at most once per interval"""
+        state = checkpointer.resume_or_start(["a"])
+        assert not checkpointer.maybe_save(state)
+        checkpointer.interval_s = 0
+        assert checkpointer.maybe_save(state)
+
+    def test_clear(self, checkpointer):
+        """Test that a finished job leaves no checkpoint behind"""
+        checkpointer.resume_or_start(["a"])
+        checkpointer.clear()
+        assert checkpointer.load() is None
+
+    def test_resume_drops_records_written_after_checkpoint(self, tmp_path):
+        """Test that dataset files are cut back to their checkpointed size"""
+        buffer = WriteBehindBuffer(RecordWriter(tmp_path / "raw"), max_pending=10, batch_size=5)
+        checkpointer = Checkpointer("job-2", tmp_path, buffer=buffer)
+        state = checkpointer.resume_or_start(["a"])
+        buffer.submit("posts", {"id": 1})
+        checkpointer.save(state)
+        buffer.submit("posts", {"id": 2})
+        buffer.close()
+
+        buffer = WriteBehindBuffer(RecordWriter(tmp_path / "raw"), max_pending=10, batch_size=5)
+        Checkpointer("job-2", tmp_path, buffer=buffer).resume_or_start(["a"])
+        buffer.submit("posts", {"id": 3})
+        buffer.close()
+        lines = (tmp_path / "raw" / "posts.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [1, 3]
+
+    def test_resume_drops_records_of_datasets_opened_after_checkpoint(self, tmp_path):
+        """Test that datasets first written after the last checkpoint are cut back too"""
+        raw = tmp_path / "raw"
+        raw.mkdir()
+        (raw / "comments.jsonl").write_text('{"id":0}\n', encoding="utf-8")
+        buffer = WriteBehindBuffer(RecordWriter(raw), max_pending=10, batch_size=5)
+        checkpointer = Checkpointer("job-3", tmp_path, buffer=buffer)
+        checkpointer.resume_or_start(["a"])
+        buffer.submit("posts", {"id": 1})
+        buffer.submit("comments", {"id": 1})
+        buffer.close()
+
+        buffer = WriteBehindBuffer(RecordWriter(raw), max_pending=10, batch_size=5)
+        Checkpointer("job-3", tmp_path, buffer=buffer).resume_or_start(["a"])
+        buffer.submit("posts", {"id": 1})
+        buffer.close()
+        assert (raw / "posts.jsonl").read_text(encoding="utf-8").splitlines() == ['{"id":1}']
+        assert (raw / "comments.jsonl").read_text(encoding="utf-8").splitlines() == ['{"id":0}']
+
+    def test_declared_datasets_recorded_at_start(self, tmp_path):
+        """Test that declared datasets are checkpointed before they are opened"""
+        buffer = WriteBehindBuffer(RecordWriter(tmp_path / "raw"), max_pending=10, batch_size=5)
+        checkpointer = Checkpointer("job-4", tmp_path, buffer=buffer, datasets=["posts"])
+        state = checkpointer.resume_or_start(["a"])
+        buffer.close()
+        assert checkpointer.load().segments == {"posts": 0}
+        assert state.segments == {"posts": 0}
+
+    @pytest.mark.asyncio
+    async def test_save_async(self, tmp_path):
+        """Test that async checkpoints record the sizes of written records"""
+        buffer = WriteBehindBuffer(RecordWriter(tmp_path / "raw"), max_pending=10, batch_size=5)
+        checkpointer = Checkpointer("job-5", tmp_path, buffer=buffer)
+        state = checkpointer.resume_or_start(["a"])
+        await buffer.submit_async("posts", {"id": 1})
+        await checkpointer.save_async(state)
+        buffer.close()
+        assert checkpointer.load().segments == {"posts": len('{"id":1}\n')}
+        checkpointer.clear()
+        assert not checkpointer.segments_path.exists()
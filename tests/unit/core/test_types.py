@@ -0,0 +1,111 @@
+# tests/unit/core/test_types.py
+import pytest
+
+from src.core.types import Comment, Post, Profile, RecordBatch
+from src.fetchers.base_fetcher import BaseFetcher
+from src.utils.storage import RecordWriter
+
+
+class TestRecords:
+    def test_round_trip(self):
+        """Test dict conversion keeps fields and ignores unknown keys"""
+        post = Post.from_dict({"id": "1", "platform": "facebook", "text": "hi", "timestamp": 10.0, "extra": 1})
+        assert post.text == "hi"
+        assert post.reactions == 0
+        data = post.to_dict()
+        assert "extra" not in data
+        assert Post.from_dict(data) == post
+
+    def test_slotted(self):
+        """Test records carry no per-instance dict"""
+        for record in (Post("1", "facebook"), Comment("2", "facebook", "1"), Profile("3", "facebook")):
+            assert not hasattr(record, "__dict__")
+            with pytest.raises(AttributeError):
+                record.unknown = 1
+
+    def test_interned_fields(self):
+        """Test repeated strings share one copy across records"""
+        author = "".join(["auth", "or-1"])
+        first = Post.from_dict({"id": "1", "platform": "facebook", "author_id": author})
+        second = Post.from_dict({"id": "2", "platform": "facebook", "author_id": "".join(["author", "-1"])})
+        assert first.author_id is second.author_id
+
+    def test_dict_like_get(self):
+        """Test records read like dicts for code handling both"""
+        post = Post("1", "facebook", timestamp=5.0)
+        assert post.get("timestamp") == 5.0
+        assert post.get("missing", "default") == "default"
+        assert Post.dataset == "posts"
+
+    def test_sanitize_in_place(self):
+        """Test sanitizing a record strips strings without copying it"""
+        post = Post("1", "facebook", text="  hi  ")
+        assert BaseFetcher.sanitize_data(post) is post
+        assert post.text == "hi"
+
+    def test_written_as_json(self, tmp_path):
+        """Test the record writer serializes records"""
+        writer = RecordWriter(tmp_path)
+        writer.write_batch("posts", [Post("1", "facebook"), {"id": "2"}])
+        writer.close()
+        lines = (tmp_path / "posts.jsonl").read_text().splitlines()
+        assert lines[0].startswith('{"id":"1","platform":"facebook"')
+        assert lines[1] == '{"id":"2"}'
+
+
+class TestRecordBatch:
+    @pytest.fixture
+    def batch(self):
+        return RecordBatch.from_records(Post, [
+            {"id": "1", "platform": "facebook", "text": "héllo", "timestamp": 1.5, "reactions": 2},
+            Post("2", "facebook", reactions=7),
+        ])
+
+    def test_columns(self, batch):
+        """Test fields are stored column by column"""
+        assert len(batch) == 2
+        assert list(batch.column("reactions").values) == [2, 7]
+        assert list(batch.column("timestamp")) == [1.5, None]
+        assert list(batch.column("text").lengths()) == [len("héllo".encode()), 0]
+
+    def test_rows(self, batch):
+        """Test rows come back as records"""
+        assert batch.row(0).text == "héllo"
+        assert batch.row(-1) == Post("2", "facebook", reactions=7)
+        with pytest.raises(IndexError):
+            batch.row(2)
+        assert [post.id for post in batch] == ["1", "2"]
+        assert batch.to_dicts()[1] == Post("2", "facebook", reactions=7).to_dict()
+
+    def test_filter(self, batch):
+        """Test selecting rows keeps every column aligned"""
+        filtered = batch.filter(reactions > 5 for reactions in batch.column("reactions").values)
+        assert len(filtered) == 1
+        assert filtered.row(0).id == "2"
+        assert filtered.row(0).text is None
+
+    def test_invalid_value_leaves_batch_aligned(self, batch):
+        """Test a row with a mistyped value is rejected as a whole"""
+        for bad in ({"id": "3", "platform": "facebook", "text": "x", "reactions": "12"},
+                    {"id": "3", "platform": "facebook", "text": "x", "shares": 3.0}):
+            with pytest.raises(TypeError):
+                batch.append(bad)
+        assert len(batch) == 2
+        assert all(len(column) == 2 for column in batch.columns.values())
+        batch.append({"id": "3", "platform": "facebook", "text": "ok"})
+        assert batch.row(2).text == "ok"
+
+    def test_written_as_json(self, batch, tmp_path):
+        """Test the record writer accepts batches"""
+        writer = RecordWriter(tmp_path)
+        writer.write_batch(batch.dataset, batch)
+        writer.close()
+        assert len((tmp_path / "posts.jsonl").read_text().splitlines()) == 2
+
+    def test_numpy_view(self, batch):
+        """Test numeric columns convert to NumPy arrays"""
+        pytest.importorskip("numpy")
+        assert batch.column("reactions").to_numpy().sum() == 9
+        timestamps = batch.column("timestamp").to_numpy()
+        assert list(timestamps.mask) == [False, True]
+        assert timestamps.sum() == 1.5
@@ -0,0 +1,187 @@
+# tests/unit/fetchers/test_base_fetcher.py
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.browser.session_store import SessionStore
+from src.core.exceptions import CircuitOpenException, DeadlineExceededException, FetchException, InitializationException, NetworkException, ValidationException
+from src.fetchers.base_fetcher import BaseFetcher
+from src.utils.circuit_breaker import CircuitBreaker
+from src.utils.rate_limiter import RateLimiter
+from src.utils.storage import HighWaterMarks
+from src.utils.retry import RetryBudget, RetryPolicy
+
+
+class DummyFetcher(BaseFetcher):
+    async def fetch(self, query: str, **kwargs):
+        await super().fetch(query, **kwargs)
+        return {"data": "test_data"}
+
+    async def extract(self, element):
+        return {"extracted": "test_data"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(tmp_path)
+
+
+@pytest.fixture
+def fetcher(store):
+    return DummyFetcher({"platform": "facebook"}, session_store=store, circuit_breaker=CircuitBreaker("test"))
+
+
+@pytest.fixture
+def mock_page():
+    page = MagicMock()
+    page.close = AsyncMock()
+    page.context.storage_state = AsyncMock(return_value={"cookies": [], "origins": []})
+    return page
+
+
+class TestBaseFetcher:
+    def test_config_merging(self, fetcher):
+        """Test that platform, fetcher and custom config are merged"""
+        assert fetcher.platform == "facebook"
+        assert fetcher.config["base_url"] == "https://facebook.com"
+        assert fetcher.timeout == fetcher.config["timeout_ms"]
+        assert fetcher.retry_attempts == fetcher.config["retry"]["attempts"]
+
+    def test_initialize_requires_page(self, fetcher):
+        """Test that initialization rejects a missing page"""
+        with pytest.raises(InitializationException):
+            fetcher.initialize(None)
+
+    @pytest.mark.asyncio
+    async def test_fetch_requires_initialization(self, fetcher, mock_page):
+        """Test that fetching before initialization fails"""
+        with pytest.raises(FetchException):
+            await fetcher.fetch("query")
+        fetcher.initialize(mock_page)
+        assert await fetcher.fetch("query") == {"data": "test_data"}
+
+    @pytest.mark.asyncio
+    async def test_goto_uses_remaining_budget(self, store, mock_page):
+        """Test that navigation times out with the fetch's remaining budget"""
+        fetcher = DummyFetcher({"platform": "facebook"}, session_store=store, rate_limiter=RateLimiter(100))
+        mock_page.goto = AsyncMock()
+        fetcher.initialize(mock_page)
+        await fetcher.goto("https://example.com", deadline=fetcher.new_deadline(2000))
+        assert mock_page.goto.call_args.kwargs["timeout"] <= 2000
+
+        with pytest.raises(DeadlineExceededException):
+            await fetcher.goto("https://example.com", deadline=fetcher.new_deadline(0))
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_page(self, fetcher, mock_page):
+        """Test that leaving the context closes the page"""
+        async with fetcher:
+            fetcher.initialize(mock_page)
+        mock_page.close.assert_awaited_once()
+        assert fetcher.page is None
+        assert not fetcher.is_initialized
+
+    @pytest.mark.asyncio
+    async def test_session_round_trip(self, fetcher, mock_page):
+        """Test that sessions are saved to and loaded from the session store"""
+        assert fetcher.load_session() is None
+        assert fetcher.session_needs_refresh()
+
+        fetcher.initialize(mock_page)
+        await fetcher.save_session()
+        assert fetcher.load_session() == {"cookies": [], "origins": []}
+        assert not fetcher.session_needs_refresh()
+
+    @pytest.mark.asyncio
+    @patch("src.utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_backs_off_then_succeeds(self, mock_sleep, fetcher):
+        """Test that retryable failures are retried with jittered backoff"""
+        operation = AsyncMock(side_effect=[NetworkException("timeout"), "success"])
+        assert await fetcher._retry(operation) == "success"
+        assert operation.await_count == 2
+        delay = mock_sleep.await_args.args[0]
+        assert 0 <= delay <= fetcher.retry_policy.base_delay_ms / 1000
+
+    @pytest.mark.asyncio
+    @patch("src.utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_exhaustion(self, mock_sleep, fetcher):
+        """Test that exhausting attempts raises a FetchException"""
+        operation = AsyncMock(side_effect=NetworkException("down"))
+        with pytest.raises(FetchException):
+            await fetcher._retry(operation, attempts=2)
+        assert operation.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_permanent_errors_are_not_retried(self, fetcher):
+        """Test that non-retryable exceptions propagate immediately"""
+        operation = AsyncMock(side_effect=ValidationException("bad record"))
+        with pytest.raises(ValidationException):
+            await fetcher._retry(operation)
+        assert operation.await_count == 1
+
+    @pytest.mark.asyncio
+    @patch("src.utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_budget_shared_across_operations(self, mock_sleep, store):
+        """Test that the job's retry budget caps retries across operations"""
+        fetcher = DummyFetcher({"platform": "facebook"}, session_store=store, retry_budget=RetryBudget(1),
+                               circuit_breaker=CircuitBreaker("test"))
+        first = AsyncMock(side_effect=[NetworkException(), "ok"])
+        second = AsyncMock(side_effect=NetworkException())
+        assert await fetcher._retry(first) == "ok"
+        with pytest.raises(FetchException):
+            await fetcher._retry(second, policy=RetryPolicy(attempts=5))
+        assert second.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self, store):
+        """Test that an open circuit rejects attempts without calling the operation"""
+        breaker = CircuitBreaker("test", min_calls=1)
+        breaker.record_failure()
+        fetcher = DummyFetcher({"platform": "facebook"}, session_store=store, circuit_breaker=breaker)
+        operation = AsyncMock(return_value="ok")
+        with pytest.raises(CircuitOpenException):
+            await fetcher._retry(operation)
+        operation.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_collect_extracts_per_step(self, fetcher, mock_page):
+        """Test that collect extracts and sanitizes each batch the scroller hands over"""
+        scroller = MagicMock()
+
+        async def scroll(target_items=0, deadline=None, on_items=None):
+            await on_items(["a", "b"])
+            await on_items(["c"])
+            return True
+
+        scroller.scroll = scroll
+        fetcher.initialize(mock_page)
+        records = []
+        assert await fetcher.collect(scroller, records.extend) == 3
+        assert records == [{"extracted": "test_data"}] * 3
+
+    @pytest.mark.asyncio
+    async def test_collect_stops_at_high_water_mark(self, fetcher, mock_page, tmp_path):
+        """Test that incremental collection drops seen records and stops the scroller"""
+        marks = HighWaterMarks(tmp_path / "marks.json")
+        marks.observe("group-1", timestamp=100, item_id=100)
+        marks.commit()
+        fetcher.extract = AsyncMock(side_effect=lambda element: {"id": element, "timestamp": element})
+        scroller = MagicMock()
+
+        async def scroll(target_items=0, deadline=None, on_items=None):
+            # Pinned old post first, then new posts, then content from the last run
+            await on_items([50, 130, 120, 110, 100, 90, 80, 70])
+            return True
+
+        scroller.scroll = scroll
+        fetcher.initialize(mock_page)
+        records = []
+        assert await fetcher.collect(scroller, records.extend, source="group-1", marks=marks) == 3
+        assert [record["id"] for record in records] == [130, 120, 110]
+        scroller.stop.assert_called_once()
+        marks.commit()
+        assert marks.get("group-1")["timestamp"] == 130
+
+    def test_sanitize_data(self):
+        """Test that top-level strings are stripped"""
+        assert BaseFetcher.sanitize_data({"a": " x ", "b": 1}) == {"a": "x", "b": 1}
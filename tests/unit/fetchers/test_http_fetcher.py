@@ -0,0 +1,149 @@
+# tests/unit/fetchers/test_http_fetcher.py
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.browser.session_store import SessionStore
+from src.core.constants import CircuitState, FetchMode
+from src.core.exceptions import ClientErrorException, FetchException, NetworkException, SessionException
+from src.fetchers.base_fetcher import BaseFetcher
+from src.fetchers import http_fetcher
+from src.fetchers.http_fetcher import HttpFetcher
+from src.utils.circuit_breaker import CircuitBreaker
+from src.utils.rate_limiter import RateLimiter
+
+STATE = {"cookies": [{"name": "c_user", "value": "1", "domain": ".facebook.com", "path": "/"}], "origins": []}
+
+
+class DummyFetcher(BaseFetcher):
+    async def fetch(self, query: str, **kwargs):
+        return {}
+
+    async def extract(self, element):
+        return {}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SessionStore(tmp_path)
+    store.save("facebook", STATE)
+    return store
+
+
+@pytest.fixture
+def playwright():
+    response = MagicMock(ok=True, status=200)
+    response.json = AsyncMock(return_value={"items": [1, 2]})
+    context = MagicMock()
+    context.fetch = AsyncMock(return_value=response)
+    context.dispose = AsyncMock()
+    playwright = MagicMock()
+    playwright.request.new_context = AsyncMock(return_value=context)
+    return playwright
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    """A fresh breaker opening on the first failure, instead of the shared platform one"""
+    breaker = CircuitBreaker("test", min_calls=1)
+    monkeypatch.setattr(http_fetcher, "get_circuit_breaker", lambda key: breaker)
+    return breaker
+
+
+@pytest.fixture
+def limiter():
+    limiter = RateLimiter(100)
+    limiter.acquire = AsyncMock()
+    return limiter
+
+
+class TestHttpFetcher:
+    @pytest.mark.asyncio
+    async def test_uses_stored_cookies(self, playwright, store, limiter):
+        """Test that the request context is created from the stored session"""
+        async with HttpFetcher(playwright, {"platform": "facebook"}, store, limiter):
+            pass
+        kwargs = playwright.request.new_context.call_args.kwargs
+        assert kwargs["storage_state"] == STATE
+        assert kwargs["base_url"] == "https://facebook.com"
+
+    @pytest.mark.asyncio
+    async def test_get_json_goes_through_rate_limiter(self, playwright, store, limiter):
+        """Test that every request acquires the rate limiter"""
+        async with HttpFetcher(playwright, {"platform": "facebook"}, store, limiter) as http:
+            assert await http.get_json("/api/items", params={"page": 1}) == {"items": [1, 2]}
+            await http.get_json("/api/items")
+        assert limiter.acquire.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self, playwright, store, limiter):
+        """Test that error responses raise a NetworkException"""
+        context = await playwright.request.new_context()
+        context.fetch.return_value = MagicMock(ok=False, status=503, headers={"retry-after": "30"})
+        async with HttpFetcher(playwright, {"platform": "facebook"}, store, limiter) as http:
+            with pytest.raises(NetworkException) as exc_info:
+                await http.request("/api/items")
+        assert exc_info.value.details["status"] == 503
+        assert exc_info.value.retry_after == 30
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status,retry_after", [(408, None), (429, 5), (500, None), (502, None)])
+    async def test_transient_status_raises_network_exception(
+            self, playwright, store, limiter, breaker, status, retry_after):
+        """Test that timeouts, throttling and server errors are retryable and trip the breaker"""
+        headers = {} if retry_after is None else {"retry-after": str(retry_after)}
+        context = await playwright.request.new_context()
+        context.fetch.return_value = MagicMock(ok=False, status=status, headers=headers)
+        async with HttpFetcher(playwright, {"platform": "facebook"}, store, limiter) as http:
+            with pytest.raises(NetworkException) as exc_info:
+                await http.request("/api/items")
+        assert exc_info.value.retryable
+        assert exc_info.value.retry_after == retry_after
+        assert breaker.state is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [400, 404, 422])
+    async def test_client_error_is_permanent(self, playwright, store, limiter, breaker, status):
+        """Test that other 4xx responses are neither retried nor counted against the platform"""
+        context = await playwright.request.new_context()
+        context.fetch.return_value = MagicMock(ok=False, status=status, headers={})
+        async with HttpFetcher(playwright, {"platform": "facebook"}, store, limiter) as http:
+            for _ in range(3):
+                with pytest.raises(ClientErrorException) as exc_info:
+                    await http.request("/api/items")
+        assert not exc_info.value.retryable
+        assert exc_info.value.details["status"] == status
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_rejected_session_raises_session_exception(self, playwright, store, limiter):
+        """Test that 401/403 responses ask for a session refresh"""
+        context = await playwright.request.new_context()
+        context.fetch.return_value = MagicMock(ok=False, status=401, headers={})
+        async with HttpFetcher(playwright, {"platform": "facebook"}, store, limiter) as http:
+            with pytest.raises(SessionException) as exc_info:
+                await http.request("/api/items")
+        assert exc_info.value.refresh_session
+
+    @pytest.mark.asyncio
+    async def test_requires_session_and_start(self, playwright, tmp_path, limiter):
+        """Test that the fetcher needs a stored session and must be started"""
+        http = HttpFetcher(playwright, {"platform": "facebook"}, SessionStore(tmp_path), limiter)
+        with pytest.raises(FetchException):
+            await http.request("/api/items")
+        with pytest.raises(SessionException):
+            await http.start()
+
+
+class TestFetchModeSelection:
+    def test_defaults_to_browser(self, store):
+        """Test that unconfigured query types use the browser"""
+        fetcher = DummyFetcher({"platform": "facebook"}, session_store=store)
+        assert fetcher.fetch_mode("posts") is FetchMode.BROWSER
+
+    def test_http_per_query_type(self, playwright, store, limiter):
+        """Test that configured query types use the HTTP path when attached"""
+        config = {"platform": "facebook", "fetch_modes": {"comments": "http"}}
+        http = HttpFetcher(playwright, config, store, limiter)
+        assert DummyFetcher(config, session_store=store, http_fetcher=http).fetch_mode("comments") is FetchMode.HTTP
+        assert DummyFetcher(config, session_store=store).fetch_mode("comments") is FetchMode.BROWSER
@@ -0,0 +1,108 @@
+# tests/unit/utils/test_circuit_breaker.py
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.constants import CircuitState
+from src.core.exceptions import CircuitOpenException, NetworkException, ValidationException
+from src.utils.circuit_breaker import CircuitBreaker, get_circuit_breaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("test", failure_rate=0.5, window_size=4, min_calls=4, open_ms=1000, clock=clock)
+
+
+def trip(breaker):
+    for _ in range(breaker.min_calls):
+        breaker.record_failure(NetworkException("down"))
+
+
+class TestCircuitBreaker:
+    def test_stays_closed_below_min_calls(self, breaker):
+        """Test that a few failures do not open the circuit"""
+        for _ in range(3):
+            breaker.record_failure(NetworkException("down"))
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_opens_at_failure_rate(self, breaker):
+        """Test that the circuit opens once the window's failure rate reaches the threshold"""
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure(NetworkException("down"))
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure(NetworkException("down"))
+        assert breaker.state is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self, breaker):
+        """Test that calls are rejected without running while the circuit is open"""
+        trip(breaker)
+        operation = AsyncMock(return_value="ok")
+        with pytest.raises(CircuitOpenException) as exc_info:
+            await breaker.call(operation)
+        operation.assert_not_awaited()
+        assert exc_info.value.retry_after == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_successful_probe_closes(self, breaker, clock):
+        """Test that a successful probe after open_ms closes the circuit"""
+        trip(breaker)
+        clock.now = 1.0
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert await breaker.call(AsyncMock(return_value="ok")) == "ok"
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_reopens(self, breaker, clock):
+        """Test that a failed probe opens the circuit for another open_ms"""
+        trip(breaker)
+        clock.now = 1.0
+        with pytest.raises(NetworkException):
+            await breaker.call(AsyncMock(side_effect=NetworkException("still down")))
+        assert breaker.state is CircuitState.OPEN
+        clock.now = 1.5
+        assert breaker.state is CircuitState.OPEN
+
+    def test_half_open_limits_probes(self, breaker, clock):
+        """Test that only probe_calls calls are admitted while half-open"""
+        trip(breaker)
+        clock.now = 1.0
+        breaker.before_call()
+        with pytest.raises(CircuitOpenException):
+            breaker.before_call()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_releases_slot(self, breaker, clock):
+        """Test that a cancelled probe frees its slot without closing or reopening the circuit"""
+        trip(breaker)
+        clock.now = 1.0
+        with pytest.raises(asyncio.CancelledError):
+            await breaker.call(AsyncMock(side_effect=asyncio.CancelledError()))
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_call()
+
+    def test_ignored_exceptions_do_not_count(self, breaker):
+        """Test that permanent errors say nothing about the target's health"""
+        for _ in range(10):
+            breaker.record_failure(ValidationException("bad record"))
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_registry_shares_breakers(self):
+        """Test that fetchers for the same key share one breaker"""
+        assert get_circuit_breaker("registry-test") is get_circuit_breaker("registry-test")
+        assert get_circuit_breaker("registry-test") is not get_circuit_breaker("registry-test:search")
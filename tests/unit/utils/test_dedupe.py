@@ -0,0 +1,104 @@
+# tests/unit/utils/test_dedupe.py
+import json
+
+import pytest
+
+from src.core.constants import DuplicateAction
+from src.core.exceptions import StorageException
+from src.core.types import Post
+from src.utils.dedupe import DedupeIndex, MinHasher, dedupe_dataset, normalize_text, similarity
+
+ORIGINAL = ("Lemon prices at the market jumped again this week, vendors blame the late frost "
+            "and rising transport costs across the whole region")
+
+
+@pytest.fixture
+def index(tmp_path):
+    with DedupeIndex(tmp_path / "index.sqlite") as index:
+        yield index
+
+
+def test_normalize_text():
+    """Test case, links and punctuation do not matter"""
+    assert normalize_text("Look: https://t.co/x LEMONS!!") == ["look", "lemons"]
+
+
+def test_signature_similarity():
+    """Test signatures estimate similarity of near and far texts"""
+    hasher = MinHasher()
+    original = hasher.signature(ORIGINAL)
+    assert similarity(original, hasher.signature("Shared: " + ORIGINAL + " #lemons")) > 0.7
+    assert similarity(original, hasher.signature("A completely different post about weekend football")) < 0.2
+    assert hasher.signature("!!!") is None
+    assert MinHasher().signature(ORIGINAL) == original
+
+
+class TestDedupeIndex:
+    def test_marks_near_duplicates(self, index):
+        """Test reshares are marked with the first post of their cluster"""
+        records = [
+            {"id": "1", "text": ORIGINAL},
+            {"id": "2", "text": "Something else entirely, about the football match on Sunday"},
+            {"id": "3", "text": ORIGINAL.upper() + " https://example.com/share"},
+            Post("4", "facebook", text=ORIGINAL + "!"),
+        ]
+        result = index.dedupe(records, DuplicateAction.MARK)
+        assert len(result) == 4
+        assert "duplicate_of" not in records[0] and "duplicate_of" not in records[1]
+        assert records[2]["duplicate_of"] == "1"
+        assert records[3].duplicate_of == "1"
+        assert index.stats() == {"posts": 4, "duplicates": 2}
+
+    def test_drops_duplicates_across_batches(self, index):
+        """Test the index persists between batches and duplicates can be dropped"""
+        index.dedupe([{"id": "1", "text": ORIGINAL}])
+        result = index.dedupe([{"id": "2", "text": ORIGINAL}, {"id": "3", "text": "Unrelated text"}],
+                              DuplicateAction.DROP)
+        assert [record["id"] for record in result] == ["3"]
+
+    def test_records_without_text_pass(self, index):
+        """Test records without an id or text are kept as they are"""
+        records = [{"id": "1"}, {"text": ORIGINAL}, {"id": "2", "text": ""}]
+        assert index.dedupe(records, DuplicateAction.DROP) == records
+
+    def test_reindexing_is_idempotent(self, index):
+        """Test records processed again in a new run keep their verdict"""
+        index.dedupe([{"id": "1", "text": ORIGINAL}, {"id": "2", "text": ORIGINAL}])
+        index.new_run()
+        again = [{"id": "1", "text": ORIGINAL}, {"id": "2", "text": ORIGINAL}]
+        assert index.dedupe(again, DuplicateAction.MARK) == again
+        assert "duplicate_of" not in again[0]
+        assert again[1]["duplicate_of"] == "1"
+        assert index.stats()["posts"] == 2
+
+    def test_repeated_ids_dropped(self, index):
+        """Test a post ID seen twice in a run is only kept once"""
+        records = [{"id": "1", "text": ORIGINAL}, {"id": "1", "text": ORIGINAL}]
+        assert index.dedupe(records, DuplicateAction.MARK) == records[:1]
+        assert index.dedupe([{"id": 1, "text": ORIGINAL}], DuplicateAction.MARK) == []
+
+    def test_only_representatives_bucketed(self, index):
+        """Test cluster members are not bucketed, so lookups stay one comparison"""
+        index.dedupe([{"id": str(i), "text": "thanks for sharing"} for i in range(300)])
+        assert index.stats() == {"posts": 300, "duplicates": 299}
+        assert index._db.execute("SELECT COUNT(DISTINCT id) FROM buckets").fetchone()[0] == 1
+
+
+def test_dedupe_dataset(tmp_path, index):
+    """Test the pipeline stage streams raw records into the processed dataset"""
+    raw_dir, processed_dir = tmp_path / "raw", tmp_path / "processed"
+    raw_dir.mkdir()
+    lines = [{"id": "1", "text": ORIGINAL}, {"id": "2", "text": ORIGINAL + " (edited)"}, {"id": "3", "text": "Other"}]
+    (raw_dir / "posts.jsonl").write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+
+    assert dedupe_dataset("posts", index, raw_dir, processed_dir) == {"read": 3, "written": 3}
+    processed = [json.loads(line) for line in (processed_dir / "posts.jsonl").read_text().splitlines()]
+    assert [record.get("duplicate_of") for record in processed] == [None, "1", None]
+
+    # Running the stage again replaces its output
+    assert dedupe_dataset("posts", index, raw_dir, processed_dir) == {"read": 3, "written": 3}
+    assert len((processed_dir / "posts.jsonl").read_text().splitlines()) == 3
+    assert not (processed_dir / "posts.partial.jsonl").exists()
+
+    with pytest.raises(StorageException):
+        dedupe_dataset("comments", index, raw_dir, processed_dir)
@@ -0,0 +1,39 @@
+# tests/unit/utils/test_rate_limiter.py
+import asyncio
+import time
+
+import pytest
+
+from src.utils.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    def test_rejects_non_positive_limit(self):
+        """Test that a limiter needs at least one request per window"""
+        with pytest.raises(ValueError):
+            RateLimiter(0)
+
+    @pytest.mark.asyncio
+    async def test_min_interval_between_requests(self):
+        """Test that consecutive requests are spaced by the minimum delay"""
+        limiter = RateLimiter(100, min_interval_ms=30)
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+        assert time.monotonic() - start >= 0.06
+
+    @pytest.mark.asyncio
+    async def test_window_limit(self):
+        """Test that requests beyond the window limit wait for the window to slide"""
+        limiter = RateLimiter(2, window_s=0.1)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+        assert time.monotonic() - start >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_context_manager(self):
+        """Test that the limiter can guard a block"""
+        limiter = RateLimiter(1)
+        async with limiter:
+            pass
+        assert len(limiter._sent) == 1
@@ -0,0 +1,174 @@
+# tests/unit/utils/test_retry.py
+import asyncio
+import random
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.exceptions import (
+    ConfigurationException, NetworkException, DeadlineExceededException,
+    CircuitOpenException, SessionException, RetriesExhaustedException
+)
+from src.utils.retry import RetryPolicy, RetryBudget, Deadline, with_timeout, retry_async
+
+FAST = RetryPolicy(attempts=3, base_delay_ms=20, max_delay_ms=20)
+
+
+class TestRetryPolicy:
+    def test_from_config(self):
+        """Test that the policy reads the fetcher.retry section"""
+        policy = RetryPolicy.from_config({"attempts": 5, "delay_ms": 100, "max_delay_ms": 800})
+        assert policy.attempts == 5
+        assert policy.base_delay_ms == 100
+        assert policy.max_delay_ms == 800
+
+    def test_backoff_grows_exponentially_with_full_jitter(self):
+        """Test that delays stay below the capped exponential ceiling"""
+        policy = RetryPolicy(base_delay_ms=100, max_delay_ms=1000, multiplier=2)
+        rng = random.Random(42)
+        for attempt, ceiling in ((1, 100), (2, 200), (3, 400), (4, 800), (5, 1000), (10, 1000)):
+            delays = [policy.backoff_ms(attempt, rng) for _ in range(200)]
+            assert all(0 <= d <= ceiling for d in delays)
+            assert max(delays) > ceiling * 0.8
+
+    def test_jitter_spreads_workers(self):
+        """Test that simultaneous failures do not back off in lockstep"""
+        policy = RetryPolicy(base_delay_ms=1000)
+        delays = {round(policy.backoff_ms(3, random.Random(seed))) for seed in range(20)}
+        assert len(delays) > 10
+
+    def test_retryability(self):
+        """Test per-exception retry decisions"""
+        policy = RetryPolicy()
+        assert policy.is_retryable(NetworkException("timeout"))
+        assert not policy.is_retryable(ConfigurationException("bad config"))
+        assert not policy.is_retryable(CircuitOpenException("open"))
+        narrowed = policy.with_overrides(retry_on=(KeyError,))
+        assert narrowed.is_retryable(KeyError())
+        assert not narrowed.is_retryable(NetworkException())
+        assert policy.with_overrides(attempts=None) is policy
+
+    def test_retry_after_floors_the_delay(self):
+        """Test that a retry_after hint overrides a shorter backoff"""
+        policy = RetryPolicy(base_delay_ms=100, max_delay_ms=100)
+        assert policy.delay_for(NetworkException(retry_after=5), 1) == 5
+        assert policy.delay_for(NetworkException(), 1) <= 0.1
+
+
+class TestRetryBudget:
+    def test_budget_is_exhausted(self):
+        """Test that the budget allows only max_retries retries"""
+        budget = RetryBudget(2)
+        assert budget.try_spend()
+        assert budget.try_spend()
+        assert not budget.try_spend()
+        assert budget.remaining == 0
+
+
+class TestDeadline:
+    def test_unbounded(self):
+        """Test that a deadline without timeout never expires"""
+        deadline = Deadline()
+        assert deadline.remaining() is None
+        assert not deadline.expired
+        assert deadline.timeout_s(5) == 5
+
+    def test_remaining_caps_timeouts(self):
+        """Test that timeouts never exceed the remaining time"""
+        deadline = Deadline.after_ms(1000)
+        assert deadline.timeout_s(30) <= 1
+        assert deadline.timeout_s(0.5) == 0.5
+
+    def test_expired_deadline_raises(self):
+        """Test that checking an expired deadline raises"""
+        deadline = Deadline(0)
+        assert deadline.expired
+        with pytest.raises(DeadlineExceededException):
+            deadline.check()
+
+    def test_timeout_ms(self):
+        """Test millisecond timeouts for Playwright calls"""
+        assert Deadline().timeout_ms(5000) == 5000
+        assert Deadline.after_ms(1000).timeout_ms(30000) <= 1000
+        assert Deadline(0).timeout_ms(30000) == 1
+
+    def test_phases_are_timed_and_checked(self):
+        """Test that phases record their duration and refuse to start past the deadline"""
+        deadline = Deadline(1)
+        with deadline.phase("navigation"):
+            time.sleep(0.01)
+        assert deadline.phases["navigation"] >= 0.01
+        with pytest.raises(DeadlineExceededException):
+            with Deadline(0).phase("scroll"):
+                pass
+
+
+class TestAsyncPrimitives:
+    @pytest.mark.asyncio
+    async def test_with_timeout(self):
+        """Test that slow awaitables are cut off by the deadline"""
+        assert await with_timeout(asyncio.sleep(0, result="done"), 1) == "done"
+        with pytest.raises(DeadlineExceededException):
+            await with_timeout(asyncio.sleep(1), timeout_s=5, deadline=Deadline(0.02))
+
+    @pytest.mark.asyncio
+    async def test_retry_async_succeeds_after_failures(self):
+        """Test that retryable failures are retried"""
+        operation = AsyncMock(side_effect=[NetworkException(), NetworkException(), "ok"])
+        assert await retry_async(operation, policy=FAST) == "ok"
+        assert operation.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_retry_async_refreshes_session(self):
+        """Test that session failures renew the session before the next attempt"""
+        refresh = AsyncMock()
+        operation = AsyncMock(side_effect=[SessionException("expired"), "ok"])
+        assert await retry_async(operation, policy=FAST, on_refresh=refresh) == "ok"
+        refresh.assert_awaited_once()
+
+        refresh.reset_mock()
+        operation = AsyncMock(side_effect=[NetworkException(), "ok"])
+        assert await retry_async(operation, policy=FAST, on_refresh=refresh) == "ok"
+        refresh.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_retry_async_exhaustion_and_budget(self):
+        """Test exhaustion of attempts and of the shared budget"""
+        with pytest.raises(RetriesExhaustedException) as exc_info:
+            await retry_async(AsyncMock(side_effect=NetworkException()), policy=FAST)
+        assert not FAST.is_retryable(exc_info.value)
+        assert exc_info.value.trips_breaker
+
+        operation = AsyncMock(side_effect=SessionException("expired"))
+        with pytest.raises(RetriesExhaustedException) as exc_info:
+            await retry_async(operation, policy=FAST, budget=RetryBudget(0))
+        assert operation.await_count == 1
+        assert not exc_info.value.retryable
+        assert not exc_info.value.trips_breaker
+
+    @pytest.mark.asyncio
+    async def test_retry_async_respects_deadline(self):
+        """Test that no retry starts when the backoff would overrun the deadline"""
+        slow_backoff = RetryPolicy(attempts=5, base_delay_ms=10000, max_delay_ms=10000)
+        operation = AsyncMock(side_effect=NetworkException())
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededException):
+            await retry_async(operation, policy=slow_backoff, deadline=Deadline(0.05))
+        assert time.monotonic() - start < 1
+
+    @pytest.mark.asyncio
+    async def test_backoff_does_not_block_other_tasks(self):
+        """Test that a task waiting out a backoff lets other tasks progress"""
+        progress = []
+
+        async def other_page():
+            for i in range(5):
+                progress.append(i)
+                await asyncio.sleep(0.005)
+
+        failing = AsyncMock(side_effect=[NetworkException(), "ok"])
+        policy = RetryPolicy(attempts=2, base_delay_ms=100, max_delay_ms=100)
+        results = await asyncio.gather(retry_async(failing, policy=policy), other_page())
+        assert results[0] == "ok"
+        assert progress == [0, 1, 2, 3, 4]
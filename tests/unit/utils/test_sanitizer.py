@@ -0,0 +1,64 @@
+# tests/unit/utils/test_sanitizer.py
+import pytest
+
+from src.core.types import Post, RecordBatch
+from src.utils.sanitizer import sanitize_batch, sanitize_text, sanitize_value
+
+
+@pytest.mark.parametrize("raw,expected", [
+    (" value ", "value"),
+    ("\n value \t", "value"),
+    ("a\x00b\u200bc", "abc"),
+    ("line\r\nbreak", "line\nbreak"),
+    ("line\rbreak", "line\nbreak"),
+    ("a\r\n\r\nb", "a\n\nb"),
+    ("non\xa0breaking\u2003space", "non breaking space"),
+    ("para\u2029graph", "para\ngraph"),
+])
+def test_sanitize_text(raw, expected):
+    """Test whitespace normalization and control character removal"""
+    assert sanitize_text(raw) == expected
+
+
+@pytest.mark.parametrize("raw,expected", [
+    ({"key": " value "}, {"key": "value"}),
+    ({"key": None}, {}),
+    ({"key": [" item1 ", "\n item2\t"]}, {"key": ["item1", "item2"]}),
+    ({"a": {"b": [{"c": " x ", "d": None}], "e": 1}}, {"a": {"b": [{"c": "x"}], "e": 1}}),
+])
+def test_sanitize_value(raw, expected):
+    """Test nested structures are cleaned and None values dropped"""
+    assert sanitize_value(raw) == expected
+
+
+def test_clean_values_not_copied():
+    """Test already clean data comes back as the same objects"""
+    record = {"text": "multi\nline", "tags": ["a", "b"], "meta": {"n": 1}}
+    assert sanitize_value(record) is record
+    dirty = {"text": "multi\nline", "tags": ["a", " b "], "meta": {"n": 1}}
+    clean = sanitize_value(dirty)
+    assert clean is not dirty
+    assert clean["meta"] is dirty["meta"]
+    assert dirty["tags"] == ["a", " b "]
+
+
+def test_sanitize_batch():
+    """Test a batch of dicts and records is sanitized in one call"""
+    post = Post("1", "facebook", text=" hi ")
+    batch = [{"id": " 2 ", "x": None}, post]
+    assert sanitize_batch(batch) == [{"id": "2"}, post]
+    assert post.text == "hi"
+    clean = [{"id": "3"}]
+    assert sanitize_batch(clean) is clean
+
+
+def test_sanitize_record_batch():
+    """Test string columns of a RecordBatch are sanitized"""
+    batch = RecordBatch.from_records(Post, [{"id": "1", "platform": "facebook", "text": "\tok "},
+                                            {"id": "2", "platform": "facebook"}])
+    text = batch.column("text")
+    ids = batch.column("id")
+    assert sanitize_batch(batch) is batch
+    assert list(batch.column("text")) == ["ok", None]
+    assert batch.column("text") is not text
+    assert batch.column("id") is ids
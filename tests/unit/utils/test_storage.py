@@ -0,0 +1,158 @@
+# tests/unit/utils/test_storage.py
+import asyncio
+import json
+import threading
+
+import pytest
+
+from src.core.exceptions import StorageException
+from src.utils.storage import RecordWriter, WriteBehindBuffer, HighWaterMarks
+
+
+class SlowWriter(RecordWriter):
+    """Writer that blocks until released, simulating a stalled disk"""
+
+    def __init__(self, base_dir):
+        super().__init__(base_dir)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def write_batch(self, dataset, records):
+        self.started.set()
+        self.release.wait()
+        super().write_batch(dataset, records)
+
+
+class FailingWriter(RecordWriter):
+    def write_batch(self, dataset, records):
+        raise OSError("disk full")
+
+
+def read_records(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestRecordWriter:
+    def test_appends_json_lines_per_dataset(self, tmp_path):
+        """Test that batches are appended to one file per dataset"""
+        writer = RecordWriter(tmp_path)
+        writer.write_batch("facebook/posts", [{"id": 1}, {"id": 2}])
+        writer.write_batch("facebook/posts", [{"id": 3}])
+        writer.close()
+
+        assert read_records(tmp_path / "facebook" / "posts.jsonl") == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    def test_accepts_dict_subclasses(self, tmp_path):
+        """Test that dict subclasses are written as dicts"""
+        class Row(dict):
+            pass
+
+        writer = RecordWriter(tmp_path)
+        writer.write_batch("posts", [Row(id=1)])
+        writer.close()
+        assert read_records(tmp_path / "posts.jsonl") == [{"id": 1}]
+
+
+class TestWriteBehindBuffer:
+    def test_close_flushes_pending_records(self, tmp_path):
+        """Test that everything submitted is on disk after close"""
+        with WriteBehindBuffer(RecordWriter(tmp_path), max_pending=10, batch_size=3) as buffer:
+            for i in range(25):
+                buffer.submit("posts", {"id": i})
+
+        assert [r["id"] for r in read_records(tmp_path / "posts.jsonl")] == list(range(25))
+        assert buffer.written == 25
+
+    def test_flush_waits_for_writer(self, tmp_path):
+        """Test that flush returns only after records are written"""
+        buffer = WriteBehindBuffer(RecordWriter(tmp_path), max_pending=10, batch_size=5)
+        buffer.submit("posts", {"id": 1})
+        buffer.flush()
+        assert read_records(tmp_path / "posts.jsonl") == [{"id": 1}]
+        buffer.close()
+
+    def test_full_buffer_applies_backpressure(self, tmp_path):
+        """Test that submit blocks instead of growing past max_pending"""
+        writer = SlowWriter(tmp_path)
+        buffer = WriteBehindBuffer(writer, max_pending=2, batch_size=1)
+
+        buffer.submit("posts", {"id": 0})
+        assert writer.started.wait(timeout=1)  # taken by the stalled writer thread
+        buffer.submit("posts", {"id": 1})
+        buffer.submit("posts", {"id": 2})
+        with pytest.raises(StorageException):
+            buffer.submit("posts", {"id": 3}, timeout=0.05)
+        assert buffer.pending == 2
+
+        writer.release.set()
+        buffer.close()
+        assert [r["id"] for r in read_records(tmp_path / "posts.jsonl")] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_submit_async_yields_while_full(self, tmp_path):
+        """Test that async submission waits for space without blocking the loop"""
+        writer = SlowWriter(tmp_path)
+        buffer = WriteBehindBuffer(writer, max_pending=1, batch_size=1)
+        await buffer.submit_async("posts", {"id": 0})
+        assert writer.started.wait(timeout=1)
+        await buffer.submit_async("posts", {"id": 1})
+
+        pending = asyncio.create_task(buffer.submit_async("posts", {"id": 2}))
+        await asyncio.sleep(0.05)
+        assert not pending.done()
+
+        writer.release.set()
+        await asyncio.wait_for(pending, timeout=1)
+        buffer.close()
+        assert len(read_records(tmp_path / "posts.jsonl")) == 3
+
+    def test_writer_failure_is_reported(self, tmp_path):
+        """Test that writer errors surface to producers instead of hanging them"""
+        buffer = WriteBehindBuffer(FailingWriter(tmp_path), max_pending=5, batch_size=5)
+        buffer.submit("posts", {"id": 1})
+        with pytest.raises(StorageException):
+            buffer.flush()
+        with pytest.raises(StorageException):
+            buffer.submit("posts", {"id": 2})
+        with pytest.raises(StorageException):
+            buffer.close()
+
+    def test_submit_after_close_fails(self, tmp_path):
+        """Test that a closed buffer rejects new records"""
+        buffer = WriteBehindBuffer(RecordWriter(tmp_path), max_pending=5)
+        buffer.close()
+        with pytest.raises(StorageException):
+            buffer.submit("posts", {"id": 1})
+
+
+class TestHighWaterMarks:
+    def test_marks_move_only_on_commit(self, tmp_path):
+        """Test that observed items are not treated as seen before commit"""
+        marks = HighWaterMarks(tmp_path / "marks.json", recent_ids=10)
+        marks.observe("group-1", timestamp=200, item_id="b")
+        assert not marks.is_seen("group-1", timestamp=150)
+        marks.commit()
+        assert marks.is_seen("group-1", timestamp=150)
+        assert marks.is_seen("group-1", timestamp=200, item_id="b")
+        assert not marks.is_seen("group-1", timestamp=200, item_id="c")
+        assert not marks.is_seen("group-1", timestamp=201)
+        assert not marks.is_seen("group-2", timestamp=1)
+
+    def test_ids_without_timestamps(self, tmp_path):
+        """Test that feeds without timestamps fall back to the newest IDs"""
+        marks = HighWaterMarks(tmp_path / "marks.json", recent_ids=2)
+        for item_id in ("c", "b", "a"):
+            marks.observe("page", item_id=item_id)
+        marks.commit()
+        assert marks.get("page")["ids"] == ["c", "b"]
+        assert marks.is_seen("page", item_id="b")
+        assert not marks.is_seen("page", item_id="a")
+
+    def test_marks_persist(self, tmp_path):
+        """Test that committed marks survive a restart and never move backwards"""
+        marks = HighWaterMarks(tmp_path / "marks.json")
+        marks.observe("group-1", timestamp=200)
+        marks.commit()
+        marks.observe("group-1", timestamp=100)
+        marks.commit()
+        assert HighWaterMarks(tmp_path / "marks.json").get("group-1")["timestamp"] == 200
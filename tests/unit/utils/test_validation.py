@@ -0,0 +1,154 @@
+# tests/unit/utils/test_validation.py
+import random
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.constants import ValidationMode
+from src.core.exceptions import ConfigurationException, ValidationException
+from src.core.types import Post, RecordBatch
+from src.utils.validation import (
+    RECORD_SCHEMAS, ExtractorChanges, FieldError, FieldSpec, LazyRecord, RecordValidator, Schema, invalid_indices
+)
+
+
+@pytest.fixture
+def schema():
+    return Schema.for_record(
+        Post,
+        id=FieldSpec(required=True, pattern=r"\d+"),
+        platform=FieldSpec(required=True, choices={"facebook", "instagram"}),
+    )
+
+
+class TestSchema:
+    def test_derived_from_record(self):
+        """Test fields without defaults are required and types follow annotations"""
+        fields = RECORD_SCHEMAS["posts"].fields
+        assert fields["id"].required
+        assert not fields["text"].required
+        assert fields["timestamp"].types == (int, float)
+
+    def test_valid_batch(self, schema):
+        """Test dicts and records that satisfy the schema pass"""
+        records = [{"id": "1", "platform": "facebook", "timestamp": 10}, Post("2", "instagram", text="hi")]
+        assert schema.validate(records) == []
+
+    def test_all_errors_collected(self, schema):
+        """Test every error in the batch is reported with its record index"""
+        records = [
+            {"id": "1", "platform": "facebook"},
+            {"id": "x", "platform": "myspace", "reactions": "3"},
+            {"text": 5},
+        ]
+        errors = schema.validate(records)
+        assert errors == [
+            FieldError(1, "id", "does not match " + r"\d+"),
+            FieldError(1, "platform", "unexpected value 'myspace'"),
+            FieldError(1, "reactions", "expected int, got str"),
+            FieldError(2, "id", "missing"),
+            FieldError(2, "platform", "missing"),
+            FieldError(2, "text", "expected str, got int"),
+        ]
+        assert invalid_indices(errors) == [1, 2]
+
+    def test_record_batch(self, schema):
+        """Test a columnar batch is validated"""
+        batch = RecordBatch.from_records(Post, [{"id": "1", "platform": "facebook"}, {"id": "a", "platform": "facebook"}])
+        assert invalid_indices(schema.validate(batch)) == [1]
+
+    def test_check_raises(self, schema):
+        """Test check raises with the errors in the details"""
+        schema.check([{"id": "1", "platform": "facebook"}])
+        with pytest.raises(ValidationException) as exc_info:
+            schema.check([{"id": "1"}])
+        assert exc_info.value.details["errors"] == [{"index": 0, "field": "platform", "message": "missing"}]
+
+    def test_compiled_once(self, schema):
+        """Test the validator is generated once and reused"""
+        assert schema.validator is schema.validator
+        assert "def validate(records):" in schema.source
+
+    def test_pattern_on_non_string_field(self):
+        """Test patterns are rejected on fields that are not strings"""
+        schema = Schema("bad", {"count": FieldSpec((int,), pattern=r"\d+")})
+        with pytest.raises(ConfigurationException):
+            schema.compile()
+
+
+class TestLazyRecord:
+    def test_fields_checked_on_access(self, schema):
+        """Test only the fields read are validated"""
+        record = LazyRecord({"id": "x", "platform": "facebook", "text": "hi"}, schema, index=4)
+        assert record.get("text") == "hi"
+        assert record.platform == "facebook"
+        with pytest.raises(ValidationException) as exc_info:
+            record["id"]
+        assert exc_info.value.details == {"index": 4, "field": "id", "message": "does not match " + r"\d+"}
+        with pytest.raises(KeyError):
+            record["author_id"]
+        assert record.to_dict()["id"] == "x"
+
+
+class TestRecordValidator:
+    @pytest.fixture
+    def changes(self, tmp_path):
+        return ExtractorChanges(tmp_path / "changes.json")
+
+    @pytest.fixture
+    def records(self):
+        return [{"id": str(i), "platform": "facebook"} for i in range(100)]
+
+    def test_full(self, schema, records):
+        """Test full mode validates every record"""
+        validator = RecordValidator(schema, mode=ValidationMode.FULL)
+        result = validator.validate(records + [{"id": "x", "platform": "facebook"}])
+        assert result.checked == 101
+        assert invalid_indices(result.errors) == [100]
+
+    def test_sample(self, schema, records):
+        """Test sample mode checks a share of the batch"""
+        validator = RecordValidator(schema, mode=ValidationMode.SAMPLE, sample_rate=0.1, rng=random.Random(1))
+        result = validator.validate(records)
+        assert result.records is records
+        assert result.errors == []
+        assert result.checked == 10
+
+    def test_sample_escalates(self, schema):
+        """Test an invalid sample triggers validation of the whole batch"""
+        records = [{"id": "x", "platform": "facebook"}] * 20
+        validator = RecordValidator(schema, mode=ValidationMode.SAMPLE, sample_rate=0.1)
+        result = validator.validate(records)
+        assert result.checked == 20
+        assert len(result.errors) == 20
+
+    def test_lazy(self, schema, records):
+        """Test lazy mode wraps records without validating them"""
+        validator = RecordValidator(schema, mode=ValidationMode.LAZY)
+        result = validator.validate([{"id": "x", "platform": "facebook"}])
+        assert result.checked == 0
+        assert isinstance(result.records[0], LazyRecord)
+        with pytest.raises(ValidationException):
+            result.records[0]["id"]
+
+    def test_strict_window_after_selector_change(self, schema, changes, monkeypatch):
+        """Test full validation for strict_window_ms after the selectors change"""
+        config = MagicMock()
+        config.get.side_effect = lambda path, default=None: {"validation.strict_window_ms": 60000}.get(path, default)
+        selectors = {"post": "[role='article']"}
+        validator = RecordValidator(schema, "facebook", ValidationMode.LAZY, extractor_config=selectors,
+                                    changes=changes, config=config)
+        assert validator.effective_mode is ValidationMode.FULL
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 120)
+        assert validator.effective_mode is ValidationMode.LAZY
+        # Same selectors later: no new window
+        validator = RecordValidator(schema, "facebook", ValidationMode.LAZY, extractor_config=selectors,
+                                    changes=changes, config=config)
+        assert validator.effective_mode is ValidationMode.LAZY
+        # Changed selectors: strict again
+        validator = RecordValidator(schema, "facebook", ValidationMode.LAZY, extractor_config={"post": "article"},
+                                    changes=changes, config=config)
+        assert validator.effective_mode is ValidationMode.FULL